@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from resume_matcher.core.config import settings
 from resume_matcher.core.database import Base
-from resume_matcher.models import Resume, Job  # Import all models
+from resume_matcher.models import Resume, Job, EmbeddingCache, ResumeChunk, JobChunk, EmbeddingMigration, MatchTopK  # Import all models
 
 # ----------------------------
 
@@ -38,6 +38,31 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Re-embedding shadow columns, chunk tables and their indexes are created
+# and renamed at runtime by services/reembed_service.py (their size is per
+# migration); keep autogenerate from proposing to drop them
+REEMBED_COLUMNS = {"embedding_next", "embedding_next_model", "embedding_next_at", "embedding_prev"}
+REEMBED_TABLES = {
+    f"{table}_{suffix}" for table in ("resume_chunks", "job_chunks") for suffix in ("next", "prev")
+}
+REEMBED_INDEXES = {
+    f"ix_{table}_embedding_{suffix}"
+    for table in ("resumes", "jobs", "resume_chunks", "job_chunks")
+    for suffix in ("next", "prev")
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and compare_to is None:
+        if type_ == "column" and name in REEMBED_COLUMNS:
+            return False
+        if type_ == "table" and name in REEMBED_TABLES:
+            return False
+        if type_ == "index" and name in REEMBED_INDEXES:
+            return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -60,6 +85,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -83,7 +109,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,60 @@
+"""Leave the ANN index search form to `make indexes`
+
+Revision ID: 3e8f5a1c7b20
+Revises: d6c0b84e27f1
+Create Date: 2026-10-18 18:05:37.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from resume_matcher.core.database import vector_index_options
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8f5a1c7b20'
+down_revision: Union[str, None] = 'd6c0b84e27f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ('ix_jobs_embedding', 'jobs'),
+    ('ix_resumes_embedding', 'resumes'),
+    ('ix_job_chunks_embedding', 'job_chunks'),
+    ('ix_resume_chunks_embedding', 'resume_chunks'),
+)
+
+
+def upgrade() -> None:
+    # The search form an index covers (VECTOR_QUANTIZATION,
+    # VECTOR_SEARCH_DIMENSIONS) is a runtime setting, so it is not built
+    # here: `make indexes` (index_service.rebuild_vector_indexes) rebuilds
+    # the indexes on the configured form and records it on each index.
+    pass
+
+
+def downgrade() -> None:
+    # Put back the full-vector indexes of d6c0b84e27f1 wherever the
+    # database has another form, whatever the current settings say
+    connection = op.get_bind()
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            indexdef = connection.execute(
+                sa.text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"),
+                {'name': name},
+            ).scalar()
+            if indexdef is not None and '(embedding vector_cosine_ops)' in indexdef:
+                continue
+
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name,
+                table,
+                ['embedding'],
+                unique=False,
+                postgresql_ops={'embedding': 'vector_cosine_ops'},
+                postgresql_concurrently=True,
+                **vector_index_options(),
+            )
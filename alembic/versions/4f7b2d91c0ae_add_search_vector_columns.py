@@ -0,0 +1,97 @@
+"""Add full-text search_vector columns for hybrid matching
+
+Revision ID: 4f7b2d91c0ae
+Revises: e52a9c07d1f3
+Create Date: 2026-10-18 14:05:31.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from resume_matcher.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f7b2d91c0ae'
+down_revision: Union[str, None] = 'e52a9c07d1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Plain nullable columns kept current by BEFORE INSERT/UPDATE triggers,
+# so adding them is a catalog-only change. Existing rows are backfilled
+# in short batches, each its own transaction, and the GIN indexes are
+# built concurrently; nothing holds a long lock on the tables.
+SEARCH_SOURCES = {
+    'jobs': ('title', 'description'),
+    'resumes': ('raw_text',),
+}
+
+BACKFILL_BATCH = 5000
+
+
+def _document(columns, row: str = '') -> str:
+    """tsvector source expression over ``columns`` (of ``row``, e.g. NEW)."""
+    prefix = f'{row}.' if row else ''
+    return " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in columns)
+
+
+def upgrade() -> None:
+    config = settings.text_search_config
+    for table, columns in SEARCH_SOURCES.items():
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+        # Covers rows written from here on, including during the backfill
+        op.execute(f"""
+            CREATE FUNCTION {table}_search_vector_update() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                NEW.search_vector := to_tsvector('{config}'::regconfig, {_document(columns, 'NEW')});
+                RETURN NEW;
+            END
+            $$
+        """)
+        op.execute(
+            f"CREATE TRIGGER {table}_search_vector_update "
+            f"BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()"
+        )
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        for table, columns in SEARCH_SOURCES.items():
+            low, high = connection.execute(sa.text(f"SELECT min(id), max(id) FROM {table}")).one()
+            if low is None:
+                continue
+            for start in range(low, high + 1, BACKFILL_BATCH):
+                connection.execute(
+                    sa.text(
+                        f"UPDATE {table} "
+                        f"SET search_vector = to_tsvector('{config}'::regconfig, {_document(columns)}) "
+                        f"WHERE id >= :start AND id < :end AND search_vector IS NULL"
+                    ),
+                    {"start": start, "end": start + BACKFILL_BATCH},
+                )
+
+        for table in SEARCH_SOURCES:
+            op.create_index(
+                f'ix_{table}_search_vector',
+                table,
+                ['search_vector'],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in SEARCH_SOURCES:
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True)
+
+    for table in SEARCH_SOURCES:
+        op.execute(f"DROP TRIGGER {table}_search_vector_update ON {table}")
+        op.execute(f"DROP FUNCTION {table}_search_vector_update()")
+        op.drop_column(table, 'search_vector')
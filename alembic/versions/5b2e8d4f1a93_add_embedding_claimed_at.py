@@ -0,0 +1,31 @@
+"""Add embedding_claimed_at leases for the embedding worker
+
+Revision ID: 5b2e8d4f1a93
+Revises: 3e8f5a1c7b20
+Create Date: 2026-10-18 20:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8d4f1a93'
+down_revision: Union[str, None] = '3e8f5a1c7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('jobs', 'resumes'):
+        op.add_column(
+            table,
+            sa.Column('embedding_claimed_at', sa.DateTime(timezone=True), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    for table in ('resumes', 'jobs'):
+        op.drop_column(table, 'embedding_claimed_at')
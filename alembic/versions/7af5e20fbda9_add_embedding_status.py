@@ -0,0 +1,41 @@
+"""Add embedding_status for background embedding
+
+Revision ID: 7af5e20fbda9
+Revises: 633e84068312
+Create Date: 2026-10-18 10:41:53.201774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7af5e20fbda9'
+down_revision: Union[str, None] = '633e84068312'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('jobs', 'resumes'):
+        op.add_column(
+            table,
+            sa.Column('embedding_status', sa.String(length=20), server_default='pending', nullable=False),
+        )
+        # Existing rows with a vector are done; the rest are queued for the worker
+        op.execute(f"UPDATE {table} SET embedding_status = 'ready' WHERE embedding IS NOT NULL")
+        op.create_index(
+            f'ix_{table}_embedding_pending',
+            table,
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text("embedding_status = 'pending'"),
+        )
+
+
+def downgrade() -> None:
+    for table in ('resumes', 'jobs'):
+        op.drop_index(f'ix_{table}_embedding_pending', table_name=table)
+        op.drop_column(table, 'embedding_status')
@@ -0,0 +1,38 @@
+"""Add B-tree indexes for match filters on jobs
+
+Revision ID: a18e6c3f92d4
+Revises: 4f7b2d91c0ae
+Create Date: 2026-10-18 15:22:09.517340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a18e6c3f92d4'
+down_revision: Union[str, None] = '4f7b2d91c0ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FILTER_COLUMNS = ['location', 'company', 'created_at']
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in FILTER_COLUMNS:
+            op.create_index(
+                f'ix_jobs_{column}',
+                'jobs',
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in FILTER_COLUMNS:
+            op.drop_index(f'ix_jobs_{column}', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""Add ANN indexes on embedding columns
+
+Revision ID: b95a7c5d19b8
+Revises: 91f0b5717422
+Create Date: 2026-10-18 09:12:44.118201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from resume_matcher.core.database import vector_index_options
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b95a7c5d19b8'
+down_revision: Union[str, None] = '91f0b5717422'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Index type and build parameters come from settings (VECTOR_INDEX_TYPE,
+    # HNSW_M, HNSW_EF_CONSTRUCTION, IVFFLAT_LISTS). Built concurrently so
+    # large tables stay writable while the index is created.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_embedding',
+            'jobs',
+            ['embedding'],
+            unique=False,
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_concurrently=True,
+            **vector_index_options(),
+        )
+        op.create_index(
+            'ix_resumes_embedding',
+            'resumes',
+            ['embedding'],
+            unique=False,
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_concurrently=True,
+            **vector_index_options(),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_resumes_embedding', table_name='resumes', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_embedding', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""Create resume_chunks and job_chunks tables
+
+Revision ID: c3d81f2a6b47
+Revises: 7af5e20fbda9
+Create Date: 2026-10-18 11:26:05.613290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import pgvector
+
+from resume_matcher.core.config import settings
+from resume_matcher.core.database import vector_index_options
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d81f2a6b47'
+down_revision: Union[str, None] = '7af5e20fbda9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table, parent in (('resume_chunks', 'resumes'), ('job_chunks', 'jobs')):
+        parent_id = f'{parent[:-1]}_id'
+        op.create_table(table,
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column(parent_id, sa.Integer(), nullable=False),
+        sa.Column('chunk_index', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(dim=settings.embedding_dimensions), nullable=False),
+        sa.ForeignKeyConstraint([parent_id], [f'{parent}.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(f'ix_{table}_{parent_id}', table, [parent_id], unique=False)
+        # New, empty tables: no need to build the ANN index concurrently
+        op.create_index(
+            f'ix_{table}_embedding',
+            table,
+            ['embedding'],
+            unique=False,
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            **vector_index_options(),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('job_chunks')
+    op.drop_table('resume_chunks')
@@ -0,0 +1,149 @@
+"""
+Synthetic resumes and job descriptions for benchmarks.
+
+Documents are generated from a seed, so the same scale always produces the
+same corpus. Each document belongs to a role family whose skills dominate
+its text, which gives the fake embeddings (see fake_openai) a realistic
+spread of match scores. Resumes can also be rendered as PDFs for the
+upload path.
+"""
+import random
+from typing import Dict, Iterator, List
+
+ROLES: Dict[str, List[str]] = {
+    "Backend Engineer": [
+        "python", "django", "fastapi", "postgresql", "redis", "kafka", "docker",
+        "kubernetes", "rest", "grpc", "microservices", "sql", "celery", "aws",
+    ],
+    "Frontend Engineer": [
+        "javascript", "typescript", "react", "vue", "css", "html", "webpack",
+        "accessibility", "redux", "graphql", "jest", "figma", "nextjs",
+    ],
+    "Data Scientist": [
+        "python", "pandas", "numpy", "scikit-learn", "statistics", "pytorch",
+        "experimentation", "sql", "tableau", "forecasting", "nlp", "regression",
+    ],
+    "DevOps Engineer": [
+        "terraform", "kubernetes", "ansible", "aws", "gcp", "prometheus", "grafana",
+        "linux", "ci", "cd", "helm", "bash", "networking", "observability",
+    ],
+    "Product Manager": [
+        "roadmap", "stakeholders", "discovery", "metrics", "agile", "scrum",
+        "prioritization", "user research", "launch", "strategy", "okrs",
+    ],
+    "Mobile Engineer": [
+        "swift", "kotlin", "ios", "android", "flutter", "react native", "xcode",
+        "gradle", "push notifications", "offline sync", "app store",
+    ],
+    "Security Engineer": [
+        "threat modeling", "penetration testing", "siem", "iam", "oauth",
+        "cryptography", "incident response", "soc2", "vulnerability management",
+    ],
+    "Data Engineer": [
+        "spark", "airflow", "dbt", "snowflake", "bigquery", "kafka", "etl",
+        "python", "scala", "data modeling", "parquet", "streaming",
+    ],
+}
+
+_FIRST = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Riley", "Casey", "Jamie",
+          "Avery", "Quinn", "Rowan", "Skyler", "Devon", "Harper", "Emerson"]
+_LAST = ["Smith", "Garcia", "Chen", "Okafor", "Novak", "Silva", "Kim", "Patel",
+         "Haddad", "Larsen", "Moreau", "Tanaka", "Nowak", "Reyes", "Ivanova"]
+_COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay",
+              "Stark Industries", "Wayne Enterprises", "Cyberdyne", "Soylent"]
+_LOCATIONS = ["Berlin", "London", "New York", "Remote", "Toronto", "Singapore",
+              "Austin", "Amsterdam", "Lisbon", "Sydney"]
+_FILLER = [
+    "delivered", "improved", "designed", "owned", "collaborated with", "mentored",
+    "reduced latency of", "scaled", "migrated", "automated", "led", "built",
+]
+_LEVELS = ["Junior", "Mid-level", "Senior", "Staff", "Lead"]
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+
+def parse_scale(value: str) -> int:
+    """'1k', '10k', '100k' or a plain number of documents per table."""
+    return SCALES.get(value) or int(value)
+
+
+def _sentences(rng: random.Random, skills: List[str], count: int) -> List[str]:
+    sentences = []
+    for _ in range(count):
+        picked = rng.sample(skills, k=min(3, len(skills)))
+        sentences.append(
+            f"{rng.choice(_FILLER).capitalize()} systems using {picked[0]}, "
+            f"{picked[1]} and {picked[2]} at {rng.choice(_COMPANIES)}."
+        )
+    return sentences
+
+
+def make_resume(index: int, seed: int = 0) -> dict:
+    """ResumeCreate fields for the ``index``-th synthetic resume."""
+    rng = random.Random(f"resume-{seed}-{index}")
+    role = rng.choice(list(ROLES))
+    skills = ROLES[role]
+    name = f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"
+
+    lines = [
+        name,
+        f"{rng.choice(_LEVELS)} {role} - {rng.choice(_LOCATIONS)}",
+        "",
+        "Skills: " + ", ".join(rng.sample(skills, k=min(8, len(skills)))),
+        "",
+        "Experience",
+        *_sentences(rng, skills, rng.randint(8, 20)),
+        "",
+        "Education",
+        f"BSc Computer Science, class of {rng.randint(1995, 2022)}",
+    ]
+    return {
+        "name": name,
+        "email": f"candidate{index}@example.com",
+        "filename": f"resume_{index}.pdf",
+        "raw_text": "\n".join(lines),
+    }
+
+
+def make_job(index: int, seed: int = 0) -> dict:
+    """JobCreate fields for the ``index``-th synthetic job posting."""
+    rng = random.Random(f"job-{seed}-{index}")
+    role = rng.choice(list(ROLES))
+    skills = ROLES[role]
+    company = rng.choice(_COMPANIES)
+
+    description = "\n".join([
+        f"{company} is hiring a {role} to join a growing team.",
+        "Requirements: " + ", ".join(rng.sample(skills, k=min(6, len(skills)))) + ".",
+        *_sentences(rng, skills, rng.randint(4, 10)),
+        f"Benefits include {rng.choice(['equity', 'a learning budget', 'flexible hours'])}.",
+    ])
+    return {
+        "title": f"{rng.choice(_LEVELS)} {role}",
+        "company": company,
+        "location": rng.choice(_LOCATIONS),
+        "description": description,
+    }
+
+
+def iter_resumes(count: int, start: int = 0, seed: int = 0) -> Iterator[dict]:
+    for index in range(start, start + count):
+        yield make_resume(index, seed)
+
+
+def iter_jobs(count: int, start: int = 0, seed: int = 0) -> Iterator[dict]:
+    for index in range(start, start + count):
+        yield make_job(index, seed)
+
+
+def resume_pdf(raw_text: str) -> bytes:
+    """Render resume text as a one-page PDF (PyMuPDF)."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    try:
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 560, 800), raw_text, fontsize=8)
+        return doc.tobytes()
+    finally:
+        doc.close()
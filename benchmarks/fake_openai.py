@@ -0,0 +1,175 @@
+"""
+Local stand-in for the OpenAI embeddings endpoint.
+
+Serves ``POST /v1/embeddings`` with deterministic vectors, after a
+configurable delay, so the pipeline can be benchmarked without network
+variance, rate limits or cost. Point the app at it with
+``OPENAI_BASE_URL=http://127.0.0.1:<port>/v1``.
+
+Vectors are a hashed bag of words: every word maps to a fixed random
+vector and a text embeds to the normalised sum of its words. The same text
+always gets the same vector, and texts sharing vocabulary (a resume and a
+job for the same role) score higher than unrelated ones, so ranking and
+score thresholds behave roughly as they do on real embeddings.
+
+    python -m benchmarks.fake_openai --port 8089 --latency-ms 80
+"""
+import argparse
+import base64
+import hashlib
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+_WORDS = re.compile(r"[a-z0-9+#]+")
+
+
+@lru_cache(maxsize=65536)
+def _word_vector(word: str, dimensions: int) -> np.ndarray:
+    seed = int.from_bytes(hashlib.sha256(word.encode()).digest()[:8], "little")
+    return np.random.default_rng(seed).standard_normal(dimensions).astype(np.float32)
+
+
+def fake_embedding(text: str, dimensions: int) -> np.ndarray:
+    """Deterministic unit vector for a text (normalised sum of word vectors)."""
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for word in _WORDS.findall(text.lower()):
+        vector += _word_vector(word, dimensions)
+    if not vector.any():
+        vector = _word_vector(text, dimensions).copy()
+    return vector / np.linalg.norm(vector)
+
+
+class FakeOpenAIServer:
+    """
+    Threaded HTTP server answering embeddings requests.
+
+    Each request sleeps ``latency_ms + latency_per_item_ms * len(input)``
+    before answering, to model the API's fixed and per-input cost. Request
+    and input counts are kept for reporting.
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            dimensions: int = 1536,
+            latency_ms: float = 0.0,
+            latency_per_item_ms: float = 0.0,
+    ):
+        self.dimensions = dimensions
+        self.latency_ms = latency_ms
+        self.latency_per_item_ms = latency_per_item_ms
+        self.requests = 0
+        self.inputs = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/embeddings"):
+                    self._reply(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                status, body = server.handle(json.loads(self.rfile.read(length) or b"{}"))
+                self._reply(status, body)
+
+            def _reply(self, status: int, body: dict):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def handle(self, request: dict) -> Tuple[int, dict]:
+        """Build the response for one embeddings request body."""
+        texts = request.get("input")
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts or not all(isinstance(text, str) for text in texts):
+            return 400, {"error": {"message": "input must be a string or list of strings"}}
+
+        dimensions = request.get("dimensions") or self.dimensions
+        with self._lock:
+            self.requests += 1
+            self.inputs += len(texts)
+
+        delay = self.latency_ms + self.latency_per_item_ms * len(texts)
+        if delay:
+            time.sleep(delay / 1000)
+
+        data = []
+        for index, text in enumerate(texts):
+            vector = fake_embedding(text, dimensions)
+            if request.get("encoding_format") == "base64":
+                embedding = base64.b64encode(vector.astype("<f4").tobytes()).decode()
+            else:
+                embedding = vector.tolist()
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+
+        tokens = sum(len(text) // 4 + 1 for text in texts)
+        return 200, {
+            "object": "list",
+            "data": data,
+            "model": request.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        }
+
+    def start(self) -> "FakeOpenAIServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": self.requests, "inputs": self.inputs}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Fake OpenAI embeddings server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-per-item-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = FakeOpenAIServer(
+        args.host, args.port, args.dimensions, args.latency_ms, args.latency_per_item_ms
+    )
+    print(f"Fake OpenAI embeddings at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Import-time benchmark: how long a fresh interpreter takes to import the app.
+
+Each run is a new process (``python -X importtime``), so nothing is cached
+in sys.modules. Exits non-zero when the median exceeds the budget, so it
+can gate CI for autoscaled pods where cold start matters.
+
+    python -m benchmarks.import_time --budget-ms 1500 --json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from .results import ROOT, build_result, latency_stats, write_result
+
+# Resources that must not load at import (see the lazy initialisers)
+DEFERRED_MODULES = ("openai", "httpx", "fitz", "psycopg2", "sentence_transformers")
+
+
+def measure(module: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns:
+        (total import time in ms, cumulative microseconds per top-level
+        module, deferred modules that were imported anyway)
+    """
+    script = (
+        "import sys, time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print((time.perf_counter() - start) * 1000); "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative_us.isdigit():
+            top = name.split(".")[0]
+            cumulative[top] = max(cumulative.get(top, 0), int(cumulative_us))
+
+    total_ms, loaded = result.stdout.splitlines()[-2:]
+    return float(total_ms), cumulative, [name for name in loaded.split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="src.resume_matcher.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", help="Also write the result to this file")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    times = [total for total, _, _ in runs]
+    median = statistics.median(times)
+    slowest = sorted(runs[-1][1].items(), key=lambda item: -item[1])[: args.top]
+    loaded = sorted({name for _, _, names in runs for name in names})
+
+    passed = median <= args.budget_ms and not loaded
+    result = build_result(
+        "import_time",
+        params={"module": args.module, "runs": args.runs, "budget_ms": args.budget_ms},
+        metrics={
+            "import": latency_stats([total / 1000 for total in times]),
+            "slowest_imports_ms": {name: round(us / 1000, 1) for name, us in slowest},
+        },
+        environment={"deferred_modules_loaded": loaded, "passed": passed},
+    )
+    if args.output:
+        write_result(result, args.output)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"import {args.module}: median {median:.1f} ms, max {max(times):.1f} ms "
+              f"(budget {args.budget_ms:.0f} ms)")
+        for name, ms in result["metrics"]["slowest_imports_ms"].items():
+            print(f"  {name:<30} {ms:>8.1f} ms")
+        if loaded:
+            print(f"  imported eagerly: {', '.join(loaded)}")
+
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+End-to-end pipeline benchmark.
+
+Runs the app in-process against a local fake OpenAI embeddings server
+(see fake_openai) and a synthetic corpus (see corpus), and measures:
+
+- seeding throughput: bulk resume inserts and batched job inserts
+- upload throughput and latency: PDF resumes through POST /resumes/upload
+  and jobs through POST /jobs, from concurrent clients
+- matching latency: find_matching_jobs / find_matching_resumes percentiles
+- listing latency: cursor-paginated and deep-offset GET /resumes and /jobs
+
+The database is DATABASE_URL (a migrated pgvector database, for
+production-like numbers) or, by default, a fresh SQLite file matched
+with the in-memory vector index (MATCH_BACKEND=numpy). Results are
+written as JSON (see results) and can be checked against a baseline run:
+
+    python -m benchmarks.pipeline --scale 10k --latency-ms 80
+    python -m benchmarks.pipeline --scale 10k --baseline benchmarks/results/pipeline-....json
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, Tuple
+
+from .corpus import iter_jobs, iter_resumes, parse_scale, resume_pdf
+from .fake_openai import FakeOpenAIServer
+from .results import (
+    build_result,
+    compare,
+    latency_stats,
+    throughput_stats,
+    write_result,
+)
+
+_SEED_BATCH = 1000
+
+
+def _timed(function: Callable, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def _run_concurrently(
+        function: Callable,
+        items: Sequence,
+        concurrency: int,
+) -> Tuple[dict, dict]:
+    """Call ``function`` on every item from a thread pool; (throughput, latency) stats."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(lambda item: _timed(function, item), items))
+    return throughput_stats(len(items), time.perf_counter() - start), latency_stats(latencies)
+
+
+def _prepare_database(reset: bool) -> None:
+    from sqlalchemy import inspect
+
+    from src.resume_matcher.core.database import Base, get_engine
+
+    engine = get_engine()
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+    elif not inspect(engine).has_table("resumes"):
+        sys.exit("Database has no schema; run `alembic upgrade head` first")
+
+    if reset:
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+
+
+def _seed(scale: int, seed: int) -> dict:
+    """Insert ``scale`` resumes and jobs through the bulk embedding paths."""
+    from src.resume_matcher.core.database import SessionLocal
+    from src.resume_matcher.models.job import Job
+    from src.resume_matcher.models.status import EMBEDDING_READY
+    from src.resume_matcher.schemas.resume import ResumeCreate
+    from src.resume_matcher.services import bulk_create_resumes, get_embeddings_batch
+    from src.resume_matcher.services.job_service import job_embedding_text
+    from src.resume_matcher.services.match_cache import invalidate_matches
+    from src.resume_matcher.services.vector_index import invalidate_index
+
+    metrics = {}
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        resumes = list(iter_resumes(scale, seed=seed))
+        for offset in range(0, scale, _SEED_BATCH):
+            batch = resumes[offset:offset + _SEED_BATCH]
+            bulk_create_resumes(db, [ResumeCreate(**resume) for resume in batch])
+        metrics["seed_resumes"] = throughput_stats(scale, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        jobs = list(iter_jobs(scale, seed=seed))
+        for offset in range(0, scale, _SEED_BATCH):
+            rows = [Job(**job) for job in jobs[offset:offset + _SEED_BATCH]]
+            embeddings = get_embeddings_batch([job_embedding_text(row) for row in rows], db=db)
+            for row, embedding in zip(rows, embeddings):
+                row.embedding = embedding
+                row.embedding_status = EMBEDDING_READY
+            db.add_all(rows)
+            db.commit()
+        invalidate_index("jobs")
+        invalidate_matches()
+        metrics["seed_jobs"] = throughput_stats(scale, time.perf_counter() - start)
+
+    return metrics
+
+
+def _measure_uploads(client, scale: int, uploads: int, concurrency: int, seed: int) -> dict:
+    # New documents (indexes past the seeded ones) so no embedding is cached
+    resumes = list(iter_resumes(uploads, start=scale, seed=seed))
+    pdfs = [(resume, resume_pdf(resume["raw_text"])) for resume in resumes]
+
+    def upload(item):
+        resume, pdf = item
+        response = client.post(
+            "/api/v1/resumes/upload",
+            files={"file": (resume["filename"], pdf, "application/pdf")},
+            data={"name": resume["name"], "email": resume["email"]},
+        )
+        response.raise_for_status()
+
+    def create_job(job):
+        client.post("/api/v1/jobs/", json=job).raise_for_status()
+
+    metrics = {}
+    throughput, latency = _run_concurrently(upload, pdfs, concurrency)
+    metrics["upload_resumes"] = {**throughput, **latency}
+
+    jobs = list(iter_jobs(uploads, start=scale, seed=seed))
+    throughput, latency = _run_concurrently(create_job, jobs, concurrency)
+    metrics["create_jobs"] = {**throughput, **latency}
+    return metrics
+
+
+def _measure_matching(queries: int, top_k: int, seed: int) -> dict:
+    from src.resume_matcher.core.database import SessionLocal
+    from src.resume_matcher.models.job import Job
+    from src.resume_matcher.models.resume import Resume
+    from src.resume_matcher.services import find_matching_jobs, find_matching_resumes
+    from src.resume_matcher.services.match_cache import invalidate_matches
+
+    rng = random.Random(seed)
+    metrics = {}
+    with SessionLocal() as db:
+        for name, model, search in (
+                ("match_jobs", Resume, find_matching_jobs),
+                ("match_resumes", Job, find_matching_resumes),
+        ):
+            ids = [row.id for row in db.query(model.id)]
+            sample = rng.sample(ids, min(queries + 1, len(ids)))
+            invalidate_matches()
+
+            # The first query pays for any index build; report it separately
+            metrics[f"{name}_first"] = latency_stats([_timed(search, db, sample[0], top_k)])
+            metrics[name] = latency_stats([
+                _timed(search, db, source_id, top_k) for source_id in sample[1:]
+            ])
+    return metrics
+
+
+def _measure_listing(client, pages: int, page_size: int, total: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    metrics = {}
+    for kind in ("resumes", "jobs"):
+        latencies: List[float] = []
+        cursor = None
+        for _ in range(pages):
+            params = {"limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
+            start = time.perf_counter()
+            response = client.get(f"/api/v1/{kind}/", params=params)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        metrics[f"list_{kind}_cursor"] = latency_stats(latencies)
+
+        latencies = []
+        for _ in range(pages):
+            skip = rng.randrange(max(total - page_size, 1))
+            start = time.perf_counter()
+            client.get(f"/api/v1/{kind}/", params={"limit": page_size, "skip": skip}).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        metrics[f"list_{kind}_offset"] = latency_stats(latencies)
+    return metrics
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Resume matcher pipeline benchmark")
+    parser.add_argument("--scale", default="1k", help="Documents per table: 1k, 10k, 100k or a number")
+    parser.add_argument("--uploads", type=int, default=200, help="Resumes and jobs created through the API")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent API clients")
+    parser.add_argument("--queries", type=int, default=200, help="Match queries per direction")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--list-pages", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake API latency per request")
+    parser.add_argument("--latency-per-item-ms", type=float, default=0.0, help="Fake API latency per input")
+    parser.add_argument("--database-url", help="Database to benchmark (default: DATABASE_URL or a new SQLite file)")
+    parser.add_argument("--reset", action="store_true", help="Delete all rows before seeding")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/pipeline-<time>.json)")
+    parser.add_argument("--baseline", help="Earlier result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+    scale = parse_scale(args.scale)
+
+    # Settings are read at import, so configure the environment first
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    elif not os.environ.get("DATABASE_URL"):
+        path = os.path.join(tempfile.mkdtemp(prefix="resume-matcher-bench-"), "bench.db")
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    if os.environ["DATABASE_URL"].startswith("sqlite"):
+        # pgvector SQL is PostgreSQL-only; match on the in-memory index
+        os.environ.setdefault("MATCH_BACKEND", "numpy")
+    os.environ["OPENAI_API_KEY"] = "benchmark"
+
+    from src.resume_matcher.core.config import settings
+
+    server = FakeOpenAIServer(
+        dimensions=settings.embedding_dimensions,
+        latency_ms=args.latency_ms,
+        latency_per_item_ms=args.latency_per_item_ms,
+    ).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+
+    from fastapi.testclient import TestClient
+
+    from src.resume_matcher.core.database import get_engine
+    from src.resume_matcher.main import app
+
+    _prepare_database(args.reset)
+
+    metrics = {}
+    print(f"Seeding {scale} resumes and {scale} jobs...", file=sys.stderr)
+    metrics.update(_seed(scale, args.seed))
+
+    with TestClient(app) as client:
+        print(f"Uploading {args.uploads} resumes and jobs...", file=sys.stderr)
+        metrics.update(_measure_uploads(client, scale, args.uploads, args.concurrency, args.seed))
+        print("Matching...", file=sys.stderr)
+        metrics.update(_measure_matching(args.queries, args.top_k, args.seed))
+        print("Listing...", file=sys.stderr)
+        metrics.update(_measure_listing(
+            client, args.list_pages, args.page_size, scale + args.uploads, args.seed
+        ))
+    metrics["embedding_api"] = server.stats()
+    server.stop()
+
+    result = build_result(
+        "pipeline",
+        params={**vars(args), "scale": scale},
+        metrics=metrics,
+        environment={
+            "database": get_engine().dialect.name,
+            "embedding_model": settings.embedding_model,
+            "embedding_dimensions": settings.embedding_dimensions,
+            "match_backend": settings.match_backend,
+            "vector_index_type": settings.vector_index_type,
+            "vector_quantization": settings.vector_quantization,
+            "async_mode": settings.async_mode,
+            "embedding_microbatch_enabled": settings.embedding_microbatch_enabled,
+        },
+    )
+    path = write_result(result, args.output)
+
+    for name, stats in metrics.items():
+        summary = ", ".join(f"{stat} {value}" for stat, value in stats.items())
+        print(f"{name:<24} {summary}")
+    print(f"Results written to {path}")
+
+    if args.baseline:
+        import json
+
+        with open(args.baseline) as f:
+            lines, regressions = compare(result, json.load(f), args.tolerance)
+        print("\n".join(lines))
+        if regressions:
+            sys.exit(f"Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
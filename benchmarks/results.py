@@ -0,0 +1,127 @@
+"""
+Machine-readable benchmark results and regression comparison.
+
+Results are JSON documents::
+
+    {"benchmark": ..., "timestamp": ..., "git_commit": ..., "environment": {...},
+     "params": {...}, "metrics": {"<name>": {"<stat>": value, ...}, ...}}
+
+Latency stats are in milliseconds (lower is better); throughput stats end
+in ``_per_second`` (higher is better). ``compare`` checks a run against a
+baseline with the same metric names.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stats compared against a baseline, and whether higher is better
+COMPARED_STATS = {
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "per_second": True,
+}
+
+
+def latency_stats(samples_seconds: Sequence[float]) -> Dict[str, float]:
+    """Percentiles (ms) of per-operation latencies."""
+    samples = np.asarray(samples_seconds, dtype=np.float64) * 1000
+    if not len(samples):
+        return {"count": 0}
+    p50, p90, p95, p99 = np.percentile(samples, [50, 90, 95, 99])
+    return {
+        "count": int(len(samples)),
+        "mean_ms": round(float(samples.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p90_ms": round(float(p90), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(samples.max()), 3),
+    }
+
+
+def throughput_stats(count: int, seconds: float) -> Dict[str, float]:
+    """Items per second over a timed run."""
+    return {
+        "count": count,
+        "seconds": round(seconds, 3),
+        "per_second": round(count / seconds, 2) if seconds else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_result(benchmark: str, params: dict, metrics: dict, environment: dict) -> dict:
+    return {
+        "benchmark": benchmark,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git_commit": _git_commit(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            **environment,
+        },
+        "params": params,
+        "metrics": metrics,
+    }
+
+
+def write_result(result: dict, path: Optional[str] = None) -> str:
+    """Write a result to ``path`` (default benchmarks/results/<name>-<time>.json)."""
+    if path is None:
+        stamp = result["timestamp"].replace(":", "").replace("-", "")
+        path = os.path.join(ROOT, "benchmarks", "results", f"{result['benchmark']}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+    return path
+
+
+def compare(
+        result: dict,
+        baseline: dict,
+        tolerance: float = 0.2,
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare a result's metrics against a baseline.
+
+    Args:
+        result: Current run
+        baseline: Earlier run of the same benchmark
+        tolerance: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        (report lines, regressed "metric.stat" names)
+    """
+    lines, regressions = [], []
+    for name, stats in result["metrics"].items():
+        base_stats = baseline.get("metrics", {}).get(name, {})
+        for stat, higher_is_better in COMPARED_STATS.items():
+            if stat not in stats or not base_stats.get(stat):
+                continue
+            ratio = stats[stat] / base_stats[stat]
+            worse = ratio < 1 - tolerance if higher_is_better else ratio > 1 + tolerance
+            lines.append(
+                f"{name + '.' + stat:<40} {base_stats[stat]:>12.3f} -> {stats[stat]:>12.3f}"
+                f"  ({ratio:.2f}x){'  REGRESSION' if worse else ''}"
+            )
+            if worse:
+                regressions.append(f"{name}.{stat}")
+    return lines, regressions
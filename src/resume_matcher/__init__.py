@@ -50,53 +50,47 @@
 # ]
 
 
-from .services.pdf_service import extract_text_from_pdf, PDFExtractionError
-from .services.embedding_service import get_embedding, get_embeddings_batch, EmbeddingError
-from .services.resume_service import (  # <--- Changed to .services.resume_service
-    create_resume,
-    get_resume,
-    get_resume_or_404,
-    get_resumes,
-    delete_resume,
-    regenerate_embedding,
-    ResumeNotFoundError,
-)
-from .services.job_service import (     # <--- Changed to .services.job_service
-    create_job,
-    get_job,
-    get_job_or_404,
-    get_jobs,
-    update_job,
-    delete_job,
-    JobNotFoundError,
-)
-from .services.match_service import (   # <--- Changed to .services.match_service
-    find_matching_jobs,
-    find_matching_resumes,
-    MatchError,
-)
+from importlib import import_module
 
-__all__ = [
-    "extract_text_from_pdf",
-    "PDFExtractionError",
-    "get_embedding",
-    "get_embeddings_batch",
-    "EmbeddingError",
-    "create_resume",
-    "get_resume",
-    "get_resume_or_404",
-    "get_resumes",
-    "delete_resume",
-    "regenerate_embedding",
-    "ResumeNotFoundError",
-    "create_job",
-    "get_job",
-    "get_job_or_404",
-    "get_jobs",
-    "update_job",
-    "delete_job",
-    "JobNotFoundError",
-    "find_matching_jobs",
-    "find_matching_resumes",
-    "MatchError",
-]
\ No newline at end of file
+# Public names -> defining module. Resolved on first attribute access, so
+# ``import resume_matcher`` (and anything importing a submodule, like the
+# worker or the CLIs) doesn't load every service and its dependencies.
+_EXPORTS = {
+    "extract_text_from_pdf": ".services.pdf_service",
+    "PDFExtractionError": ".services.pdf_service",
+    "get_embedding": ".services.embedding_service",
+    "get_embeddings_batch": ".services.embedding_service",
+    "EmbeddingError": ".services.embedding_service",
+    "create_resume": ".services.resume_service",
+    "get_resume": ".services.resume_service",
+    "get_resume_or_404": ".services.resume_service",
+    "get_resumes": ".services.resume_service",
+    "delete_resume": ".services.resume_service",
+    "regenerate_embedding": ".services.resume_service",
+    "ResumeNotFoundError": ".services.resume_service",
+    "create_job": ".services.job_service",
+    "get_job": ".services.job_service",
+    "get_job_or_404": ".services.job_service",
+    "get_jobs": ".services.job_service",
+    "update_job": ".services.job_service",
+    "delete_job": ".services.job_service",
+    "JobNotFoundError": ".services.job_service",
+    "find_matching_jobs": ".services.match_service",
+    "find_matching_resumes": ".services.match_service",
+    "find_matches_batch": ".services.match_service",
+    "MatchError": ".services.match_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
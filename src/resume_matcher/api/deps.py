@@ -1,7 +1,12 @@
-from typing import Generator
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Union
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ..core.database import SessionLocal
+from ..core.config import settings
+from ..core.database import SessionLocal, get_async_sessionmaker
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -10,4 +15,24 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_request_db() -> AsyncGenerator[Union[Session, "AsyncSession"], None]:
+    """
+    Dependency that provides the request's only database session: an
+    AsyncSession in async mode, else a Session.
+
+    Routes with an async code path use this instead of get_db, so a
+    request never opens both kinds of session.
+    """
+    if settings.async_mode:
+        async with get_async_sessionmaker()() as db:
+            yield db
+        return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
@@ -0,0 +1,73 @@
+import logging
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from ...api.deps import get_db
+from ...schemas.embedding import (
+    EmbeddingCacheStats,
+    EmbeddingMigrationCreate,
+    EmbeddingMigrationStatus,
+)
+from ...services.embedding_cache import get_cache_stats
+from ...services.reembed_service import (
+    start_migration,
+    get_migration,
+    migration_progress,
+    ReembedError,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/embeddings", tags=["embeddings"])
+
+
+@router.get("/cache/stats", response_model=EmbeddingCacheStats)
+def embedding_cache_stats():
+    """
+    Get embedding cache hit/miss counters for this process.
+
+    Every hit is an embedding API call (and its latency and cost) avoided.
+    """
+    return EmbeddingCacheStats(**get_cache_stats())
+
+
+def _migration_status(migration) -> EmbeddingMigrationStatus:
+    return EmbeddingMigrationStatus(
+        id=migration.id,
+        target_model=migration.target_model,
+        target_dimensions=migration.target_dimensions,
+        status=migration.status,
+        error=migration.error,
+        total_rows=migration.total_rows,
+        processed_rows=migration.processed_rows,
+        created_at=migration.created_at,
+        completed_at=migration.completed_at,
+        **migration_progress(migration),
+    )
+
+
+@router.post("/migrations", response_model=EmbeddingMigrationStatus, status_code=201)
+def create_embedding_migration(
+        migration_data: EmbeddingMigrationCreate,
+        db: Session = Depends(get_db),
+):
+    """
+    Start re-embedding all resumes and jobs with a new model.
+
+    Adds the shadow columns; the backfill itself runs in
+    ``python -m src.resume_matcher.reembed run``.
+    """
+    try:
+        migration = start_migration(db, migration_data.model, migration_data.dimensions)
+    except ReembedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _migration_status(migration)
+
+
+@router.get("/migrations/{migration_id}", response_model=EmbeddingMigrationStatus)
+def get_embedding_migration(migration_id: int, db: Session = Depends(get_db)):
+    """Get the progress of a re-embedding migration."""
+    migration = get_migration(db, migration_id)
+    if not migration:
+        raise HTTPException(status_code=404, detail="Migration not found")
+    return _migration_status(migration)
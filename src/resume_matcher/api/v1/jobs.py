@@ -1,9 +1,11 @@
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ...api.deps import get_db
+from ...api.deps import get_db, get_request_db
+from ...core.config import settings
 from ...schemas.job import (
     JobCreate,
     JobUpdate,
@@ -12,10 +14,14 @@ from ...schemas.job import (
 )
 from ...services import (
     create_job,
-    get_job,
-    get_jobs,
+    get_job_with_description,
+    get_job_summaries,
     update_job,
     delete_job,
+    acreate_job,
+    aget_job_with_description,
+    aget_job_summaries,
+    adelete_job,
     JobNotFoundError,
 )
 
@@ -25,16 +31,19 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
 @router.post("/", response_model=JobResponse, status_code=201)
-def create_new_job(
+async def create_new_job(
         job_data: JobCreate,
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """
     Create a new job posting.
 
     The job description will be automatically embedded for similarity matching.
     """
-    job = create_job(db, job_data)
+    if settings.async_mode:
+        job = await acreate_job(db, job_data)
+    else:
+        job = await run_in_threadpool(create_job, db, job_data)
     return JobResponse(
         id=job.id,
         title=job.title,
@@ -42,39 +51,49 @@ def create_new_job(
         location=job.location,
         description=job.description,
         created_at=job.created_at,
-        has_embedding=job.embedding is not None,
+        has_embedding=job.has_embedding,
+        embedding_status=job.embedding_status,
     )
 
 
 @router.get("/", response_model=List[JobResponse])
-def list_jobs(
-        skip: int = 0,
-        limit: int = 100,
-        db: Session = Depends(get_db),
+async def list_jobs(
+        response: Response,
+        cursor: Optional[int] = Query(default=None, ge=0),
+        skip: int = Query(default=0, ge=0),
+        limit: int = Query(default=100, ge=1, le=1000),
+        db=Depends(get_request_db),
 ):
-    """Get all jobs with pagination."""
-    jobs = get_jobs(db, skip=skip, limit=limit)
-    return [
-        JobResponse(
-            id=j.id,
-            title=j.title,
-            company=j.company,
-            location=j.location,
-            description=j.description,
-            created_at=j.created_at,
-            has_embedding=j.embedding is not None,
+    """
+    List jobs in ID order.
+
+    - **cursor**: Return jobs after this ID; pass the previous page's
+      `X-Next-Cursor` header to page through without an offset scan
+    - **skip**: Offset paging, ignored when a cursor is given
+    - **limit**: Page size (1-1000)
+    """
+    if settings.async_mode:
+        jobs = await aget_job_summaries(db, limit=limit, after_id=cursor, skip=skip)
+    else:
+        jobs = await run_in_threadpool(
+            get_job_summaries, db, limit=limit, after_id=cursor, skip=skip
         )
-        for j in jobs
-    ]
+
+    if len(jobs) == limit:
+        response.headers["X-Next-Cursor"] = str(jobs[-1].id)
+    return [JobResponse.model_validate(j) for j in jobs]
 
 
 @router.get("/{job_id}", response_model=JobDetail)
-def get_job_detail(
+async def get_job_detail(
         job_id: int,
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """Get detailed information about a specific job."""
-    job = get_job(db, job_id)
+    if settings.async_mode:
+        job = await aget_job_with_description(db, job_id)
+    else:
+        job = await run_in_threadpool(get_job_with_description, db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -85,7 +104,8 @@ def get_job_detail(
         location=job.location,
         description=job.description,
         created_at=job.created_at,
-        has_embedding=job.embedding is not None,
+        has_embedding=job.has_embedding,
+        embedding_status=job.embedding_status,
         description_preview=job.description[:500] + "..." if len(job.description) > 500 else job.description,
     )
 
@@ -106,18 +126,23 @@ def update_existing_job(
             location=job.location,
             description=job.description,
             created_at=job.created_at,
-            has_embedding=job.embedding is not None,
+            has_embedding=job.has_embedding,
+            embedding_status=job.embedding_status,
         )
     except JobNotFoundError:
         raise HTTPException(status_code=404, detail="Job not found")
 
 
 @router.delete("/{job_id}", status_code=204)
-def remove_job(
+async def remove_job(
         job_id: int,
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """Delete a job posting."""
-    if not delete_job(db, job_id):
+    if settings.async_mode:
+        deleted = await adelete_job(db, job_id)
+    else:
+        deleted = await run_in_threadpool(delete_job, db, job_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="Job not found")
     return None
\ No newline at end of file
@@ -1,16 +1,30 @@
 import logging
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ...api.deps import get_db
-from ...schemas.match import MatchResponse, MatchRequest
+from ...api.deps import get_db, get_request_db
+from ...core.config import settings
+from ...schemas.match import (
+    MatchResponse,
+    JobFilters,
+    BatchMatchRequest,
+    BatchMatchResponse,
+)
 from ...services import (
     find_matching_jobs,
     find_matching_resumes,
+    find_matches_batch,
+    afind_matching_jobs,
+    afind_matching_resumes,
+    get_topk_jobs,
+    get_topk_resumes,
     ResumeNotFoundError,
     JobNotFoundError,
     MatchError,
+    TopKNotFoundError,
 )
 
 logger = logging.getLogger(__name__)
@@ -19,11 +33,20 @@ router = APIRouter(prefix="/matches", tags=["matches"])
 
 
 @router.get("/resume/{resume_id}", response_model=MatchResponse)
-def match_resume_to_jobs(
+async def match_resume_to_jobs(
         resume_id: int,
         top_k: int = Query(default=10, ge=1, le=50),
         min_score: float = Query(default=0.0, ge=0.0, le=1.0),
-        db: Session = Depends(get_db),
+        ef_search: Optional[int] = Query(default=None, ge=1, le=1000),
+        probes: Optional[int] = Query(default=None, ge=1, le=10000),
+        mode: str = Query(default="vector", pattern="^(vector|hybrid)$"),
+        keywords: Optional[str] = Query(default=None, max_length=500),
+        location: Optional[str] = Query(default=None, max_length=255),
+        company: Optional[str] = Query(default=None, max_length=255),
+        created_after: Optional[datetime] = Query(default=None),
+        created_before: Optional[datetime] = Query(default=None),
+        exclude_ids: List[int] = Query(default=[], max_length=1000),
+        db=Depends(get_request_db),
 ):
     """
     Find the best matching jobs for a resume.
@@ -31,14 +54,51 @@ def match_resume_to_jobs(
     - **resume_id**: ID of the resume to match
     - **top_k**: Number of top matches to return (1-50)
     - **min_score**: Minimum similarity score threshold (0.0-1.0)
+    - **ef_search**: HNSW search breadth; higher is more accurate but slower
+    - **probes**: IVFFlat lists to probe; higher is more accurate but slower
+    - **mode**: "vector", or "hybrid" to fuse full-text and vector rankings
+    - **keywords**: Terms every match must contain (web-search syntax, e.g.
+      `kubernetes "site reliability" -intern`)
+    - **location** / **company**: Only jobs with exactly this value
+    - **created_after** / **created_before**: Only jobs posted in this window
+    - **exclude_ids**: Job IDs to leave out (repeat the parameter)
     """
-    try:
-        matches = find_matching_jobs(
-            db,
-            resume_id=resume_id,
-            top_k=top_k,
-            min_score=min_score,
+    filters = None
+    if location or company or created_after or created_before or exclude_ids:
+        filters = JobFilters(
+            location=location,
+            company=company,
+            created_after=created_after,
+            created_before=created_before,
+            exclude_ids=exclude_ids,
         )
+
+    try:
+        if settings.async_mode:
+            matches = await afind_matching_jobs(
+                db,
+                resume_id=resume_id,
+                top_k=top_k,
+                min_score=min_score,
+                ef_search=ef_search,
+                probes=probes,
+                mode=mode,
+                keywords=keywords,
+                filters=filters,
+            )
+        else:
+            matches = await run_in_threadpool(
+                find_matching_jobs,
+                db,
+                resume_id=resume_id,
+                top_k=top_k,
+                min_score=min_score,
+                ef_search=ef_search,
+                probes=probes,
+                mode=mode,
+                keywords=keywords,
+                filters=filters,
+            )
         return matches
     except ResumeNotFoundError:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -47,11 +107,15 @@ def match_resume_to_jobs(
 
 
 @router.get("/job/{job_id}/candidates")
-def match_job_to_resumes(
+async def match_job_to_resumes(
         job_id: int,
         top_k: int = Query(default=10, ge=1, le=50),
         min_score: float = Query(default=0.0, ge=0.0, le=1.0),
-        db: Session = Depends(get_db),
+        ef_search: Optional[int] = Query(default=None, ge=1, le=1000),
+        probes: Optional[int] = Query(default=None, ge=1, le=10000),
+        mode: str = Query(default="vector", pattern="^(vector|hybrid)$"),
+        keywords: Optional[str] = Query(default=None, max_length=500),
+        db=Depends(get_request_db),
 ):
     """
     Find the best matching resumes (candidates) for a job.
@@ -59,14 +123,36 @@ def match_job_to_resumes(
     - **job_id**: ID of the job to match
     - **top_k**: Number of top matches to return (1-50)
     - **min_score**: Minimum similarity score threshold (0.0-1.0)
+    - **ef_search**: HNSW search breadth; higher is more accurate but slower
+    - **probes**: IVFFlat lists to probe; higher is more accurate but slower
+    - **mode**: "vector", or "hybrid" to fuse full-text and vector rankings
+    - **keywords**: Terms every match must contain (web-search syntax, e.g.
+      `kubernetes "site reliability" -intern`)
     """
     try:
-        matches = find_matching_resumes(
-            db,
-            job_id=job_id,
-            top_k=top_k,
-            min_score=min_score,
-        )
+        if settings.async_mode:
+            matches = await afind_matching_resumes(
+                db,
+                job_id=job_id,
+                top_k=top_k,
+                min_score=min_score,
+                ef_search=ef_search,
+                probes=probes,
+                mode=mode,
+                keywords=keywords,
+            )
+        else:
+            matches = await run_in_threadpool(
+                find_matching_resumes,
+                db,
+                job_id=job_id,
+                top_k=top_k,
+                min_score=min_score,
+                ef_search=ef_search,
+                probes=probes,
+                mode=mode,
+                keywords=keywords,
+            )
         return {
             "job_id": job_id,
             "total_candidates": len(matches),
@@ -75,4 +161,74 @@ def match_job_to_resumes(
     except JobNotFoundError:
         raise HTTPException(status_code=404, detail="Job not found")
     except MatchError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/resume/{resume_id}/top", response_model=MatchResponse)
+def precomputed_jobs_for_resume(
+        resume_id: int,
+        top_k: int = Query(default=10, ge=1, le=50),
+        min_score: float = Query(default=0.0, ge=0.0, le=1.0),
+        db: Session = Depends(get_db),
+):
+    """
+    Read a resume's precomputed best jobs from the match_topk table.
+
+    No vector search runs; results are as fresh as the last write or
+    rebuild (see MATCH_TOPK_ENABLED and `make topk`).
+
+    - **resume_id**: ID of the resume
+    - **top_k**: Number of top matches to return (1-50, capped at MATCH_TOPK_SIZE)
+    - **min_score**: Minimum similarity score threshold (0.0-1.0)
+    """
+    try:
+        return get_topk_jobs(db, resume_id=resume_id, top_k=top_k, min_score=min_score)
+    except TopKNotFoundError:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+
+@router.get("/job/{job_id}/top")
+def precomputed_resumes_for_job(
+        job_id: int,
+        top_k: int = Query(default=10, ge=1, le=50),
+        min_score: float = Query(default=0.0, ge=0.0, le=1.0),
+        db: Session = Depends(get_db),
+):
+    """
+    Read a job's precomputed best candidates from the match_topk table.
+
+    - **job_id**: ID of the job
+    - **top_k**: Number of top matches to return (1-50, capped at MATCH_TOPK_SIZE)
+    - **min_score**: Minimum similarity score threshold (0.0-1.0)
+    """
+    try:
+        matches = get_topk_resumes(db, job_id=job_id, top_k=top_k, min_score=min_score)
+    except TopKNotFoundError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {
+        "job_id": job_id,
+        "total_candidates": len(matches),
+        "candidates": matches,
+    }
+
+
+@router.post("/batch", response_model=BatchMatchResponse)
+def match_batch(
+        request: BatchMatchRequest,
+        db: Session = Depends(get_db),
+):
+    """
+    Match many resumes against many jobs in a single call.
+
+    - **resume_ids**: Resumes to match (all embedded resumes if omitted)
+    - **job_ids**: Jobs to match against (all embedded jobs if omitted)
+    - **top_k**: Number of top matches per resume (1-50)
+    - **min_score**: Minimum similarity score threshold (0.0-1.0)
+    """
+    return find_matches_batch(
+        db,
+        resume_ids=request.resume_ids,
+        job_ids=request.job_ids,
+        top_k=request.top_k,
+        min_score=request.min_score,
+    )
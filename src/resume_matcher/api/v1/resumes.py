@@ -1,25 +1,36 @@
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from ...api.deps import get_db
+from ...api.deps import get_db, get_request_db
+from ...core.config import settings
+from ...models.status import EMBEDDING_PENDING
 from ...schemas.resume import (
     ResumeResponse,
     ResumeDetail,
     ResumeCreate,
     ResumeUploadResponse,
+    BulkUploadResponse,
 )
 from ...services import (
-    extract_text_from_pdf,
+    extract_text_from_pdf_async,
     PDFExtractionError,
+    PDFTooLargeError,
     create_resume,
-    get_resume,
-    get_resumes,
+    get_resume_with_preview,
+    get_resume_summaries,
     delete_resume,
     regenerate_embedding,
     ResumeNotFoundError,
     EmbeddingError,
+    ingest_resume_files,
+    BulkUploadError,
+    acreate_resume,
+    aget_resume_with_preview,
+    aget_resume_summaries,
+    adelete_resume,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,7 +43,7 @@ async def upload_resume(
         file: UploadFile = File(...),
         name: str = Form(...),
         email: str = Form(None),
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """
     Upload a resume PDF and extract its content.
@@ -42,15 +53,25 @@ async def upload_resume(
     - **email**: Optional email address
     """
     # Validate file type
-    if not file.filename.lower().endswith('.pdf'):
+    filename = file.filename or ""
+    if not filename.lower().endswith('.pdf'):
         raise HTTPException(
             status_code=400,
             detail="Only PDF files are supported"
         )
 
-    # Extract text from PDF
+    # Reject oversized uploads up front when the client sent a size
+    if file.size is not None and file.size > settings.pdf_max_file_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"PDF is larger than {settings.pdf_max_file_bytes // (1024 * 1024)} MB"
+        )
+
+    # Extract text from PDF in the process pool
     try:
-        raw_text = extract_text_from_pdf(file.file)
+        raw_text = await extract_text_from_pdf_async(file.file)
+    except PDFTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except PDFExtractionError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -58,74 +79,120 @@ async def upload_resume(
     resume_data = ResumeCreate(
         name=name,
         email=email,
-        filename=file.filename,
+        filename=filename,
         raw_text=raw_text,
     )
 
-    resume = create_resume(db, resume_data)
+    if settings.async_mode:
+        resume = await acreate_resume(db, resume_data)
+    else:
+        resume = await run_in_threadpool(create_resume, db, resume_data)
+
+    if resume.embedding_status == EMBEDDING_PENDING:
+        message = "Resume uploaded successfully; embedding is queued"
+    else:
+        message = "Resume uploaded and processed successfully"
 
     return ResumeUploadResponse(
-        message="Resume uploaded and processed successfully",
+        message=message,
         resume=ResumeResponse(
             id=resume.id,
             name=resume.name,
             email=resume.email,
             filename=resume.filename,
             created_at=resume.created_at,
-            has_embedding=resume.embedding is not None,
+            has_embedding=resume.has_embedding,
+            embedding_status=resume.embedding_status,
         )
     )
 
 
-@router.get("/", response_model=List[ResumeResponse])
-def list_resumes(
-        skip: int = 0,
-        limit: int = 100,
+@router.post("/bulk", response_model=BulkUploadResponse)
+async def bulk_upload_resumes(
+        files: List[UploadFile] = File(...),
         db: Session = Depends(get_db),
 ):
-    """Get all resumes with pagination."""
-    resumes = get_resumes(db, skip=skip, limit=limit)
-    return [
-        ResumeResponse(
-            id=r.id,
-            name=r.name,
-            email=r.email,
-            filename=r.filename,
-            created_at=r.created_at,
-            has_embedding=r.embedding is not None,
+    """
+    Upload many resume PDFs at once, or ZIP archives containing PDFs.
+
+    Candidate names default to the file name. Returns a per-file report;
+    one bad file does not fail the rest of the upload.
+
+    - **files**: PDF and/or ZIP files
+    """
+    uploads = [(file.filename or "", file.file) for file in files]
+
+    try:
+        return await run_in_threadpool(ingest_resume_files, db, uploads)
+    except BulkUploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/", response_model=List[ResumeResponse])
+async def list_resumes(
+        response: Response,
+        cursor: Optional[int] = Query(default=None, ge=0),
+        skip: int = Query(default=0, ge=0),
+        limit: int = Query(default=100, ge=1, le=1000),
+        db=Depends(get_request_db),
+):
+    """
+    List resumes in ID order.
+
+    - **cursor**: Return resumes after this ID; pass the previous page's
+      `X-Next-Cursor` header to page through without an offset scan
+    - **skip**: Offset paging, ignored when a cursor is given
+    - **limit**: Page size (1-1000)
+    """
+    if settings.async_mode:
+        resumes = await aget_resume_summaries(db, limit=limit, after_id=cursor, skip=skip)
+    else:
+        resumes = await run_in_threadpool(
+            get_resume_summaries, db, limit=limit, after_id=cursor, skip=skip
         )
-        for r in resumes
-    ]
+
+    if len(resumes) == limit:
+        response.headers["X-Next-Cursor"] = str(resumes[-1].id)
+    return [ResumeResponse.model_validate(r) for r in resumes]
 
 
 @router.get("/{resume_id}", response_model=ResumeDetail)
-def get_resume_detail(
+async def get_resume_detail(
         resume_id: int,
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """Get detailed information about a specific resume."""
-    resume = get_resume(db, resume_id)
+    if settings.async_mode:
+        resume = await aget_resume_with_preview(db, resume_id)
+    else:
+        resume = await run_in_threadpool(get_resume_with_preview, db, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
+    preview = resume.text_preview or ""
     return ResumeDetail(
         id=resume.id,
         name=resume.name,
         email=resume.email,
         filename=resume.filename,
         created_at=resume.created_at,
-        has_embedding=resume.embedding is not None,
-        text_preview=resume.raw_text[:500] + "..." if len(resume.raw_text) > 500 else resume.raw_text,
+        has_embedding=resume.has_embedding,
+        embedding_status=resume.embedding_status,
+        text_preview=preview[:500] + "..." if len(preview) > 500 else preview,
     )
 
 
 @router.delete("/{resume_id}", status_code=204)
-def remove_resume(
+async def remove_resume(
         resume_id: int,
-        db: Session = Depends(get_db),
+        db=Depends(get_request_db),
 ):
     """Delete a resume."""
-    if not delete_resume(db, resume_id):
+    if settings.async_mode:
+        deleted = await adelete_resume(db, resume_id)
+    else:
+        deleted = await run_in_threadpool(delete_resume, db, resume_id)
+    if not deleted:
         raise HTTPException(status_code=404, detail="Resume not found")
     return None
 
@@ -144,7 +211,8 @@ def regenerate_resume_embedding(
             email=resume.email,
             filename=resume.filename,
             created_at=resume.created_at,
-            has_embedding=resume.embedding is not None,
+            has_embedding=resume.has_embedding,
+            embedding_status=resume.embedding_status,
         )
     except ResumeNotFoundError:
         raise HTTPException(status_code=404, detail="Resume not found")
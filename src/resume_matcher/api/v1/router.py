@@ -3,9 +3,11 @@ from fastapi import APIRouter
 from .resumes import router as resumes_router
 from .jobs import router as jobs_router
 from .matches import router as matches_router
+from .embeddings import router as embeddings_router
 
 api_router = APIRouter()
 
 api_router.include_router(resumes_router)
 api_router.include_router(jobs_router)
-api_router.include_router(matches_router)
\ No newline at end of file
+api_router.include_router(matches_router)
+api_router.include_router(embeddings_router)
\ No newline at end of file
@@ -10,18 +10,171 @@ class Settings(BaseSettings):
     # Database
     database_url: Optional[str] = None
 
-    # OpenAI
-    OPENAI_API_KEY: str
+    # OpenAI (required unless embedding_provider is "local")
+    OPENAI_API_KEY: Optional[str] = None
 
     # App settings
     debug: bool = False
     app_name: str = "Resume Matcher"
     api_v1_prefix: str = "/api/v1"
 
+    # Heavy resources (DB engine, embedding client/model, PyMuPDF) are
+    # created on first use; warm-up creates them during app startup instead
+    # so the first request doesn't pay for it
+    warmup_on_startup: bool = True
+
+    # Prometheus metrics at /metrics (needs the "metrics" extra)
+    metrics_enabled: bool = True
+
     # Embedding settings
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536
 
+    # Vector size to request from the provider (None: the model's native
+    # size). Set from the database once a re-embedding migration to a
+    # shortened size completes, so new vectors match the backfilled ones.
+    embedding_request_dimensions: Optional[int] = None
+
+    # Embedding provider: "openai" (embeddings API) or "local"
+    # (sentence-transformers on this machine, needs the "local" extra).
+    # For "local", embedding_model names the sentence-transformers model
+    # and embedding_dimensions must match its output (or a Matryoshka
+    # truncation of it). local_embedding_backend "onnx" or "openvino" with
+    # local_embedding_model_file (e.g. "onnx/model_qint8_avx512.onnx")
+    # runs a quantised model on CPU. Concurrent requests are batched into
+    # model calls of up to local_embedding_max_batch texts.
+    embedding_provider: str = "openai"
+    local_embedding_backend: str = "torch"
+    local_embedding_model_file: Optional[str] = None
+    local_embedding_device: str = "cpu"
+    local_embedding_max_batch: int = 64
+
+    # Texts are truncated to this many tokens (tiktoken if installed)
+    embedding_max_tokens: int = 8191
+
+    # Chunked embeddings: long documents are split into overlapping chunks,
+    # stored per chunk for max-sim matching (pgvector backend) plus a pooled
+    # document vector. Re-embed existing rows after turning this on.
+    embedding_chunking: bool = False
+    embedding_chunk_tokens: int = 512
+    embedding_chunk_overlap: int = 64
+    embedding_max_chunks: int = 32
+
+    # Embedding API requests: inputs are packed into requests up to these
+    # budgets, sent concurrently, and retried with exponential backoff on
+    # rate limits and transient errors. request_timeout_seconds bounds each
+    # API call (the OpenAI clients' timeout)
+    embedding_request_max_items: int = 2048
+    embedding_request_max_tokens: int = 300000
+    embedding_request_concurrency: int = 4
+    embedding_max_retries: int = 5
+    embedding_retry_base_seconds: float = 1.0
+    embedding_request_timeout_seconds: float = 60.0
+
+    # Micro-batching: concurrent single-text embeddings (get_embedding
+    # cache misses) wait up to max_wait_ms for others and are sent together
+    # in batches of up to max_size texts
+    embedding_microbatch_enabled: bool = True
+    embedding_microbatch_max_wait_ms: float = 5.0
+    embedding_microbatch_max_size: int = 64
+
+    # Embedding cache (in-process LRU in front of the embedding_cache table)
+    embedding_cache_enabled: bool = True
+    embedding_cache_persistent: bool = True
+    embedding_cache_size: int = 1024
+
+    # Background embedding: when enabled, creates/updates only queue work
+    # (embedding_status = "pending") and the worker process embeds in batches
+    embedding_async: bool = False
+    embedding_worker_batch_size: int = 64
+    embedding_worker_poll_seconds: float = 2.0
+    # A claimed row whose vector isn't written within the lease (a worker
+    # that died mid-batch) is claimed again; keep it above a batch's
+    # embedding time including retries
+    embedding_worker_lease_seconds: float = 300.0
+
+    # Re-embedding migrations (python -m src.resume_matcher.reembed)
+    reembed_batch_size: int = 256
+    reembed_lock_timeout_seconds: int = 10
+
+    # Async request path: AsyncSession on asyncpg and AsyncOpenAI for the
+    # hot routes (requires the "async" extra)
+    async_mode: bool = False
+    async_pool_size: int = 20
+    async_max_overflow: int = 80
+    openai_max_connections: int = 200
+
+    # Vector index settings (pgvector ANN indexes on the embedding columns)
+    vector_index_type: str = "hnsw"  # "hnsw" or "ivfflat"
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    hnsw_ef_search: int = 40
+    ivfflat_lists: int = 100
+    ivfflat_probes: int = 1
+
+    # Filtered ANN queries: pgvector >= 0.8 iterative index scans ("off",
+    # "strict_order" or "relaxed_order"; IVFFlat supports only the latter),
+    # and the most rows a query is widened to when filters leave < top_k
+    vector_iterative_scan: str = "relaxed_order"
+    match_max_fetch: int = 1000
+
+    # Compact ANN search: the indexes and the first-pass search use a
+    # quantized copy of each vector ("halfvec" = 16-bit floats, "binary" =
+    # one bit per dimension, "none" = full vectors), optionally truncated to
+    # its first vector_search_dimensions (Matryoshka, text-embedding-3-*).
+    # The top_k * vector_rescore_factor shortlist is rescored with the full
+    # vector. After changing these, rebuild the vector indexes with
+    # `make indexes` (startup warns while they are stale).
+    vector_quantization: str = "none"
+    vector_search_dimensions: Optional[int] = None
+    vector_rescore_factor: int = 4
+
+    # PDF extraction process pool (0 workers = one per CPU core). Workers
+    # stop a document between pages after pdf_timeout_seconds; a worker
+    # stuck inside one page for pdf_kill_grace_seconds longer is killed and
+    # replaced.
+    pdf_workers: int = 0
+    pdf_worker_max_tasks: int = 200
+    pdf_timeout_seconds: float = 30.0
+    pdf_kill_grace_seconds: float = 30.0
+    pdf_max_pages: int = 50
+
+    # PDF uploads are spooled to disk in chunks; larger files are rejected
+    pdf_max_file_bytes: int = 20 * 1024 * 1024
+    pdf_spool_dir: Optional[str] = None
+
+    # Bulk resume ingestion
+    bulk_upload_max_files: int = 1000
+    bulk_upload_batch_size: int = 100
+    bulk_upload_batch_tokens: int = 100000
+
+    # Matching backend: "pgvector" (SQL) or "numpy" (in-process matrix index)
+    match_backend: str = "pgvector"
+    vector_index_ttl_seconds: int = 300
+
+    # Hybrid matching: full-text (tsvector) and vector candidates fused by
+    # reciprocal rank fusion. text_search_config must match the config the
+    # search_vector columns were built with (their triggers use it).
+    text_search_config: str = "english"
+    hybrid_candidates: int = 100
+    hybrid_rrf_k: int = 60
+
+    # Match result cache (in-process LRU, cleared on every write)
+    match_cache_enabled: bool = True
+    match_cache_size: int = 1024
+    match_cache_ttl_seconds: int = 60
+
+    # Precomputed top-K table (match_topk): built by python -m
+    # src.resume_matcher.topk and, when enabled, kept current on every write.
+    # The refresh runs inside the writing request and needs the other
+    # side's whole in-memory index (see topk_service.refresh_topk)
+    match_topk_enabled: bool = False
+    match_topk_size: int = 50
+
+    # Batch matching tile sizes (queries x rows scored per NumPy product)
+    match_batch_query_block: int = 256
+    match_batch_index_block: int = 16384
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,26 +1,260 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from typing import Callable, Optional, TypeVar
+
+from pgvector import sqlalchemy as pgvector_sqlalchemy
+from sqlalchemy import create_engine, event, make_url, text, Index
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 from .config import settings
 
-# Create engine
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,  # Check connection health
-    pool_size=5,
-    max_overflow=10,
-)
+# Sync engine, created on first use so importing the app needs neither a
+# DATABASE_URL nor the DBAPI driver until a session is opened
+_engine = None
+
+
+def get_engine():
+    """Get the sync engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            settings.database_url,
+            pool_pre_ping=True,  # Check connection health
+            pool_size=5,
+            max_overflow=10,
+        )
+    return _engine
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that binds to get_engine() when the first session is made."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
 
 # Create session factory
-SessionLocal = sessionmaker(
+SessionLocal = _LazySessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine,
 )
 
+# Async engine and session factory, created on first use (ASYNC_MODE)
+_async_engine = None
+_async_sessionmaker = None
+
 # Base class for models
 Base = declarative_base()
 
+T = TypeVar("T")
+
+
+class Vector(pgvector_sqlalchemy.Vector):
+    """
+    pgvector column and parameter type that also binds on asyncpg.
+
+    The asyncpg codec registered in get_async_sessionmaker encodes lists
+    and arrays itself and rejects pgvector's text form, so values pass
+    through untouched there.
+    """
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        if dialect.driver == "asyncpg":
+            return None
+        return super().bind_processor(dialect)
+
+
+def async_database_url(url: Optional[str] = None) -> str:
+    """The database URL with the asyncpg driver."""
+    url = url or settings.database_url
+    if url is None:
+        raise ValueError("DATABASE_URL is not set")
+    return make_url(url).set(
+        drivername="postgresql+asyncpg"
+    ).render_as_string(hide_password=False)
+
+
+def get_async_sessionmaker():
+    """
+    Get the AsyncSession factory, creating the async engine on first use.
+
+    Imported lazily: SQLAlchemy's asyncio extension needs greenlet and the
+    engine needs asyncpg, both from the "async" extra.
+    """
+    global _async_engine, _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(
+            async_database_url(),
+            pool_pre_ping=True,
+            pool_size=settings.async_pool_size,
+            max_overflow=settings.async_max_overflow,
+        )
+
+        @event.listens_for(_async_engine.sync_engine, "connect")
+        def register_vector_type(dbapi_connection, connection_record):
+            from pgvector.asyncpg import register_vector
+            dbapi_connection.run_async(register_vector)
+
+        _async_sessionmaker = async_sessionmaker(
+            bind=_async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
+
+
+def run_with_session(function: Callable[..., T], *args) -> T:
+    """
+    Call ``function(session, *args)`` with a new sync session, then close it.
+
+    For work handed to a thread from the async path, where the request's
+    AsyncSession cannot follow.
+    """
+    db: Session = SessionLocal()
+    try:
+        return function(db, *args)
+    finally:
+        db.close()
+
+
+def pool_status() -> dict:
+    """
+    Connection pool usage of the engines created so far.
+
+    Returns:
+        {"sync" | "async": {"size", "checked_out", "checked_in", "overflow",
+        "capacity"}}, for QueuePool-style pools only
+    """
+    engines = {"sync": _engine}
+    if _async_engine is not None:
+        engines["async"] = _async_engine.sync_engine
+
+    status = {}
+    for name, engine in engines.items():
+        pool = getattr(engine, "pool", None)
+        if pool is None or not hasattr(pool, "checkedout"):
+            continue
+        status[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "capacity": pool.size() + pool._max_overflow,
+        }
+    return status
+
+
+def __getattr__(name: str):
+    # Backwards-compatible ``database.engine`` without creating it at import
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's connections, if it was created."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _async_sessionmaker = None
+
+
+def vector_index_options() -> dict:
+    """Dialect options for the ANN index on an embedding column."""
+    if settings.vector_index_type == "ivfflat":
+        params = {"lists": settings.ivfflat_lists}
+    elif settings.vector_index_type == "hnsw":
+        params = {
+            "m": settings.hnsw_m,
+            "ef_construction": settings.hnsw_ef_construction,
+        }
+    else:
+        raise ValueError(f"Unknown vector index type: {settings.vector_index_type}")
+
+    return {
+        "postgresql_using": settings.vector_index_type,
+        "postgresql_with": params,
+    }
+
+
+VECTOR_QUANTIZATIONS = ("none", "halfvec", "binary")
+
+
+def vector_search_rescores(dimensions: Optional[int] = None) -> bool:
+    """Whether ANN search runs on a compact copy and needs exact rescoring."""
+    dimensions = dimensions or settings.embedding_dimensions
+    return (
+        settings.vector_quantization != "none"
+        or settings.vector_search_dimensions not in (None, dimensions)
+    )
+
+
+def vector_search_expression(expression: str, dimensions: Optional[int] = None) -> str:
+    """
+    SQL for the compact form of a vector that ANN indexes and first-pass
+    search compare (see settings.vector_quantization).
+
+    Args:
+        expression: SQL for a full-precision vector, e.g. "embedding" or
+            "CAST(:embedding AS vector)"
+        dimensions: Size of the full vector (default: settings.embedding_dimensions)
+
+    Returns:
+        SQL for the (possibly truncated) halfvec, bit or vector value
+    """
+    if settings.vector_quantization not in VECTOR_QUANTIZATIONS:
+        raise ValueError(f"Unknown vector quantization: {settings.vector_quantization}")
+    dimensions = dimensions or settings.embedding_dimensions
+    if not vector_search_rescores(dimensions):
+        return expression
+
+    search_dimensions = min(settings.vector_search_dimensions or dimensions, dimensions)
+    if search_dimensions != dimensions:
+        expression = f"subvector({expression}, 1, {search_dimensions})"
+
+    if settings.vector_quantization == "binary":
+        return f"binary_quantize({expression})::bit({search_dimensions})"
+    if settings.vector_quantization == "halfvec":
+        return f"({expression})::halfvec({search_dimensions})"
+    return f"({expression})::vector({search_dimensions})"
+
+
+def vector_search_operator() -> str:
+    """Distance operator for vector_search_expression values."""
+    return "<~>" if settings.vector_quantization == "binary" else "<=>"
+
+
+def vector_index_expression(column: str, dimensions: Optional[int] = None) -> str:
+    """Indexed expression and operator class for an embedding column."""
+    opclass = {
+        "none": "vector_cosine_ops",
+        "halfvec": "halfvec_cosine_ops",
+        "binary": "bit_hamming_ops",
+    }[settings.vector_quantization]
+    return f"({vector_search_expression(column, dimensions)}) {opclass}"
+
+
+def vector_index_form(column: str, dimensions: Optional[int] = None) -> str:
+    """Indexed column or search form, with operator class, of an ANN index."""
+    if vector_search_rescores(dimensions):
+        return vector_index_expression(column, dimensions)
+    return f"{column} vector_cosine_ops"
+
+
+def vector_index(name: str, column: str) -> Index:
+    """ANN index on an embedding column, or on its compact search form."""
+    if vector_search_rescores():
+        return Index(name, text(vector_index_expression(column)), **vector_index_options())
+    return Index(
+        name,
+        column,
+        postgresql_ops={column: "vector_cosine_ops"},
+        **vector_index_options(),
+    )
+
 
 def get_db():
     """Dependency that provides a database session."""
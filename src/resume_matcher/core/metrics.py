@@ -0,0 +1,230 @@
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+try:
+    import prometheus_client
+    _PROMETHEUS_INSTALLED = True
+except ImportError:
+    _PROMETHEUS_INSTALLED = False
+
+logger = logging.getLogger(__name__)
+
+# prometheus_client is optional (the "metrics" extra); without it, or with
+# METRICS_ENABLED=false, every metric below is a no-op and /metrics is not
+# mounted
+METRICS_ENABLED = _PROMETHEUS_INSTALLED and settings.metrics_enabled
+
+_PREFIX = "resume_matcher_"
+
+# Latency buckets (seconds) from sub-millisecond queries to slow API calls
+_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+_COUNTS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+_PAGES = (1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+_BYTES = (16e3, 64e3, 256e3, 1e6, 4e6, 16e6, 64e6)
+_TOKENS = (100, 1e3, 1e4, 5e4, 1e5, 3e5)
+
+
+class _NoopMetric:
+    """Stands in for a metric when metrics are disabled."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def observe(self, value: float) -> None:
+        pass
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+
+def _histogram(name: str, documentation: str, labels: Sequence[str] = (), buckets=_SECONDS):
+    if not METRICS_ENABLED:
+        return _NoopMetric()
+    return prometheus_client.Histogram(
+        _PREFIX + name, documentation, labels, buckets=buckets
+    )
+
+
+def _counter(name: str, documentation: str, labels: Sequence[str] = ()):
+    if not METRICS_ENABLED:
+        return _NoopMetric()
+    return prometheus_client.Counter(_PREFIX + name, documentation, labels)
+
+
+# PDF extraction (observed in the API process, also for pool extractions)
+PDF_EXTRACTION_SECONDS = _histogram(
+    "pdf_extraction_seconds", "PDF text extraction time", ["outcome"]
+)
+PDF_PAGES = _histogram("pdf_pages", "Pages per extracted PDF", buckets=_PAGES)
+PDF_BYTES = _histogram("pdf_bytes", "Size of uploaded PDFs", buckets=_BYTES)
+
+# Embedding requests (one packed request to the provider)
+EMBEDDING_REQUEST_SECONDS = _histogram(
+    "embedding_request_seconds", "Embedding request latency, retries included",
+    ["provider", "outcome"],
+)
+EMBEDDING_BATCH_SIZE = _histogram(
+    "embedding_batch_size", "Texts per embedding request", ["provider"], buckets=_COUNTS
+)
+EMBEDDING_REQUEST_TOKENS = _histogram(
+    "embedding_request_tokens", "Tokens per embedding request", ["provider"], buckets=_TOKENS
+)
+EMBEDDING_RETRIES = _counter(
+    "embedding_retries_total", "Embedding requests retried after a transient error", ["error"]
+)
+
+# Database time per service operation (see track_operation)
+DB_QUERY_SECONDS = _histogram(
+    "db_query_seconds", "SQL statement execution time", ["operation"]
+)
+DB_COMMIT_SECONDS = _histogram(
+    "db_commit_seconds", "Session commit time (flush included)", ["operation"]
+)
+
+# Matching, end to end
+MATCH_SECONDS = _histogram(
+    "match_seconds", "Match query latency", ["direction", "cached"]
+)
+
+
+# Service operation that database time is attributed to
+_operation: contextvars.ContextVar[str] = contextvars.ContextVar("db_operation", default="other")
+
+
+def current_operation() -> str:
+    """Name of the innermost tracked service operation (or "other")."""
+    return _operation.get()
+
+
+def track_operation(name: str) -> Callable:
+    """
+    Attribute the database time of a service function to ``name``.
+
+    Statements and commits run while the function (sync or async) is
+    executing are labelled with it in db_query_seconds/db_commit_seconds.
+    """
+    def decorator(function: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(function):
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                token = _operation.set(name)
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    _operation.reset(token)
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            token = _operation.set(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _operation.reset(token)
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def observe_seconds(histogram, **labels) -> Iterator[dict]:
+    """
+    Time a block into ``histogram``.
+
+    The yielded dict holds the labels and can be updated inside the block,
+    e.g. to set the outcome once it is known.
+    """
+    start = time.perf_counter()
+    try:
+        yield labels
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+if METRICS_ENABLED:
+    # Registered on the classes, so every engine and session is covered:
+    # the lazily created sync engine, the async engine and test engines
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("query_start", None)
+        if start is not None:
+            DB_QUERY_SECONDS.labels(current_operation()).observe(time.perf_counter() - start)
+
+    @event.listens_for(Session, "before_commit")
+    def _before_commit(session):
+        session.info["commit_start"] = time.perf_counter()
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(session):
+        start = session.info.pop("commit_start", None)
+        if start is not None:
+            DB_COMMIT_SECONDS.labels(current_operation()).observe(time.perf_counter() - start)
+
+
+class _PoolCollector:
+    """Connection pool gauges, read from the engines at scrape time."""
+
+    def collect(self):
+        from prometheus_client.core import GaugeMetricFamily
+
+        from .database import pool_status
+
+        gauges = {
+            "size": "Connections the pool keeps open",
+            "checked_out": "Connections in use",
+            "checked_in": "Idle connections in the pool",
+            "overflow": "Connections opened beyond the pool size",
+            "capacity": "Maximum connections (pool size + max overflow)",
+        }
+        families = {
+            stat: GaugeMetricFamily(f"{_PREFIX}db_pool_{stat}", documentation, labels=["engine"])
+            for stat, documentation in gauges.items()
+        }
+        for engine_name, status in pool_status().items():
+            for stat, family in families.items():
+                if stat in status:
+                    family.add_metric([engine_name], status[stat])
+        yield from families.values()
+
+
+if METRICS_ENABLED and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+    prometheus_client.REGISTRY.register(_PoolCollector())
+
+
+def render_metrics() -> Optional[tuple]:
+    """
+    The Prometheus exposition of all metrics.
+
+    With several server processes, set PROMETHEUS_MULTIPROC_DIR so each
+    scrape aggregates every process's samples (pool gauges are then
+    omitted, since they describe a single process).
+
+    Returns:
+        (body, content type), or None when metrics are disabled
+    """
+    if not METRICS_ENABLED:
+        return None
+
+    registry = prometheus_client.REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
@@ -0,0 +1,40 @@
+import argparse
+import logging
+import sys
+
+from .core.config import settings
+from .core.database import SessionLocal
+from .services.active_model import use_active_model
+from .services.index_service import rebuild_vector_indexes
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Bring the vector indexes in line with the configured search form."""
+    parser = argparse.ArgumentParser(description="Resume Matcher vector index maintenance")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale indexes; exit with status 1 if there are any",
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        # Index the vector size of the flipped model, not a stale config
+        use_active_model(db)
+        names = rebuild_vector_indexes(db, dry_run=args.check)
+
+    if not names:
+        logger.info("Vector indexes match the configured search form")
+    elif args.check:
+        logger.warning(f"Stale vector indexes: {', '.join(names)}; run `make indexes`")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
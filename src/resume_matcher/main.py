@@ -1,9 +1,17 @@
+import asyncio
 import logging
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
 from .api.v1.router import api_router
+from .core.database import dispose_async_engine
+from .core.metrics import METRICS_ENABLED, render_metrics
+from .services.embedding_service import close_async_client
+from .services.pdf_service import shutdown_pdf_executor
+from .services.active_model import load_active_model
+from .services.warmup import warm_up
 
 # Configure logging
 logging.basicConfig(
@@ -13,6 +21,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown."""
+    # Vectors from a flipped re-embedding migration decide the model
+    await asyncio.to_thread(load_active_model)
+    if settings.warmup_on_startup:
+        await asyncio.to_thread(warm_up)
+    yield
+    shutdown_pdf_executor()
+    await close_async_client()
+    await dispose_async_engine()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
 
@@ -36,6 +57,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware
@@ -55,6 +77,12 @@ def create_app() -> FastAPI:
     def health_check():
         return {"status": "healthy", "version": "0.1.0"}
 
+    if METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        def metrics():
+            body, content_type = render_metrics()
+            return Response(content=body, media_type=content_type)
+
     @app.get("/")
     def root():
         return {
@@ -1,4 +1,8 @@
 from .resume import Resume
 from .job import Job
+from .embedding_cache import EmbeddingCache
+from .chunk import ResumeChunk, JobChunk
+from .embedding_migration import EmbeddingMigration
+from .match_topk import MatchTopK
 
-__all__ = ["Resume", "Job"]
\ No newline at end of file
+__all__ = ["Resume", "Job", "EmbeddingCache", "ResumeChunk", "JobChunk", "EmbeddingMigration", "MatchTopK"]
\ No newline at end of file
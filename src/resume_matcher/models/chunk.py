@@ -0,0 +1,57 @@
+from typing import List
+
+from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base, Vector, vector_index
+from ..core.config import settings
+
+
+class ResumeChunk(Base):
+    __tablename__ = "resume_chunks"
+    __table_args__ = (
+        vector_index("ix_resume_chunks_embedding", "embedding"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    resume_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Position of the chunk within the document
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding: Mapped[List[float]] = mapped_column(
+        Vector(settings.embedding_dimensions), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<ResumeChunk(resume_id={self.resume_id}, chunk_index={self.chunk_index})>"
+
+
+class JobChunk(Base):
+    __tablename__ = "job_chunks"
+    __table_args__ = (
+        vector_index("ix_job_chunks_embedding", "embedding"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    job_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Position of the chunk within the document
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding: Mapped[List[float]] = mapped_column(
+        Vector(settings.embedding_dimensions), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<JobChunk(job_id={self.job_id}, chunk_index={self.chunk_index})>"
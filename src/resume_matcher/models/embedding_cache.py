@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import Integer, String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..core.database import Base, Vector
+
+
+class EmbeddingCache(Base):
+    __tablename__ = "embedding_cache"
+
+    # SHA-256 of (model, dimensions, prepared text)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Untyped vector so entries for different dimensions can coexist
+    embedding: Mapped[List[float]] = mapped_column(Vector(), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<EmbeddingCache(key='{self.key[:12]}', model='{self.model}')>"
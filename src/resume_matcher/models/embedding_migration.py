@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+from .status import MIGRATION_RUNNING
+
+
+class EmbeddingMigration(Base):
+    __tablename__ = "embedding_migrations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Model the shadow columns are filled with
+    target_model: Mapped[str] = mapped_column(String(255), nullable=False)
+    target_dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default=MIGRATION_RUNNING)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Keyset cursors: last row ID copied into the shadow column per table
+    resume_cursor: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    job_cursor: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Progress
+    total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<EmbeddingMigration(id={self.id}, target_model='{self.target_model}', status='{self.status}')>"
@@ -1,31 +1,74 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import Integer, String, Text, DateTime, Index, text
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
 
-from ..core.database import Base
+from ..core.database import Base, Vector, vector_index
 from ..core.config import settings
+from .status import EMBEDDING_PENDING
+
+if TYPE_CHECKING:
+    from .chunk import JobChunk
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        vector_index("ix_jobs_embedding", "embedding"),
+        # Small partial index the embedding worker polls
+        Index(
+            "ix_jobs_embedding_pending",
+            "id",
+            postgresql_where=text("embedding_status = 'pending'"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     # Job info
-    title = Column(String(255), nullable=False)
-    company = Column(String(255), nullable=True)
-    location = Column(String(255), nullable=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    company: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
 
-    # Job description
-    description = Column(Text, nullable=False)
+    # Job description; description and embedding are deferred (loaded only
+    # by the services that undefer them) since matching never needs the text
+    description: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
 
     # Vector embedding for semantic search
-    embedding = Column(Vector(settings.embedding_dimensions), nullable=True)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(
+        Vector(settings.embedding_dimensions), nullable=True, deferred=True
+    )
+    has_embedding: Mapped[bool] = column_property(embedding.isnot(None))
+    embedding_status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=EMBEDDING_PENDING,
+        server_default=EMBEDDING_PENDING,
+    )
+    # Lease of the embedding worker that claimed the pending row; cleared
+    # when its vector is written or when the text changes under it
+    embedding_claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Full-text search_vector (tsvector kept current by a trigger, with a GIN
+    # index) exists only in PostgreSQL and is read by raw SQL in hybrid
+    # matching, so it is not mapped here; see migration 4f7b2d91c0ae.
+
+    # Per-chunk vectors (only for multi-chunk documents in chunked mode)
+    chunks: Mapped[List["JobChunk"]] = relationship(
+        "JobChunk",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="JobChunk.chunk_index",
+    )
 
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
     def __repr__(self):
-        return f"<Job(id={self.id}, title='{self.title}')>"
\ No newline at end of file
+        return f"<Job(id={self.id}, title='{self.title}')>"
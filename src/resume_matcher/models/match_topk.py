@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, String, Float, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+
+class MatchTopK(Base):
+    """Precomputed top-K matches per resume (direction "jobs") and per job ("resumes")."""
+    __tablename__ = "match_topk"
+    __table_args__ = (
+        UniqueConstraint("direction", "source_id", "target_id", name="uq_match_topk_pair"),
+        # Read path: one range scan per source, best first
+        Index("ix_match_topk_source", "direction", "source_id", "score"),
+        # Lists to repair when a target changes or is deleted
+        Index("ix_match_topk_target", "direction", "target_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # "jobs": source is a resume, target a job; "resumes": the reverse
+    direction: Mapped[str] = mapped_column(String(10), nullable=False)
+    source_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    target_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return (
+            f"<MatchTopK(direction='{self.direction}', source_id={self.source_id}, "
+            f"target_id={self.target_id}, score={self.score:.4f})>"
+        )
@@ -0,0 +1,10 @@
+# Embedding lifecycle for resumes and jobs
+EMBEDDING_PENDING = "pending"  # queued for the embedding worker
+EMBEDDING_READY = "ready"  # embedding column is populated
+EMBEDDING_FAILED = "failed"  # generation failed; regenerate to retry
+
+# Re-embedding migration lifecycle (embedding_migrations.status)
+MIGRATION_RUNNING = "running"  # shadow columns are being backfilled
+MIGRATION_BACKFILLED = "backfilled"  # every embedded row has a shadow vector
+MIGRATION_COMPLETED = "completed"  # shadow columns were flipped into place
+MIGRATION_FAILED = "failed"  # stopped on an error; run again to resume
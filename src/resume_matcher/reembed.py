@@ -0,0 +1,102 @@
+import argparse
+import logging
+import signal
+import threading
+
+from .core.config import settings
+from .core.database import SessionLocal
+from .services.reembed_service import (
+    start_migration,
+    get_latest_migration,
+    get_migration,
+    run_migration,
+    flip_migration,
+    cleanup_migration,
+    migration_progress,
+    ReembedError,
+)
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def _resolve(db, migration_id):
+    migration = get_migration(db, migration_id) if migration_id else get_latest_migration(db)
+    if migration is None:
+        raise ReembedError("No re-embedding migration found")
+    return migration
+
+
+def main() -> None:
+    """Re-embed all resumes and jobs with a new embedding model."""
+    parser = argparse.ArgumentParser(description="Resume Matcher re-embedding migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    start = commands.add_parser("start", help="Add shadow columns for a new model")
+    start.add_argument("--model", required=True, help="Target embedding model")
+    start.add_argument("--dimensions", type=int, required=True, help="Target vector size")
+
+    run = commands.add_parser("run", help="Backfill shadow vectors (resumable)")
+    run.add_argument("--id", type=int, help="Migration ID (defaults to the latest)")
+    run.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.reembed_batch_size,
+        help="Rows to embed per batch",
+    )
+
+    status = commands.add_parser("status", help="Show migration progress")
+    status.add_argument("--id", type=int, help="Migration ID (defaults to the latest)")
+
+    flip = commands.add_parser("flip", help="Switch matching to the new vectors")
+    flip.add_argument("--id", type=int, help="Migration ID (defaults to the latest)")
+
+    commands.add_parser("cleanup", help="Drop the previous vectors after a flip")
+
+    args = parser.parse_args()
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, finishing current batch")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    with SessionLocal() as db:
+        try:
+            if args.command == "start":
+                migration = start_migration(db, args.model, args.dimensions)
+            elif args.command == "run":
+                migration = run_migration(
+                    db,
+                    _resolve(db, args.id).id,
+                    stop_event=stop_event,
+                    batch_size=args.batch_size,
+                )
+            elif args.command == "flip":
+                migration = flip_migration(db, _resolve(db, args.id).id)
+            elif args.command == "cleanup":
+                cleanup_migration(db)
+                return
+            else:
+                migration = _resolve(db, args.id)
+        except ReembedError as e:
+            parser.exit(1, f"error: {e}\n")
+
+        progress = migration_progress(migration)
+        print(
+            f"Migration {migration.id} ({migration.target_model}, "
+            f"{migration.target_dimensions} dims): {migration.status}, "
+            f"{migration.processed_rows}/{migration.total_rows} rows "
+            f"({progress['percent_complete']}%), "
+            f"{progress['rows_per_second']} rows/s, ETA {progress['eta_seconds']}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
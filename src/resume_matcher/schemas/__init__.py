@@ -3,6 +3,8 @@ from .resume import (
     ResumeResponse,
     ResumeDetail,
     ResumeUploadResponse,
+    BulkUploadItem,
+    BulkUploadResponse,
 )
 from .job import (
     JobCreate,
@@ -14,6 +16,14 @@ from .match import (
     MatchResult,
     MatchResponse,
     MatchRequest,
+    JobFilters,
+    BatchMatchRequest,
+    BatchMatchResponse,
+)
+from .embedding import (
+    EmbeddingCacheStats,
+    EmbeddingMigrationCreate,
+    EmbeddingMigrationStatus,
 )
 
 __all__ = [
@@ -21,6 +31,8 @@ __all__ = [
     "ResumeResponse",
     "ResumeDetail",
     "ResumeUploadResponse",
+    "BulkUploadItem",
+    "BulkUploadResponse",
     "JobCreate",
     "JobUpdate",
     "JobResponse",
@@ -28,4 +40,10 @@ __all__ = [
     "MatchResult",
     "MatchResponse",
     "MatchRequest",
+    "JobFilters",
+    "BatchMatchRequest",
+    "BatchMatchResponse",
+    "EmbeddingCacheStats",
+    "EmbeddingMigrationCreate",
+    "EmbeddingMigrationStatus",
 ]
\ No newline at end of file
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class EmbeddingCacheStats(BaseModel):
+    """Embedding cache counters since process start."""
+    memory_hits: int
+    db_hits: int
+    misses: int
+    memory_entries: int
+    hit_rate: float = Field(..., ge=0, le=1)
+
+
+class EmbeddingMigrationCreate(BaseModel):
+    """Schema for starting a re-embedding migration."""
+    model: str = Field(..., min_length=1, max_length=255)
+    dimensions: int = Field(..., gt=0, le=16000)
+
+
+class EmbeddingMigrationStatus(BaseModel):
+    """Progress of a re-embedding migration."""
+    id: int
+    target_model: str
+    target_dimensions: int
+    status: str
+    error: Optional[str] = None
+    total_rows: int
+    processed_rows: int
+    percent_complete: float
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[int] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
@@ -29,6 +29,7 @@ class JobResponse(JobBase):
     id: int
     created_at: datetime
     has_embedding: bool = False
+    embedding_status: str = "ready"
 
     class Config:
         from_attributes = True
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -9,6 +10,9 @@ class MatchResult(BaseModel):
     company: Optional[str]
     similarity_score: float = Field(..., ge=0, le=1)
     match_percentage: int = Field(..., ge=0, le=100)
+    hybrid_score: Optional[float] = Field(
+        default=None, description="Reciprocal rank fusion score (hybrid mode only)"
+    )
 
     class Config:
         from_attributes = True
@@ -22,8 +26,44 @@ class MatchResponse(BaseModel):
     matches: List[MatchResult]
 
 
+class JobFilters(BaseModel):
+    """Structured filters applied to candidate jobs inside the match query."""
+    location: Optional[str] = Field(default=None, max_length=255)
+    company: Optional[str] = Field(default=None, max_length=255)
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    exclude_ids: List[int] = Field(default_factory=list, max_length=1000)
+
+
 class MatchRequest(BaseModel):
     """Request to find matches for a resume."""
     resume_id: int
     top_k: int = Field(default=10, ge=1, le=50)
-    min_score: float = Field(default=0.0, ge=0, le=1)
\ No newline at end of file
+    min_score: float = Field(default=0.0, ge=0, le=1)
+    ef_search: Optional[int] = Field(default=None, ge=1, le=1000)
+    probes: Optional[int] = Field(default=None, ge=1, le=10000)
+    mode: str = Field(default="vector", pattern="^(vector|hybrid)$")
+    keywords: Optional[str] = Field(default=None, max_length=500)
+    filters: Optional[JobFilters] = None
+
+
+class BatchMatchRequest(BaseModel):
+    """Request to match many resumes against many jobs in one call."""
+    resume_ids: Optional[List[int]] = Field(
+        default=None, description="Resumes to match (all embedded resumes if omitted)"
+    )
+    job_ids: Optional[List[int]] = Field(
+        default=None, description="Jobs to match against (all embedded jobs if omitted)"
+    )
+    top_k: int = Field(default=10, ge=1, le=50)
+    min_score: float = Field(default=0.0, ge=0, le=1)
+
+
+class BatchMatchResponse(BaseModel):
+    """Top job matches for each requested resume."""
+    total_resumes: int
+    total_jobs_compared: int
+    results: List[MatchResponse]
+    skipped_resume_ids: List[int] = Field(
+        default_factory=list, description="Requested resumes that are missing or have no embedding"
+    )
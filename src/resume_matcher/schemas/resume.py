@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -21,6 +21,7 @@ class ResumeResponse(ResumeBase):
     filename: str
     created_at: datetime
     has_embedding: bool = False
+    embedding_status: str = "ready"
 
     class Config:
         from_attributes = True
@@ -37,4 +38,21 @@ class ResumeDetail(ResumeResponse):
 class ResumeUploadResponse(BaseModel):
     """Response after uploading a resume."""
     message: str
-    resume: ResumeResponse
\ No newline at end of file
+    resume: ResumeResponse
+
+
+class BulkUploadItem(BaseModel):
+    """Outcome for one file in a bulk upload."""
+    filename: str
+    status: str = Field(..., description="created or failed")
+    resume_id: Optional[int] = None
+    embedding_status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkUploadResponse(BaseModel):
+    """Per-file report for a bulk upload."""
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BulkUploadItem]
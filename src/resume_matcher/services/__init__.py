@@ -1,50 +1,161 @@
-from .pdf_service import extract_text_from_pdf, PDFExtractionError
-from .embedding_service import get_embedding, get_embeddings_batch, EmbeddingError
+from .pdf_service import (
+    extract_text_from_pdf,
+    extract_text_from_pdf_async,
+    PDFExtractionError,
+    PDFTooLargeError,
+)
+from .embedding_service import (
+    get_embedding,
+    get_embeddings_batch,
+    embed_documents,
+    aget_embedding,
+    aget_embeddings_batch,
+    get_embedding_provider,
+    set_embedding_provider,
+    EmbeddingError,
+)
+from .embedding_providers import EmbeddingProvider, LocalEmbeddingProvider
 from .resume_service import (
     create_resume,
     get_resume,
     get_resume_or_404,
+    get_resume_with_preview,
     get_resumes,
     delete_resume,
     regenerate_embedding,
+    bulk_create_resumes,
+    acreate_resume,
+    aget_resume,
+    aget_resume_with_preview,
+    aget_resumes,
+    get_resume_summaries,
+    aget_resume_summaries,
+    adelete_resume,
     ResumeNotFoundError,
 )
 from .job_service import (
     create_job,
     get_job,
     get_job_or_404,
+    get_job_with_description,
     get_jobs,
     update_job,
     delete_job,
+    acreate_job,
+    aget_job,
+    aget_job_with_description,
+    aget_jobs,
+    get_job_summaries,
+    aget_job_summaries,
+    adelete_job,
     JobNotFoundError,
 )
 from .match_service import (
     find_matching_jobs,
     find_matching_resumes,
+    find_matches_batch,
+    afind_matching_jobs,
+    afind_matching_resumes,
     MatchError,
 )
+from .embedding_worker import process_pending_embeddings, run_embedding_worker
+from .ingest_service import ingest_resume_files, BulkUploadError
+from .active_model import use_active_model, EmbeddingModelChangedError
+from .reembed_service import (
+    start_migration,
+    get_migration,
+    run_migration,
+    flip_migration,
+    cleanup_migration,
+    migration_progress,
+    ReembedError,
+)
+from .topk_service import (
+    rebuild_topk,
+    refresh_topk,
+    get_topk_jobs,
+    get_topk_resumes,
+    TopKNotFoundError,
+)
+from .index_service import (
+    stale_vector_indexes,
+    rebuild_vector_indexes,
+    IndexMaintenanceError,
+)
+from .warmup import warm_up
 
 __all__ = [
     "extract_text_from_pdf",
+    "extract_text_from_pdf_async",
     "PDFExtractionError",
+    "PDFTooLargeError",
     "get_embedding",
     "get_embeddings_batch",
+    "embed_documents",
+    "aget_embedding",
+    "aget_embeddings_batch",
+    "get_embedding_provider",
+    "set_embedding_provider",
+    "EmbeddingProvider",
+    "LocalEmbeddingProvider",
     "EmbeddingError",
     "create_resume",
     "get_resume",
     "get_resume_or_404",
+    "get_resume_with_preview",
     "get_resumes",
     "delete_resume",
     "regenerate_embedding",
+    "bulk_create_resumes",
+    "acreate_resume",
+    "aget_resume",
+    "aget_resume_with_preview",
+    "aget_resumes",
+    "get_resume_summaries",
+    "aget_resume_summaries",
+    "adelete_resume",
     "ResumeNotFoundError",
     "create_job",
     "get_job",
     "get_job_or_404",
+    "get_job_with_description",
     "get_jobs",
     "update_job",
     "delete_job",
+    "acreate_job",
+    "aget_job",
+    "aget_job_with_description",
+    "aget_jobs",
+    "get_job_summaries",
+    "aget_job_summaries",
+    "adelete_job",
     "JobNotFoundError",
     "find_matching_jobs",
     "find_matching_resumes",
+    "find_matches_batch",
+    "afind_matching_jobs",
+    "afind_matching_resumes",
     "MatchError",
-]
\ No newline at end of file
+    "process_pending_embeddings",
+    "run_embedding_worker",
+    "ingest_resume_files",
+    "BulkUploadError",
+    "use_active_model",
+    "EmbeddingModelChangedError",
+    "start_migration",
+    "get_migration",
+    "run_migration",
+    "flip_migration",
+    "cleanup_migration",
+    "migration_progress",
+    "ReembedError",
+    "rebuild_topk",
+    "refresh_topk",
+    "get_topk_jobs",
+    "get_topk_resumes",
+    "TopKNotFoundError",
+    "stale_vector_indexes",
+    "rebuild_vector_indexes",
+    "IndexMaintenanceError",
+    "warm_up",
+]
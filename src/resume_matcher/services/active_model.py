@@ -0,0 +1,179 @@
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.embedding_migration import EmbeddingMigration
+from ..models.status import MIGRATION_COMPLETED
+from .embedding_service import EmbeddingError
+from .match_cache import invalidate_matches
+from .vector_index import invalidate_index
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# (model, dimensions) that stored vectors are embedded with
+ActiveModel = Tuple[str, int]
+
+# Tables holding vectors of the active model, in lock order
+EMBEDDED_TABLES = ("resumes", "jobs", "resume_chunks", "job_chunks")
+
+# Attempts to embed a write when a flip switches models underneath it
+_EMBED_ATTEMPTS = 2
+
+
+class EmbeddingModelChangedError(EmbeddingError):
+    """Raised when the active embedding model keeps changing during a write."""
+    pass
+
+
+def get_active_model(db: Session) -> Optional[ActiveModel]:
+    """
+    Model of the stored vectors, from the last completed re-embedding migration.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (model, dimensions), or None if no migration completed and the
+        configured model is in use
+    """
+    migration = (
+        db.query(EmbeddingMigration)
+        .filter(EmbeddingMigration.status == MIGRATION_COMPLETED)
+        .order_by(EmbeddingMigration.id.desc())
+        .first()
+    )
+    if migration is None:
+        return None
+    return migration.target_model, migration.target_dimensions
+
+
+def _current_model() -> ActiveModel:
+    return settings.embedding_model, settings.embedding_dimensions
+
+
+def _switch_model(active: ActiveModel) -> None:
+    """Embed with ``active`` in this process from now on."""
+    model, dimensions = active
+    logger.warning(
+        f"Switching to embedding model {model} ({dimensions} dimensions) "
+        f"from {settings.embedding_model} ({settings.embedding_dimensions} dimensions)"
+    )
+    settings.embedding_model = model
+    settings.embedding_dimensions = dimensions
+    settings.embedding_request_dimensions = dimensions
+
+    # Cached vectors and scores come from the previous model
+    invalidate_index()
+    invalidate_matches()
+
+
+def use_active_model(db: Session) -> ActiveModel:
+    """
+    Switch this process to the active model if a flip changed it.
+
+    The database is the source of truth: a migration flipped by another
+    process overrides EMBEDDING_MODEL/EMBEDDING_DIMENSIONS here without a
+    restart. Writers call this before embedding.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (model, dimensions) to embed with
+    """
+    active = get_active_model(db)
+    if active is not None and active != _current_model():
+        _switch_model(active)
+    return _current_model()
+
+
+def load_active_model() -> None:
+    """
+    Startup hook for use_active_model with its own session.
+
+    A database that can't be read yet keeps the configured model.
+    """
+    from ..core.database import SessionLocal
+
+    try:
+        with SessionLocal() as db:
+            use_active_model(db)
+    except SQLAlchemyError as e:
+        logger.warning(f"Could not read the active embedding model: {e}")
+
+
+def lock_active_model(db: Session, used: ActiveModel) -> bool:
+    """
+    Check that vectors embedded with ``used`` may still be written.
+
+    On PostgreSQL the embedded tables are first locked in ROW EXCLUSIVE
+    mode, the lock the write itself takes, held until it commits.
+    flip_migration holds them exclusively from before it switches models
+    until it commits, so a flip either waits for this write (and then
+    re-embeds the row) or has committed already and is seen here.
+
+    Args:
+        db: Database session the vectors will be written in
+        used: Model the vectors were embedded with
+
+    Returns:
+        True if ``used`` is active; otherwise False, with this process
+        switched to the active model
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text(f"LOCK TABLE {', '.join(EMBEDDED_TABLES)} IN ROW EXCLUSIVE MODE"))
+
+    active = get_active_model(db)
+    if active is None or active == used:
+        return True
+
+    _switch_model(active)
+    return False
+
+
+def embed_with_active_model(db: Session, embed: Callable[[], T]) -> T:
+    """
+    Run ``embed`` with the active model and keep it active until commit.
+
+    The embedding is redone with the new model if a flip lands while it
+    runs. Call in the transaction that writes the vectors, right before
+    committing.
+
+    Args:
+        db: Database session the vectors will be written in
+        embed: Embeds with ``settings.embedding_model`` and returns the vectors
+
+    Returns:
+        What ``embed`` returned
+
+    Raises:
+        EmbeddingModelChangedError: If the model changed on every attempt
+    """
+    for _ in range(_EMBED_ATTEMPTS):
+        used = use_active_model(db)
+        result = embed()
+        if lock_active_model(db, used):
+            return result
+    raise EmbeddingModelChangedError("Embedding model changed while embedding; try again")
+
+
+async def aembed_with_active_model(
+        db: "AsyncSession",
+        embed: Callable[[], Awaitable[T]],
+) -> T:
+    """Async embed_with_active_model for the async request path."""
+    for _ in range(_EMBED_ATTEMPTS):
+        used = await db.run_sync(use_active_model)
+        result = await embed()
+        if await db.run_sync(lock_active_model, used):
+            return result
+    raise EmbeddingModelChangedError("Embedding model changed while embedding; try again")
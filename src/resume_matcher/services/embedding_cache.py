@@ -0,0 +1,187 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU: key -> float32 vector (compact compared to a list of floats)
+_lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_lock = threading.Lock()
+
+_stats = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+}
+
+
+def cache_key(
+        text: str,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> str:
+    """
+    Content-address a prepared text for an embedding model.
+
+    Args:
+        text: Text exactly as it will be sent to the embedding API
+        model: Model name (defaults to ``settings.embedding_model``)
+        dimensions: Vector size (defaults to ``settings.embedding_dimensions``)
+
+    Returns:
+        Hex SHA-256 digest of (model, dimensions, text)
+    """
+    digest = hashlib.sha256()
+    digest.update((model or settings.embedding_model).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(dimensions or settings.embedding_dimensions).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _remember(key: str, embedding: Iterable[float]) -> None:
+    with _lock:
+        _lru[key] = np.asarray(embedding, dtype=np.float32)
+        _lru.move_to_end(key)
+        while len(_lru) > settings.embedding_cache_size:
+            _lru.popitem(last=False)
+
+
+def lookup_embeddings(
+        keys: List[str],
+        db: Optional[Session] = None,
+) -> Dict[str, List[float]]:
+    """
+    Look up cached embeddings, memory first, then the embedding_cache table.
+
+    Args:
+        keys: Cache keys from cache_key()
+        db: Optional database session for the persistent cache
+
+    Returns:
+        Mapping of key -> embedding for every key that was found
+    """
+    if not settings.embedding_cache_enabled or not keys:
+        return {}
+
+    found: Dict[str, List[float]] = {}
+    with _lock:
+        for key in keys:
+            vector = _lru.get(key)
+            if vector is not None:
+                _lru.move_to_end(key)
+                found[key] = vector.tolist()
+        _stats["memory_hits"] += len(found)
+
+    missing = [key for key in dict.fromkeys(keys) if key not in found]
+
+    if missing and db is not None and settings.embedding_cache_persistent:
+        try:
+            with db.begin_nested():
+                rows = (
+                    db.query(EmbeddingCache.key, EmbeddingCache.embedding)
+                    .filter(EmbeddingCache.key.in_(missing))
+                    .all()
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            rows = []
+
+        for row in rows:
+            embedding = list(row.embedding)
+            found[row.key] = embedding
+            _remember(row.key, embedding)
+
+        with _lock:
+            _stats["db_hits"] += len(rows)
+
+    with _lock:
+        _stats["misses"] += len([key for key in missing if key not in found])
+
+    return found
+
+
+def store_embeddings(
+        entries: Dict[str, List[float]],
+        db: Optional[Session] = None,
+        model: Optional[str] = None,
+) -> None:
+    """
+    Cache freshly generated embeddings.
+
+    Rows are added to the caller's transaction and persist when it commits.
+    Concurrent writers of the same key are resolved with ON CONFLICT DO
+    NOTHING, and cache failures never fail the caller.
+
+    Args:
+        entries: Mapping of cache key -> embedding
+        db: Optional database session for the persistent cache
+        model: Model that produced the embeddings (defaults to
+            ``settings.embedding_model``)
+    """
+    if not settings.embedding_cache_enabled or not entries:
+        return
+
+    for key, embedding in entries.items():
+        _remember(key, embedding)
+
+    if db is None or not settings.embedding_cache_persistent:
+        return
+
+    rows = [
+        {
+            "key": key,
+            "model": model or settings.embedding_model,
+            "dimensions": len(embedding),
+            "embedding": embedding,
+        }
+        for key, embedding in entries.items()
+    ]
+
+    dialect = db.get_bind().dialect.name
+    statement: Union[postgresql.Insert, sqlite.Insert]
+    if dialect == "postgresql":
+        statement = postgresql.insert(EmbeddingCache).on_conflict_do_nothing(index_elements=["key"])
+    elif dialect == "sqlite":
+        statement = sqlite.insert(EmbeddingCache).on_conflict_do_nothing(index_elements=["key"])
+    else:
+        logger.debug(f"Persistent embedding cache not supported on {dialect}")
+        return
+
+    try:
+        with db.begin_nested():
+            db.execute(statement.values(rows))
+    except SQLAlchemyError as e:
+        logger.warning(f"Embedding cache write failed: {e}")
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss counters for the embedding cache since process start."""
+    with _lock:
+        stats: Dict[str, float] = dict(_stats)
+        stats["memory_entries"] = len(_lru)
+
+    lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+    stats["hit_rate"] = (
+        (stats["memory_hits"] + stats["db_hits"]) / lookups if lookups else 0.0
+    )
+    return stats
+
+
+def clear_cache() -> None:
+    """Empty the in-process LRU and reset counters (persistent rows are kept)."""
+    with _lock:
+        _lru.clear()
+        for name in _stats:
+            _stats[name] = 0
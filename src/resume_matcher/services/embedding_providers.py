@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingProvider(ABC):
+    """
+    Backend that turns prepared texts into embedding vectors.
+
+    Caching, truncation, request packing and chunking stay in
+    embedding_service; a provider only embeds the texts it is given.
+    Subclasses implement ``embed`` and may override ``aembed`` with a
+    native async path.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def embed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """
+        Embed texts in one call.
+
+        Args:
+            texts: Prepared texts
+            model: Model name (defaults to ``settings.embedding_model``)
+            dimensions: Requested vector size (model default if not given)
+
+        Returns:
+            Embedding vectors in input order
+        """
+
+    async def aembed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Async embed; runs ``embed`` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.embed, texts, model, dimensions)
+
+    def warm_up(self) -> None:
+        """Create clients or load models ahead of the first request."""
+
+
+class _EncodeRequest(NamedTuple):
+    texts: List[str]
+    options: Tuple[str, Optional[int]]  # (model, dimensions)
+    future: Future
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    Embeds on this machine with sentence-transformers (PyTorch, or ONNX
+    Runtime / OpenVINO for quantised models), so no API calls are made.
+
+    Inference runs on one background thread. Requests that arrive while it
+    is busy are queued and encoded together in the next model call (up to
+    ``max_batch`` texts), so concurrent callers share batches instead of
+    contending for the CPU one text at a time.
+    """
+
+    name = "local"
+
+    def __init__(
+            self,
+            default_model: str,
+            backend: str = "torch",
+            model_file: Optional[str] = None,
+            device: str = "cpu",
+            max_batch: int = 64,
+    ):
+        self.default_model = default_model
+        self.backend = backend
+        self.model_file = model_file
+        self.device = device
+        self.max_batch = max_batch
+
+        self._models: Dict[str, object] = {}
+        self._queue: "queue.Queue[_EncodeRequest]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _load(self, model: str):
+        """Load a sentence-transformers model on first use (worker thread only)."""
+        if model not in self._models:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise RuntimeError(
+                    "EMBEDDING_PROVIDER=local needs the 'local' extra: "
+                    "pip install 'resume-matcher[local]'"
+                )
+
+            model_kwargs = {"file_name": self.model_file} if self.model_file else None
+            self._models[model] = SentenceTransformer(
+                model,
+                device=self.device,
+                backend=self.backend,
+                model_kwargs=model_kwargs,
+            )
+            logger.info(f"Loaded local embedding model {model} ({self.backend} on {self.device})")
+        return self._models[model]
+
+    def _encode(self, texts: List[str], model: str, dimensions: Optional[int]) -> List[List[float]]:
+        vectors = self._load(model).encode(
+            texts,
+            batch_size=self.max_batch,
+            normalize_embeddings=True,
+            truncate_dim=dimensions,
+            convert_to_numpy=True,
+        )
+        return vectors.tolist()
+
+    def _run(self, batch: List[_EncodeRequest]) -> None:
+        model, dimensions = batch[0].options
+        texts = [text for request in batch for text in request.texts]
+        try:
+            vectors = self._encode(texts, model, dimensions)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            request.future.set_result(vectors[offset:offset + len(request.texts)])
+            offset += len(request.texts)
+
+    def _work(self) -> None:
+        carry: Optional[_EncodeRequest] = None
+        while True:
+            first = carry or self._queue.get()
+            carry = None
+            batch, size = [first], len(first.texts)
+
+            # Everything already waiting joins this model call
+            while size < self.max_batch:
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request.options != first.options:
+                    carry = request  # Different model: next call
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._run(batch)
+
+    def submit(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> Future:
+        """Queue texts for the inference thread; the future resolves to their vectors."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._work, name="local-embeddings", daemon=True
+                )
+                self._worker.start()
+
+        request = _EncodeRequest(list(texts), (model or self.default_model, dimensions), Future())
+        self._queue.put(request)
+        return request.future
+
+    def embed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        return self.submit(texts, model, dimensions).result()
+
+    def warm_up(self) -> None:
+        # Loads the model on the inference thread and runs it once
+        self.embed(["warm-up"])
+
+    async def aembed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        return await asyncio.wrap_future(self.submit(texts, model, dimensions))
@@ -1,13 +1,60 @@
+import asyncio
 import logging
-from typing import List, Optional
-import openai
+import random
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
 
 from ..core.config import settings
+from ..core.metrics import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_REQUEST_SECONDS,
+    EMBEDDING_REQUEST_TOKENS,
+    EMBEDDING_RETRIES,
+    METRICS_ENABLED,
+    observe_seconds,
+)
+from .embedding_cache import cache_key, lookup_embeddings, store_embeddings
+from .embedding_providers import EmbeddingProvider, LocalEmbeddingProvider
+from .micro_batcher import MicroBatcher
+from .tokenizer import count_tokens, split_into_chunks, truncate_to_tokens
+
+if TYPE_CHECKING:
+    import openai
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+# OpenAI client, created on first use so a local-only deployment never needs a key
+client: Optional["openai.OpenAI"] = None
+
+# AsyncOpenAI client for the async request path, created on first use
+_async_client: Optional["openai.AsyncOpenAI"] = None
+
+# Active embedding provider, chosen from settings on first use
+_provider: Optional[EmbeddingProvider] = None
+
+# Coalesces concurrent get_embedding cache misses, created on first use
+_batcher: Optional[MicroBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def _retryable_errors() -> tuple:
+    """Errors worth retrying: the same request can succeed a moment later."""
+    import openai
+
+    return (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
 
 
 class EmbeddingError(Exception):
@@ -15,12 +62,39 @@ class EmbeddingError(Exception):
     pass
 
 
-def get_embedding(text: str) -> List[float]:
+def prepare_text(text: str) -> str:
+    """
+    Normalise and truncate text before embedding.
+
+    The result is exactly what is sent to the API, so it is also what the
+    embedding cache is keyed on.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Text ready for embedding
+    """
+    text = unicodedata.normalize("NFC", text).strip()
+
+    # Truncate to the model's input limit, counted in tokens
+    truncated = truncate_to_tokens(text, settings.embedding_max_tokens)
+    if len(truncated) < len(text):
+        logger.warning(
+            f"Text truncated from {len(text)} to {len(truncated)} chars "
+            f"({settings.embedding_max_tokens} tokens)"
+        )
+
+    return truncated
+
+
+def get_embedding(text: str, db: Optional[Session] = None) -> List[float]:
     """
     Generate embedding for a single text.
 
     Args:
         text: Text to embed
+        db: Optional database session used for the persistent embedding cache
 
     Returns:
         List of floats representing the embedding vector
@@ -28,36 +102,379 @@ def get_embedding(text: str) -> List[float]:
     Raises:
         EmbeddingError: If embedding generation fails
     """
-    try:
-        # Truncate text if too long (OpenAI has ~8k token limit)
-        # Roughly 4 chars per token, so ~32k chars max
-        max_chars = 30000
-        if len(text) > max_chars:
-            logger.warning(f"Text truncated from {len(text)} to {max_chars} chars")
-            text = text[:max_chars]
-
-        response = client.embeddings.create(
-            model=settings.embedding_model,
-            input=text,
+    text = prepare_text(text)
+    key = cache_key(text)
+
+    cached = lookup_embeddings([key], db)
+    if key in cached:
+        return cached[key]
+
+    if settings.embedding_microbatch_enabled:
+        future = _get_batcher().submit(text)
+        try:
+            embedding = future.result(timeout=_microbatch_timeout())
+        except FutureTimeoutError:
+            future.cancel()
+            raise EmbeddingError("Timed out waiting for a micro-batched embedding")
+    else:
+        embedding = _request_embeddings([text])[0]
+    logger.info(f"Generated embedding with {len(embedding)} dimensions")
+
+    store_embeddings({key: embedding}, db)
+    return embedding
+
+
+def get_client() -> "openai.OpenAI":
+    """
+    Get the shared OpenAI client, creating it on first use.
+
+    The openai package itself is imported here rather than at module import,
+    since it dominates the package's import time.
+    """
+    global client
+    if client is None:
+        import openai
+
+        client = openai.OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.embedding_request_timeout_seconds,
         )
+    return client
 
-        embedding = response.data[0].embedding
-        logger.info(f"Generated embedding with {len(embedding)} dimensions")
 
-        return embedding
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """
+    Embeds through the OpenAI embeddings API.
 
-    except openai.APIError as e:
-        raise EmbeddingError(f"OpenAI API error: {e}")
-    except Exception as e:
-        raise EmbeddingError(f"Failed to generate embedding: {e}")
+    Rate limits, timeouts, connection errors and 5xx responses are retried
+    up to ``settings.embedding_max_retries`` times with exponential backoff
+    and jitter; other errors fail immediately.
+    """
 
+    name = "openai"
+
+    def embed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        import openai
+
+        options: Dict[str, Any] = {"dimensions": dimensions} if dimensions else {}
+        for attempt in range(settings.embedding_max_retries + 1):
+            try:
+                response = get_client().embeddings.create(
+                    model=model or settings.embedding_model,
+                    input=texts,
+                    **options,
+                )
+                # Sort by index to maintain order
+                return [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
+
+            except _retryable_errors() as e:
+                time.sleep(_retry_delay(attempt, len(texts), e))
+            except openai.APIError as e:
+                raise EmbeddingError(f"OpenAI API error: {e}")
+            except Exception as e:
+                raise EmbeddingError(f"Failed to generate embeddings: {e}")
+
+        raise EmbeddingError("Failed to generate embeddings")
+
+    async def aembed(
+            self,
+            texts: List[str],
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+    ) -> List[List[float]]:
+        import openai
+
+        options: Dict[str, Any] = {"dimensions": dimensions} if dimensions else {}
+        for attempt in range(settings.embedding_max_retries + 1):
+            try:
+                response = await get_async_client().embeddings.create(
+                    model=model or settings.embedding_model,
+                    input=texts,
+                    **options,
+                )
+                return [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
+
+            except _retryable_errors() as e:
+                await asyncio.sleep(_retry_delay(attempt, len(texts), e))
+            except openai.APIError as e:
+                raise EmbeddingError(f"OpenAI API error: {e}")
+            except Exception as e:
+                raise EmbeddingError(f"Failed to generate embeddings: {e}")
+
+        raise EmbeddingError("Failed to generate embeddings")
+
+    def warm_up(self) -> None:
+        if settings.async_mode:
+            get_async_client()
+        else:
+            get_client()
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """
+    Get the active embedding provider, creating it on first use.
 
-def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    ``settings.embedding_provider`` selects "openai" (the embeddings API)
+    or "local" (sentence-transformers on this machine, see
+    LocalEmbeddingProvider).
+
+    Raises:
+        EmbeddingError: If the configured provider is unknown
+    """
+    global _provider
+    if _provider is None:
+        if settings.embedding_provider == "openai":
+            _provider = OpenAIEmbeddingProvider()
+        elif settings.embedding_provider == "local":
+            _provider = LocalEmbeddingProvider(
+                default_model=settings.embedding_model,
+                backend=settings.local_embedding_backend,
+                model_file=settings.local_embedding_model_file,
+                device=settings.local_embedding_device,
+                max_batch=settings.local_embedding_max_batch,
+            )
+        else:
+            raise EmbeddingError(f"Unknown embedding provider: {settings.embedding_provider}")
+        logger.info(f"Using {_provider.name} embedding provider")
+    return _provider
+
+
+def set_embedding_provider(provider: Optional[EmbeddingProvider]) -> None:
+    """Replace the active embedding provider (None re-reads it from settings)."""
+    global _provider
+    _provider = provider
+
+
+def _get_batcher() -> MicroBatcher:
+    """
+    Get the shared micro-batcher for single-text embeddings.
+
+    Concurrent get_embedding misses (e.g. simultaneous uploads) are
+    collected for up to ``settings.embedding_microbatch_max_wait_ms`` or
+    ``settings.embedding_microbatch_max_size`` texts and embedded together
+    instead of one request each.
+    """
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = MicroBatcher(
+                _embed_microbatch,
+                max_batch_size=settings.embedding_microbatch_max_size,
+                max_wait_seconds=settings.embedding_microbatch_max_wait_ms / 1000,
+                max_concurrency=settings.embedding_request_concurrency,
+                name="embedding-batcher",
+            )
+    return _batcher
+
+
+def _microbatch_timeout() -> float:
+    """
+    How long get_embedding waits on its micro-batch before giving up.
+
+    Covers the batch filling, every attempt running into the request
+    timeout and the longest backoffs between them, so it only fires when
+    a batch is lost rather than slow.
+    """
+    retries = settings.embedding_max_retries
+    backoff = 1.5 * settings.embedding_retry_base_seconds * (2 ** retries - 1)
+    return (
+        settings.embedding_microbatch_max_wait_ms / 1000
+        + (retries + 1) * settings.embedding_request_timeout_seconds
+        + backoff
+    )
+
+
+def _request_embeddings(
+        texts: List[str],
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> List[List[float]]:
     """
-    Generate embeddings for multiple texts in one API call.
+    Embed one packed request with the active provider.
+
+    Args:
+        texts: Prepared texts (within the per-request budgets)
+        model: Model name (defaults to ``settings.embedding_model``)
+        dimensions: Requested vector size (model default if not given)
+
+    Returns:
+        Embedding vectors in input order
+
+    Raises:
+        EmbeddingError: If the request fails
+    """
+    model, dimensions = _request_options(model, dimensions)
+    provider = get_embedding_provider()
+    _observe_request_size(provider, texts)
+    with observe_seconds(EMBEDDING_REQUEST_SECONDS, provider=provider.name, outcome="error") as labels:
+        try:
+            vectors = provider.embed(texts, model, dimensions)
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate embeddings: {e}")
+        labels["outcome"] = "ok"
+    return vectors
+
+
+def _request_options(
+        model: Optional[str],
+        dimensions: Optional[int],
+) -> Tuple[str, Optional[int]]:
+    """(model, dimensions) for a request, defaulting to the active model."""
+    if model is None:
+        return settings.embedding_model, dimensions or settings.embedding_request_dimensions
+    return model, dimensions
+
+
+def _observe_request_size(provider: EmbeddingProvider, texts: List[str]) -> None:
+    EMBEDDING_BATCH_SIZE.labels(provider.name).observe(len(texts))
+    if METRICS_ENABLED:
+        EMBEDDING_REQUEST_TOKENS.labels(provider.name).observe(
+            sum(count_tokens(text) for text in texts)
+        )
+
+
+def _retry_delay(attempt: int, count: int, error: Exception) -> float:
+    """Backoff before retrying a failed request, or raise once retries run out."""
+    if attempt == settings.embedding_max_retries:
+        raise EmbeddingError(f"OpenAI API error after {attempt + 1} attempts: {error}")
+    EMBEDDING_RETRIES.labels(type(error).__name__).inc()
+    delay = settings.embedding_retry_base_seconds * 2 ** attempt
+    delay += random.uniform(0, delay / 2)
+    logger.warning(
+        f"Embedding request for {count} texts failed ({error}); "
+        f"retrying in {delay:.1f}s"
+    )
+    return delay
+
+
+def _try_request(
+        texts: List[str],
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> Tuple[Optional[List[List[float]]], Optional[EmbeddingError]]:
+    """Run one request, returning (vectors, None) or (None, error)."""
+    try:
+        return _request_embeddings(texts, model, dimensions), None
+    except EmbeddingError as e:
+        return None, e
+
+
+def pack_requests(
+        texts: List[str],
+        max_items: int,
+        max_tokens: int,
+) -> List[List[int]]:
+    """
+    Group texts into requests bounded by item count and total tokens.
+
+    Args:
+        texts: Prepared texts
+        max_items: Maximum inputs per request
+        max_tokens: Maximum total tokens per request
+
+    Returns:
+        Lists of indices into ``texts``, one list per request
+    """
+    requests: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, text in enumerate(texts):
+        tokens = count_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            requests.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        requests.append(current)
+    return requests
+
+
+def _send_requests(
+        texts: List[str],
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> Tuple[List[Optional[List[float]]], List[EmbeddingError], int]:
+    """
+    Pack prepared, uncached texts into requests and send them concurrently.
+
+    Returns:
+        (vector per text, None where its request failed; request errors;
+        number of requests)
+    """
+    requests = pack_requests(
+        texts,
+        settings.embedding_request_max_items,
+        settings.embedding_request_max_tokens,
+    )
+    request_texts = [[texts[i] for i in indices] for indices in requests]
+
+    run = partial(_try_request, model=model, dimensions=dimensions)
+    workers = min(settings.embedding_request_concurrency, len(requests))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(run, request_texts))
+    else:
+        outcomes = [run(batch) for batch in request_texts]
+
+    vectors: List[Optional[List[float]]] = [None] * len(texts)
+    errors = []
+    for indices, (request_vectors, error) in zip(requests, outcomes):
+        if error is not None:
+            errors.append(error)
+            continue
+        for index, vector in zip(indices, request_vectors or []):
+            vectors[index] = vector
+
+    return vectors, errors, len(requests)
+
+
+def _embed_microbatch(texts: List[str]) -> List:
+    """
+    Micro-batcher handler: embed the prepared cache misses of concurrent
+    get_embedding calls, deduplicated, with the same request packing as
+    get_embeddings_batch.
+
+    Returns:
+        A vector per text, or the EmbeddingError of the request it was in
+    """
+    unique = list(dict.fromkeys(texts))
+    vectors, errors, requests = _send_requests(unique)
+
+    error = EmbeddingError(f"Failed to generate embeddings: {errors[0]}") if errors else None
+    by_text = {text: vector for text, vector in zip(unique, vectors)}
+    logger.info(f"Micro-batched {len(texts)} embeddings into {requests} requests")
+    return [by_text[text] if by_text[text] is not None else error for text in texts]
+
+
+def get_embeddings_batch(
+        texts: List[str],
+        db: Optional[Session] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> List[List[float]]:
+    """
+    Generate embeddings for multiple texts.
+
+    Texts already in the embedding cache (and duplicates within the batch)
+    are not sent to the API. The rest are packed into requests bounded by
+    ``settings.embedding_request_max_items`` and
+    ``settings.embedding_request_max_tokens``, which run concurrently (up to
+    ``settings.embedding_request_concurrency``) and retry independently.
 
     Args:
         texts: List of texts to embed
+        db: Optional database session used for the persistent embedding cache
+        model: Model to embed with (defaults to ``settings.embedding_model``),
+            e.g. the target of a re-embedding migration
+        dimensions: Requested vector size for ``model``
 
     Returns:
         List of embedding vectors
@@ -65,32 +482,290 @@ def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
     Raises:
         EmbeddingError: If embedding generation fails
     """
-    try:
-        # Truncate each text
-        max_chars = 30000
-        processed_texts = []
-        for text in texts:
-            if len(text) > max_chars:
-                text = text[:max_chars]
-            processed_texts.append(text)
-
-        response = client.embeddings.create(
-            model=settings.embedding_model,
-            input=processed_texts,
+    processed_texts = [prepare_text(text) for text in texts]
+    keys = [cache_key(text, model, dimensions) for text in processed_texts]
+
+    embeddings_by_key = lookup_embeddings(keys, db)
+    pending = {
+        key: text
+        for key, text in zip(keys, processed_texts)
+        if key not in embeddings_by_key
+    }
+
+    requests = 0
+    if pending:
+        pending_keys = list(pending.keys())
+        vectors, errors, requests = _send_requests(list(pending.values()), model, dimensions)
+        generated = {
+            key: vector for key, vector in zip(pending_keys, vectors) if vector is not None
+        }
+
+        # Keep what succeeded so a retry of the batch only pays for the rest
+        store_embeddings(generated, db, model=model)
+        embeddings_by_key.update(generated)
+
+        if errors:
+            raise EmbeddingError(
+                f"{len(errors)} of {requests} embedding requests failed: {errors[0]}"
+            )
+
+    logger.info(
+        f"Generated {len(pending)} embeddings in {requests} requests "
+        f"({len(texts) - len(pending)} served from cache)"
+    )
+
+    return [embeddings_by_key[key] for key in keys]
+
+
+class DocumentEmbedding(NamedTuple):
+    """A document's pooled vector plus its (chunk text, vector) pairs."""
+    embedding: List[float]
+    chunks: List[Tuple[str, List[float]]]
+
+
+def _pool(chunk_texts: List[str], vectors: List[List[float]]) -> List[float]:
+    """Length-weighted mean of unit chunk vectors, re-normalised."""
+    weights = np.asarray([len(text) for text in chunk_texts], dtype=np.float32)
+    pooled = np.average(np.asarray(vectors, dtype=np.float32), axis=0, weights=weights)
+    norm = np.linalg.norm(pooled)
+    if norm:
+        pooled /= norm
+    return pooled.tolist()
+
+
+def embed_documents(
+        texts: List[str],
+        db: Optional[Session] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+) -> List[DocumentEmbedding]:
+    """
+    Embed whole documents, chunking long ones when enabled.
+
+    With ``settings.embedding_chunking`` each document is split into
+    overlapping chunks of ``settings.embedding_chunk_tokens`` tokens, all
+    chunks of all documents are embedded in one batched call, and each
+    document gets a pooled vector. Single-chunk documents embed exactly as
+    in unchunked mode (same text, same cache entry) and carry no chunks.
+
+    Args:
+        texts: Document texts
+        db: Optional database session used for the persistent embedding cache
+        model: Model to embed with (defaults to ``settings.embedding_model``)
+        dimensions: Requested vector size for ``model``
+
+    Returns:
+        One DocumentEmbedding per text, in input order
+
+    Raises:
+        EmbeddingError: If embedding generation fails
+    """
+    if not settings.embedding_chunking:
+        return [
+            DocumentEmbedding(embedding, [])
+            for embedding in get_embeddings_batch(texts, db=db, model=model, dimensions=dimensions)
+        ]
+
+    chunked = _split_documents(texts)
+    vectors = get_embeddings_batch(
+        [chunk for chunks in chunked for chunk in chunks],
+        db=db,
+        model=model,
+        dimensions=dimensions,
+    )
+    return _assemble_documents(chunked, vectors)
+
+
+def _split_documents(texts: List[str]) -> List[List[str]]:
+    return [
+        split_into_chunks(
+            unicodedata.normalize("NFC", text).strip(),
+            settings.embedding_chunk_tokens,
+            settings.embedding_chunk_overlap,
+            max_chunks=settings.embedding_max_chunks,
         )
+        for text in texts
+    ]
+
+
+def _assemble_documents(
+        chunked: List[List[str]],
+        vectors: List[List[float]],
+) -> List[DocumentEmbedding]:
+    """Regroup flat chunk vectors per document and pool multi-chunk ones."""
+    documents = []
+    offset = 0
+    for chunks in chunked:
+        chunk_vectors = vectors[offset:offset + len(chunks)]
+        offset += len(chunks)
+        if len(chunks) == 1:
+            documents.append(DocumentEmbedding(chunk_vectors[0], []))
+        else:
+            documents.append(DocumentEmbedding(
+                _pool(chunks, chunk_vectors),
+                list(zip(chunks, chunk_vectors)),
+            ))
+
+    return documents
+
+
+def get_async_client() -> "openai.AsyncOpenAI":
+    """
+    Get the shared AsyncOpenAI client, creating it on first use.
 
-        # Sort by index to maintain order
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        embeddings = [item.embedding for item in sorted_data]
+    All async requests share one connection pool (HTTP/2 when the ``h2``
+    package is installed, so many requests multiplex over few connections),
+    capped at ``settings.openai_max_connections``.
+    """
+    global _async_client
+    if _async_client is None:
+        import openai
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        _async_client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.embedding_request_timeout_seconds,
+            http_client=openai.DefaultAsyncHttpxClient(
+                http2=http2,
+                # Limits from the httpx package openai's client is built on
+                limits=type(openai.DEFAULT_CONNECTION_LIMITS)(
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=settings.openai_max_connections,
+                ),
+            ),
+        )
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the AsyncOpenAI client's connections, if it was created."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+
+async def _arequest_embeddings(texts: List[str]) -> List[List[float]]:
+    """Async _request_embeddings."""
+    model, dimensions = _request_options(None, None)
+    provider = get_embedding_provider()
+    _observe_request_size(provider, texts)
+    with observe_seconds(EMBEDDING_REQUEST_SECONDS, provider=provider.name, outcome="error") as labels:
+        try:
+            vectors = await provider.aembed(texts, model, dimensions)
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            raise EmbeddingError(f"Failed to generate embeddings: {e}")
+        labels["outcome"] = "ok"
+    return vectors
+
+
+async def aget_embeddings_batch(
+        texts: List[str],
+        db: Optional["AsyncSession"] = None,
+) -> List[List[float]]:
+    """
+    Async get_embeddings_batch for the async request path.
 
-        logger.info(f"Generated {len(embeddings)} embeddings in batch")
+    Requests are packed the same way and run concurrently on the event loop
+    (bounded by ``settings.embedding_request_concurrency``); cache reads and
+    writes go through ``db.run_sync``.
 
-        return embeddings
+    Args:
+        texts: List of texts to embed
+        db: Optional AsyncSession used for the persistent embedding cache
 
-    except openai.APIError as e:
-        raise EmbeddingError(f"OpenAI API error: {e}")
-    except Exception as e:
-        raise EmbeddingError(f"Failed to generate embeddings: {e}")
+    Returns:
+        List of embedding vectors
+
+    Raises:
+        EmbeddingError: If embedding generation fails
+    """
+    processed_texts = [prepare_text(text) for text in texts]
+    keys = [cache_key(text) for text in processed_texts]
+
+    if db is not None:
+        embeddings_by_key = await db.run_sync(lambda session: lookup_embeddings(keys, session))
+    else:
+        embeddings_by_key = lookup_embeddings(keys)
+
+    pending = {
+        key: text
+        for key, text in zip(keys, processed_texts)
+        if key not in embeddings_by_key
+    }
+    if not pending:
+        return [embeddings_by_key[key] for key in keys]
+
+    pending_keys = list(pending.keys())
+    pending_texts = list(pending.values())
+    requests = pack_requests(
+        pending_texts,
+        settings.embedding_request_max_items,
+        settings.embedding_request_max_tokens,
+    )
+    semaphore = asyncio.Semaphore(settings.embedding_request_concurrency)
+
+    async def run(indices: List[int]) -> List[List[float]]:
+        async with semaphore:
+            return await _arequest_embeddings([pending_texts[i] for i in indices])
+
+    outcomes = await asyncio.gather(*(run(indices) for indices in requests), return_exceptions=True)
+
+    generated: Dict[str, List[float]] = {}
+    errors = []
+    for indices, outcome in zip(requests, outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append(outcome)
+            continue
+        for index, vector in zip(indices, outcome):
+            generated[pending_keys[index]] = vector
+
+    if db is not None:
+        await db.run_sync(lambda session: store_embeddings(generated, session))
+    else:
+        store_embeddings(generated)
+    embeddings_by_key.update(generated)
+
+    if errors:
+        if not isinstance(errors[0], EmbeddingError):
+            raise errors[0]
+        raise EmbeddingError(
+            f"{len(errors)} of {len(requests)} embedding requests failed: {errors[0]}"
+        )
+
+    logger.info(
+        f"Generated {len(pending)} embeddings in {len(requests)} async requests "
+        f"({len(texts) - len(pending)} served from cache)"
+    )
+    return [embeddings_by_key[key] for key in keys]
+
+
+async def aget_embedding(text: str, db: Optional["AsyncSession"] = None) -> List[float]:
+    """Async get_embedding for the async request path."""
+    return (await aget_embeddings_batch([text], db=db))[0]
+
+
+async def aembed_documents(
+        texts: List[str],
+        db: Optional["AsyncSession"] = None,
+) -> List[DocumentEmbedding]:
+    """Async embed_documents for the async request path."""
+    if not settings.embedding_chunking:
+        return [
+            DocumentEmbedding(embedding, [])
+            for embedding in await aget_embeddings_batch(texts, db=db)
+        ]
+
+    chunked = _split_documents(texts)
+    vectors = await aget_embeddings_batch([chunk for chunks in chunked for chunk in chunks], db=db)
+    return _assemble_documents(chunked, vectors)
 
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
@@ -104,19 +779,14 @@ def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> fl
     Returns:
         Similarity score between 0 and 1
     """
-    import math
-
-    # Dot product
-    dot_product = sum(a * b for a, b in zip(embedding1, embedding2))
-
-    # Magnitudes
-    magnitude1 = math.sqrt(sum(a * a for a in embedding1))
-    magnitude2 = math.sqrt(sum(b * b for b in embedding2))
+    a = np.asarray(embedding1, dtype=np.float64)
+    b = np.asarray(embedding2, dtype=np.float64)
 
-    if magnitude1 == 0 or magnitude2 == 0:
+    magnitude = np.linalg.norm(a) * np.linalg.norm(b)
+    if magnitude == 0:
         return 0.0
 
-    similarity = dot_product / (magnitude1 * magnitude2)
+    similarity = float(np.dot(a, b) / magnitude)
 
     # Clamp to [0, 1] (cosine similarity for normalized vectors)
-    return max(0.0, min(1.0, similarity))
\ No newline at end of file
+    return max(0.0, min(1.0, similarity))
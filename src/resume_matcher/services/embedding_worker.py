@@ -0,0 +1,261 @@
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Type
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, undefer
+
+from ..core.config import settings
+from ..core.metrics import track_operation
+from ..models.job import Job
+from ..models.resume import Resume
+from ..models.chunk import ResumeChunk, JobChunk
+from ..models.status import EMBEDDING_PENDING, EMBEDDING_READY, EMBEDDING_FAILED
+from .embedding_service import (
+    get_embedding,
+    get_embeddings_batch,
+    embed_documents,
+    DocumentEmbedding,
+    EmbeddingError,
+)
+from .active_model import embed_with_active_model
+from .job_service import job_embedding_text, jobs_written
+from .resume_service import resumes_written
+
+logger = logging.getLogger(__name__)
+
+
+class _Claimed(NamedTuple):
+    """A pending row claimed by this worker, detached from the session."""
+    model: Type[Any]  # Resume or Job
+    id: int
+    text: str
+
+
+def _claim_pending(
+        db: Session,
+        model: Type[Any],
+        limit: int,
+        text_column: Any,
+        lease: datetime,
+) -> List[_Claimed]:
+    """
+    Lease a batch of pending rows to this worker.
+
+    Rows not claimed yet, or whose lease expired, are stamped with
+    ``lease``. SKIP LOCKED lets several workers claim concurrently without
+    picking up the same rows; the row locks last only until the caller
+    commits the claim, not while the rows are embedded. The deferred text
+    column is loaded with the rows since every one of them is about to be
+    embedded.
+    """
+    expired = lease - timedelta(seconds=settings.embedding_worker_lease_seconds)
+    rows = (
+        db.query(model)
+        .options(undefer(text_column))
+        .filter(
+            model.embedding_status == EMBEDDING_PENDING,
+            or_(model.embedding_claimed_at.is_(None), model.embedding_claimed_at < expired),
+        )
+        .order_by(model.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for row in rows:
+        row.embedding_claimed_at = lease
+    return [_Claimed(model, row.id, _embedding_text(row)) for row in rows]
+
+
+def _embedding_text(row) -> str:
+    if isinstance(row, Job):
+        return job_embedding_text(row)
+    return row.raw_text
+
+
+def _embed_texts(texts: List[str], db: Session) -> List[DocumentEmbedding]:
+    if settings.embedding_chunking:
+        return embed_documents(texts, db=db)
+    return [DocumentEmbedding(embedding, []) for embedding in get_embeddings_batch(texts, db=db)]
+
+
+def _embed_text(text: str, db: Session) -> DocumentEmbedding:
+    if settings.embedding_chunking:
+        return embed_documents([text], db=db)[0]
+    return DocumentEmbedding(get_embedding(text, db=db), [])
+
+
+def _claimed_documents(
+        db: Session,
+        claimed: List[_Claimed],
+) -> Sequence[Optional[DocumentEmbedding]]:
+    """Embed claimed rows with one batched call, falling back to one call per row."""
+    texts = [row.text for row in claimed]
+
+    try:
+        return _embed_texts(texts, db)
+    except EmbeddingError as e:
+        logger.warning(f"Batch of {len(claimed)} embeddings failed, retrying individually: {e}")
+
+    documents: List[Optional[DocumentEmbedding]] = []
+    for row in claimed:
+        try:
+            documents.append(_embed_text(row.text, db))
+        except EmbeddingError as row_error:
+            logger.error(f"Failed to embed {row.model.__name__} {row.id}: {row_error}")
+            documents.append(None)
+    return documents
+
+
+def _store_documents(
+        db: Session,
+        model: Type[Any],
+        documents: Dict[int, Optional[DocumentEmbedding]],
+        lease: datetime,
+) -> List[int]:
+    """
+    Write the vectors of rows still leased to this worker.
+
+    A row whose text changed while it was embedded had its lease cleared
+    (and may have been claimed again), and one embedded synchronously since
+    is no longer pending; either way the vector here is stale and dropped.
+
+    Returns:
+        Ids of the rows written
+    """
+    if not documents:
+        return []
+
+    rows = (
+        db.query(model)
+        .filter(
+            model.id.in_(documents),
+            model.embedding_status == EMBEDDING_PENDING,
+            model.embedding_claimed_at == lease,
+        )
+        .with_for_update()
+        .all()
+    )
+    for row in rows:
+        row.embedding_claimed_at = None
+        document = documents[row.id]
+        if document is None:
+            row.embedding_status = EMBEDDING_FAILED
+            continue
+
+        row.embedding = document.embedding
+        row.embedding_status = EMBEDDING_READY
+        if settings.embedding_chunking:
+            chunk_model = JobChunk if model is Job else ResumeChunk
+            row.chunks = [
+                chunk_model(chunk_index=position, content=content, embedding=embedding)
+                for position, (content, embedding) in enumerate(document.chunks)
+            ]
+    return [row.id for row in rows]
+
+
+def _release(db: Session, claimed: List[_Claimed], lease: datetime) -> None:
+    """Give up the lease on claimed rows so the next batch picks them up again."""
+    for model in (Resume, Job):
+        ids = [row.id for row in claimed if row.model is model]
+        if ids:
+            (
+                db.query(model)
+                .filter(model.id.in_(ids), model.embedding_claimed_at == lease)
+                .update({model.embedding_claimed_at: None}, synchronize_session=False)
+            )
+
+
+@track_operation("process_pending_embeddings")
+def process_pending_embeddings(db: Session, batch_size: Optional[int] = None) -> int:
+    """
+    Embed one batch of pending resumes and jobs.
+
+    Rows are leased in one short transaction and their vectors written in
+    another, so no row stays locked while the embedding API is called and
+    user updates never wait on the worker. Pending texts from both tables
+    are coalesced into a single get_embeddings_batch call.
+
+    Args:
+        db: Database session
+        batch_size: Maximum rows to claim per table
+
+    Returns:
+        Number of rows processed (0 when the queue is empty)
+    """
+    batch_size = batch_size or settings.embedding_worker_batch_size
+
+    lease = datetime.now(timezone.utc)
+    claimed = (
+        _claim_pending(db, Resume, batch_size, Resume.raw_text, lease)
+        + _claim_pending(db, Job, batch_size, Job.description, lease)
+    )
+    if not claimed:
+        db.rollback()
+        return 0
+    db.commit()
+
+    try:
+        documents = embed_with_active_model(db, lambda: _claimed_documents(db, claimed))
+    except Exception:
+        db.rollback()
+        _release(db, claimed, lease)
+        db.commit()
+        raise
+
+    by_model: Dict[Any, Dict[int, Optional[DocumentEmbedding]]] = {Resume: {}, Job: {}}
+    for row, document in zip(claimed, documents):
+        by_model[row.model][row.id] = document
+
+    resume_ids = _store_documents(db, Resume, by_model[Resume], lease)
+    job_ids = _store_documents(db, Job, by_model[Job], lease)
+    db.commit()
+
+    if resume_ids:
+        resumes_written(db, resume_ids)
+    if job_ids:
+        jobs_written(db, job_ids)
+
+    skipped = len(claimed) - len(resume_ids) - len(job_ids)
+    logger.info(
+        f"Embedded {len(resume_ids)} resumes and {len(job_ids)} jobs"
+        + (f"; dropped {skipped} changed while embedding" if skipped else "")
+    )
+    return len(claimed)
+
+
+def run_embedding_worker(
+        stop_event: Optional[threading.Event] = None,
+        poll_seconds: Optional[float] = None,
+        batch_size: Optional[int] = None,
+) -> None:
+    """
+    Drain the embedding queue until stopped.
+
+    Batches are processed back to back while there is work; when the queue
+    is empty the worker sleeps for ``poll_seconds``.
+
+    Args:
+        stop_event: Set to stop the loop
+        poll_seconds: Idle sleep between polls
+        batch_size: Maximum rows to claim per table per batch
+    """
+    from ..core.database import SessionLocal
+
+    stop_event = stop_event or threading.Event()
+    poll_seconds = poll_seconds or settings.embedding_worker_poll_seconds
+
+    logger.info("Embedding worker started")
+    while not stop_event.is_set():
+        try:
+            with SessionLocal() as db:
+                processed = process_pending_embeddings(db, batch_size)
+        except Exception as e:
+            logger.exception(f"Embedding worker batch failed: {e}")
+            processed = 0
+
+        if not processed:
+            stop_event.wait(poll_seconds)
+
+    logger.info("Embedding worker stopped")
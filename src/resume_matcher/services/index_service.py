@@ -0,0 +1,148 @@
+import logging
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import vector_index_form, vector_index_options
+
+logger = logging.getLogger(__name__)
+
+# ANN indexes on embedding columns: (index, table)
+VECTOR_INDEXES = (
+    ("ix_jobs_embedding", "jobs"),
+    ("ix_resumes_embedding", "resumes"),
+    ("ix_job_chunks_embedding", "job_chunks"),
+    ("ix_resume_chunks_embedding", "resume_chunks"),
+)
+
+# Each index records the form it was built on in its comment, so what is
+# in the database can be compared with what the settings ask for
+_FORM_COMMENT = "search form: "
+
+
+class IndexMaintenanceError(Exception):
+    """Raised when vector indexes cannot be inspected or rebuilt."""
+    pass
+
+
+def vector_index_ddl(
+        name: str,
+        table: str,
+        column: str = "embedding",
+        dimensions: Optional[int] = None,
+) -> List[str]:
+    """
+    Statements that build an ANN index concurrently and record its form.
+
+    The form is recorded for the live ``embedding`` column, so an index
+    built on a shadow column still matches once the column is renamed.
+
+    Args:
+        name: Index name
+        table: Table to index
+        column: Embedding column (e.g. a re-embedding shadow column)
+        dimensions: Vector size of the column (default: settings.embedding_dimensions)
+
+    Returns:
+        SQL statements, to run outside a transaction
+    """
+    options = vector_index_options()
+    params = ", ".join(f"{key} = {int(value)}" for key, value in options["postgresql_with"].items())
+    return [
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} "
+        f"USING {options['postgresql_using']} ({vector_index_form(column, dimensions)}) "
+        f"WITH ({params})",
+        f"COMMENT ON INDEX {name} IS "
+        f"'{_FORM_COMMENT}{vector_index_form('embedding', dimensions)}'",
+    ]
+
+
+def _built_form(db: Session, name: str) -> Optional[str]:
+    row = db.execute(
+        text(
+            "SELECT indexdef, obj_description(to_regclass(indexname), 'pg_class') "
+            "FROM pg_indexes WHERE indexname = :name"
+        ),
+        {"name": name},
+    ).first()
+    if row is None:
+        return None
+
+    indexdef, comment = row
+    if comment and comment.startswith(_FORM_COMMENT):
+        return comment[len(_FORM_COMMENT):]
+    # Built by the initial migrations, before forms were recorded
+    if "(embedding vector_cosine_ops)" in indexdef:
+        return "embedding vector_cosine_ops"
+    return indexdef
+
+
+def stale_vector_indexes(db: Session, dimensions: Optional[int] = None) -> List[str]:
+    """
+    Vector indexes that are missing or do not cover the configured search
+    form (settings.vector_quantization / vector_search_dimensions).
+
+    Searches on the configured form cannot use a stale index and fall
+    back to sequential scans.
+
+    Args:
+        db: Database session
+        dimensions: Embedding size (default: settings.embedding_dimensions)
+
+    Returns:
+        Names of the stale indexes
+
+    Raises:
+        IndexMaintenanceError: If the database is not PostgreSQL
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        raise IndexMaintenanceError("Vector indexes exist only on PostgreSQL")
+
+    expected = vector_index_form("embedding", dimensions)
+    return [name for name, _ in VECTOR_INDEXES if _built_form(db, name) != expected]
+
+
+def rebuild_vector_indexes(
+        db: Session,
+        dimensions: Optional[int] = None,
+        dry_run: bool = False,
+) -> List[str]:
+    """
+    Rebuild stale vector indexes on the configured search form.
+
+    Run after changing VECTOR_QUANTIZATION or VECTOR_SEARCH_DIMENSIONS.
+    Each replacement is built concurrently under a temporary name and
+    swapped in, so writes and searches continue meanwhile.
+
+    Args:
+        db: Database session
+        dimensions: Embedding size (default: settings.embedding_dimensions)
+        dry_run: Only report what would be rebuilt
+
+    Returns:
+        Names of the rebuilt (or, with dry_run, stale) indexes
+
+    Raises:
+        IndexMaintenanceError: If the database is not PostgreSQL
+    """
+    stale = stale_vector_indexes(db, dimensions)
+    db.rollback()
+    if dry_run or not stale:
+        return stale
+
+    tables = dict(VECTOR_INDEXES)
+    with db.get_bind().engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for name in stale:
+            temporary = f"{name}_rebuild"
+            logger.info(f"Rebuilding {name} on {vector_index_form('embedding', dimensions)}")
+            # An interrupted concurrent build leaves an invalid index behind
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {temporary}"))
+            for statement in vector_index_ddl(temporary, tables[name], dimensions=dimensions):
+                connection.execute(text(statement))
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            connection.execute(text(f"ALTER INDEX {temporary} RENAME TO {name}"))
+
+    logger.info(f"Rebuilt {len(stale)} vector indexes (quantization {settings.vector_quantization})")
+    return stale
@@ -0,0 +1,145 @@
+import logging
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from pathlib import PurePosixPath
+from typing import IO, BinaryIO, Callable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..schemas.resume import ResumeCreate, BulkUploadItem, BulkUploadResponse
+from .pdf_service import extract_text_in_pool, PDFExtractionError
+from .resume_service import bulk_create_resumes
+
+logger = logging.getLogger(__name__)
+
+# (display name, opener returning the PDF stream, or an error message)
+PDFSource = Tuple[str, Optional[Callable[[], IO[bytes]]], Optional[str]]
+
+
+class BulkUploadError(Exception):
+    """Raised when a bulk upload is rejected as a whole."""
+    pass
+
+
+def _zip_sources(filename: str, archive: zipfile.ZipFile) -> List[PDFSource]:
+    """List the PDFs inside a ZIP archive without reading them yet."""
+    sources: List[PDFSource] = []
+    for info in archive.infolist():
+        path = PurePosixPath(info.filename)
+        if info.is_dir() or path.parts[0] == "__MACOSX" or path.name.startswith("."):
+            continue
+
+        name = f"{filename}/{info.filename}"
+        if path.suffix.lower() != ".pdf":
+            sources.append((name, None, "Only PDF files are supported"))
+        elif info.file_size > settings.pdf_max_file_bytes:
+            sources.append((name, None, "File is too large"))
+        else:
+            sources.append((name, partial(archive.open, info), None))
+    return sources
+
+
+def _uploaded(fileobj: BinaryIO) -> IO[bytes]:
+    """Opener for an uploaded PDF, which is open already."""
+    return fileobj
+
+
+def _extract(source: PDFSource) -> Tuple[Optional[str], Optional[str]]:
+    """Extract text for one source, returning (text, error)."""
+    _, opener, error = source
+    if opener is None:
+        return None, error
+    try:
+        with opener() as pdf_file:
+            return extract_text_in_pool(pdf_file), None
+    except PDFExtractionError as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"Failed to read file: {e}"
+
+
+def ingest_resume_files(
+        db: Session,
+        uploads: List[Tuple[str, BinaryIO]],
+) -> BulkUploadResponse:
+    """
+    Create resumes from many PDFs and/or ZIP archives of PDFs.
+
+    Text is extracted in parallel in the PDF process pool (threads here only
+    read files and wait on the pool), then all valid resumes are embedded
+    and inserted in batches via bulk_create_resumes. Failures are reported
+    per file and do not affect the rest of the upload.
+
+    Args:
+        db: Database session
+        uploads: (filename, file object) for each uploaded file
+
+    Returns:
+        BulkUploadResponse with one entry per PDF
+
+    Raises:
+        BulkUploadError: If the upload contains too many files
+    """
+    with ExitStack() as stack:
+        sources: List[PDFSource] = []
+        for filename, fileobj in uploads:
+            if filename.lower().endswith(".zip"):
+                try:
+                    archive = stack.enter_context(zipfile.ZipFile(fileobj))
+                except zipfile.BadZipFile as e:
+                    sources.append((filename, None, f"Invalid ZIP archive: {e}"))
+                    continue
+                sources.extend(_zip_sources(filename, archive))
+            elif filename.lower().endswith(".pdf"):
+                sources.append((filename, partial(_uploaded, fileobj), None))
+            else:
+                sources.append((filename, None, "Only PDF and ZIP files are supported"))
+
+        if len(sources) > settings.bulk_upload_max_files:
+            raise BulkUploadError(
+                f"Too many files: {len(sources)} (max {settings.bulk_upload_max_files})"
+            )
+
+        workers = settings.pdf_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            extracted = list(executor.map(_extract, sources))
+
+    results: List[BulkUploadItem] = []
+    to_create: List[Tuple[int, ResumeCreate]] = []
+    for (name, _, _), (raw_text, error) in zip(sources, extracted):
+        if raw_text is not None:
+            try:
+                resume_data = ResumeCreate(
+                    name=PurePosixPath(name).stem[:255] or name[:255],
+                    filename=PurePosixPath(name).name[:255],
+                    raw_text=raw_text,
+                )
+                to_create.append((len(results), resume_data))
+            except ValidationError as e:
+                error = str(e)
+
+        results.append(BulkUploadItem(
+            filename=name,
+            status="failed" if error else "created",
+            error=error,
+        ))
+
+    created = bulk_create_resumes(db, [resume_data for _, resume_data in to_create])
+    for (position, _), (resume_id, embedding_status) in zip(to_create, created):
+        results[position].resume_id = resume_id
+        results[position].embedding_status = embedding_status
+
+    succeeded = len(created)
+    logger.info(f"Bulk upload: {succeeded} created, {len(results) - succeeded} failed")
+
+    return BulkUploadResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
@@ -1,10 +1,33 @@
+import asyncio
 import logging
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.interfaces import ORMOption
 
+from ..core.config import settings
+from ..core.database import run_with_session
+from ..core.metrics import track_operation
 from ..models.job import Job
+from ..models.chunk import JobChunk
+from ..models.status import EMBEDDING_PENDING, EMBEDDING_READY, EMBEDDING_FAILED
 from ..schemas.job import JobCreate, JobUpdate
-from .embedding_service import get_embedding, EmbeddingError
+from .embedding_service import (
+    get_embedding,
+    embed_documents,
+    aget_embedding,
+    aembed_documents,
+    DocumentEmbedding,
+    EmbeddingError,
+)
+from .active_model import embed_with_active_model, aembed_with_active_model
+from .match_cache import invalidate_matches
+from .topk_service import refresh_topk
+from .vector_index import VectorIndex, update_index
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +37,49 @@ class JobNotFoundError(Exception):
     pass
 
 
+def job_embedding_text(job: Job) -> str:
+    """Text embedded for a job: title + description."""
+    return f"{job.title}\n\n{job.description}"
+
+
+def _apply_document(job: Job, document: DocumentEmbedding) -> None:
+    job.embedding = document.embedding
+    if settings.embedding_chunking:
+        job.chunks = [
+            JobChunk(chunk_index=position, content=content, embedding=embedding)
+            for position, (content, embedding) in enumerate(document.chunks)
+        ]
+    job.embedding_status = EMBEDDING_READY
+
+
+def _job_document(db: Session, job: Job) -> DocumentEmbedding:
+    if settings.embedding_chunking:
+        return embed_documents([job_embedding_text(job)], db=db)[0]
+    return DocumentEmbedding(get_embedding(job_embedding_text(job), db=db), [])
+
+
+def _embed_job(db: Session, job: Job) -> None:
+    """Embed a job's text with the active model, storing per-chunk vectors in chunked mode."""
+    _apply_document(job, embed_with_active_model(db, lambda: _job_document(db, job)))
+
+
+async def _aembed_job(db: "AsyncSession", job: Job) -> None:
+    async def embed() -> DocumentEmbedding:
+        if settings.embedding_chunking:
+            return (await aembed_documents([job_embedding_text(job)], db=db))[0]
+        return DocumentEmbedding(await aget_embedding(job_embedding_text(job), db=db), [])
+
+    _apply_document(job, await aembed_with_active_model(db, embed))
+
+
+@track_operation("create_job")
 def create_job(db: Session, job_data: JobCreate) -> Job:
     """
     Create a new job and generate its embedding.
 
+    With ``settings.embedding_async`` the job is saved as pending and the
+    embedding worker fills it in.
+
     Args:
         db: Database session
         job_data: Job creation data
@@ -32,31 +94,77 @@ def create_job(db: Session, job_data: JobCreate) -> Job:
         description=job_data.description,
     )
 
-    # Generate embedding from title + description
-    text_for_embedding = f"{job_data.title}\n\n{job_data.description}"
-
-    try:
-        embedding = get_embedding(text_for_embedding)
-        job.embedding = embedding
-        logger.info(f"Generated embedding for job: {job_data.title}")
-    except EmbeddingError as e:
-        logger.error(f"Failed to generate embedding: {e}")
+    if settings.embedding_async:
+        job.embedding_status = EMBEDDING_PENDING
+    else:
+        # Generate embedding from title + description
+        try:
+            _embed_job(db, job)
+            logger.info(f"Generated embedding for job: {job_data.title}")
+        except EmbeddingError as e:
+            job.embedding_status = EMBEDDING_FAILED
+            logger.error(f"Failed to generate embedding: {e}")
 
     db.add(job)
     db.commit()
     db.refresh(job)
+    jobs_written(db, [job.id])
 
     return job
 
 
-def get_job(db: Session, job_id: int) -> Optional[Job]:
-    """Get a job by ID."""
-    return db.query(Job).filter(Job.id == job_id).first()
+@track_operation("acreate_job")
+async def acreate_job(db: "AsyncSession", job_data: JobCreate) -> Job:
+    """
+    Async create_job for the async request path.
 
+    Args:
+        db: Async database session
+        job_data: Job creation data
 
-def get_job_or_404(db: Session, job_id: int) -> Job:
+    Returns:
+        Created Job object
+    """
+    job = Job(
+        title=job_data.title,
+        company=job_data.company,
+        location=job_data.location,
+        description=job_data.description,
+    )
+
+    if settings.embedding_async:
+        job.embedding_status = EMBEDDING_PENDING
+    else:
+        try:
+            await _aembed_job(db, job)
+            logger.info(f"Generated embedding for job: {job_data.title}")
+        except EmbeddingError as e:
+            job.embedding_status = EMBEDDING_FAILED
+            logger.error(f"Failed to generate embedding: {e}")
+
+    db.add(job)
+    await db.commit()
+    # Reload only server-set columns: a full refresh would unload the
+    # deferred description, which cannot lazy-load on an async session
+    await db.refresh(job, ["created_at", "embedding_status", "has_embedding"])
+    await ajobs_written([job.id])
+
+    return job
+
+
+def get_job(db: Session, job_id: int, *options: ORMOption) -> Optional[Job]:
+    """
+    Get a job by ID.
+
+    description and embedding are deferred; pass e.g. ``undefer(Job.embedding)``
+    in ``options`` to load them with the row.
+    """
+    return db.query(Job).options(*options).filter(Job.id == job_id).first()
+
+
+def get_job_or_404(db: Session, job_id: int, *options: ORMOption) -> Job:
     """Get a job by ID or raise error."""
-    job = get_job(db, job_id)
+    job = get_job(db, job_id, *options)
     if not job:
         raise JobNotFoundError(f"Job with ID {job_id} not found")
     return job
@@ -71,9 +179,98 @@ def get_jobs(
     return db.query(Job).offset(skip).limit(limit).all()
 
 
+# Columns listed by GET /jobs: everything the list response needs, with
+# the 1536-float vector reduced to an IS NOT NULL flag
+_SUMMARY_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.description,
+    Job.created_at,
+    Job.embedding_status,
+    Job.has_embedding,
+)
+
+
+def _summary_query(limit: int, after_id: Optional[int], skip: int):
+    query = select(*_SUMMARY_COLUMNS).order_by(Job.id).limit(limit)
+    if after_id is not None:
+        return query.where(Job.id > after_id)
+    return query.offset(skip)
+
+
+@track_operation("get_job_summaries")
+def get_job_summaries(
+        db: Session,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        skip: int = 0,
+) -> List[Row]:
+    """
+    List jobs in ID order without loading their embeddings.
+
+    Pass the last ``id`` of a page as ``after_id`` to get the next one. This
+    seeks on the primary key, so a deep page costs the same as the first;
+    ``skip`` is the old offset paging and is ignored when ``after_id`` is set.
+
+    Args:
+        db: Database session
+        limit: Maximum rows to return
+        after_id: Return only jobs with a greater ID (keyset cursor)
+        skip: Rows to skip when no cursor is given
+
+    Returns:
+        Rows with the listed columns and a boolean ``has_embedding``
+    """
+    return list(db.execute(_summary_query(limit, after_id, skip)).all())
+
+
+async def aget_job(
+        db: "AsyncSession",
+        job_id: int,
+        *options: ORMOption,
+) -> Optional[Job]:
+    """Async get_job."""
+    return await db.get(Job, job_id, options=options)
+
+
+def get_job_with_description(db: Session, job_id: int) -> Optional[Job]:
+    """Get a job with its description loaded, for responses that show it."""
+    return get_job(db, job_id, undefer(Job.description))
+
+
+async def aget_job_with_description(db: "AsyncSession", job_id: int) -> Optional[Job]:
+    """Async get_job_with_description."""
+    return await aget_job(db, job_id, undefer(Job.description))
+
+
+async def aget_jobs(
+        db: "AsyncSession",
+        skip: int = 0,
+        limit: int = 100
+) -> List[Job]:
+    """Async get_jobs."""
+    result = await db.scalars(select(Job).offset(skip).limit(limit))
+    return list(result.all())
+
+
+@track_operation("aget_job_summaries")
+async def aget_job_summaries(
+        db: "AsyncSession",
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        skip: int = 0,
+) -> List[Row]:
+    """Async get_job_summaries."""
+    result = await db.execute(_summary_query(limit, after_id, skip))
+    return list(result.all())
+
+
+@track_operation("update_job")
 def update_job(db: Session, job_id: int, job_data: JobUpdate) -> Job:
     """Update a job and regenerate embedding if description changed."""
-    job = get_job_or_404(db, job_id)
+    job = get_job_or_404(db, job_id, undefer(Job.description))
 
     update_data = job_data.model_dump(exclude_unset=True)
     description_changed = "description" in update_data or "title" in update_data
@@ -82,21 +279,27 @@ def update_job(db: Session, job_id: int, job_data: JobUpdate) -> Job:
         setattr(job, key, value)
 
     # Regenerate embedding if relevant fields changed
-    if description_changed:
-        text_for_embedding = f"{job.title}\n\n{job.description}"
+    if description_changed and settings.embedding_async:
+        # Keep the old vector for matching until the worker replaces it;
+        # a worker already embedding the old text loses its lease
+        job.embedding_status = EMBEDDING_PENDING
+        job.embedding_claimed_at = None
+    elif description_changed:
         try:
-            embedding = get_embedding(text_for_embedding)
-            job.embedding = embedding
+            _embed_job(db, job)
             logger.info(f"Regenerated embedding for job ID {job_id}")
         except EmbeddingError as e:
+            job.embedding_status = EMBEDDING_FAILED
             logger.error(f"Failed to regenerate embedding: {e}")
 
     db.commit()
     db.refresh(job)
+    jobs_written(db, [job.id])
 
     return job
 
 
+@track_operation("delete_job")
 def delete_job(db: Session, job_id: int) -> bool:
     """Delete a job by ID."""
     job = get_job(db, job_id)
@@ -105,9 +308,56 @@ def delete_job(db: Session, job_id: int) -> bool:
 
     db.delete(job)
     db.commit()
+    jobs_written(db, [job_id], deleted=True)
+    return True
+
+
+@track_operation("adelete_job")
+async def adelete_job(db: "AsyncSession", job_id: int) -> bool:
+    """Async delete_job."""
+    job = await aget_job(db, job_id)
+    if not job:
+        return False
+
+    await db.delete(job)
+    await db.commit()
+    await ajobs_written([job_id], deleted=True)
     return True
 
 
-def get_jobs_with_embeddings(db: Session) -> List[Job]:
-    """Get all jobs that have embeddings."""
-    return db.query(Job).filter(Job.embedding.isnot(None)).all()
\ No newline at end of file
+def get_jobs_with_embeddings(db: Session, job_ids: Optional[List[int]] = None) -> List[Job]:
+    """Get all jobs (or only ``job_ids``) that have embeddings."""
+    query = (
+        db.query(Job)
+        .options(undefer(Job.embedding))
+        .filter(Job.embedding.isnot(None))
+    )
+    if job_ids is not None:
+        query = query.filter(Job.id.in_(job_ids))
+    return query.all()
+
+
+def jobs_written(db: Session, job_ids: List[int], deleted: bool = False) -> None:
+    """
+    Bring the in-memory index, match cache and match_topk up to date after
+    jobs were committed.
+
+    Only the written rows are loaded; the cached index is updated in place
+    and match_topk scores them against the other side's cached index.
+    """
+    written = None
+    if not deleted:
+        written = VectorIndex.from_rows("jobs", get_jobs_with_embeddings(db, job_ids))
+    update_index("jobs", job_ids, written)
+    invalidate_matches()
+    refresh_topk(db, "jobs", job_ids, deleted, written)
+
+
+async def ajobs_written(job_ids: List[int], deleted: bool = False) -> None:
+    """
+    Async jobs_written, in a worker thread with its own sync session.
+
+    Index updates and top-K scoring are NumPy work that would otherwise
+    stall the event loop.
+    """
+    await asyncio.to_thread(run_with_session, jobs_written, job_ids, deleted)
\ No newline at end of file
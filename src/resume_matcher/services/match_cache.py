@@ -0,0 +1,110 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# In-process LRU: key -> (result, stored_at)
+_lru: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+_lock = threading.Lock()
+
+# Bumped on every write; results computed before a write are never stored
+_generation = 0
+
+
+def match_key(direction: str, source_id: int, *options) -> Hashable:
+    """
+    Key a match request.
+
+    Args:
+        direction: "jobs" (resume -> jobs) or "resumes" (job -> resumes)
+        source_id: ID of the resume or job being matched
+        *options: Every other argument that changes the result (top_k,
+            min_score, filters, ...); pydantic models are keyed by value
+
+    Returns:
+        Hashable key, including the embedding model the vectors come from
+    """
+    normalized = tuple(
+        option.model_dump_json() if hasattr(option, "model_dump_json") else option
+        for option in options
+    )
+    return (
+        direction,
+        source_id,
+        settings.embedding_model,
+        settings.embedding_dimensions,
+        normalized,
+    )
+
+
+def current_generation() -> int:
+    """Write generation to pass to store_match, read before computing a result."""
+    return _generation
+
+
+def get_cached_match(key: Hashable) -> Optional[Any]:
+    """
+    Look up a cached match result.
+
+    Args:
+        key: Key from match_key()
+
+    Returns:
+        A copy of the cached result, or None if missing or expired
+    """
+    if not settings.match_cache_enabled:
+        return None
+
+    with _lock:
+        cached = _lru.get(key)
+        if cached is None:
+            return None
+        result, stored_at = cached
+        if time.monotonic() - stored_at >= settings.match_cache_ttl_seconds:
+            del _lru[key]
+            return None
+        _lru.move_to_end(key)
+
+    return copy.deepcopy(result)
+
+
+def store_match(key: Hashable, result: Any, generation: int) -> None:
+    """
+    Cache a match result.
+
+    Args:
+        key: Key from match_key()
+        result: MatchResponse or list of candidate dicts
+        generation: current_generation() from before the result was computed;
+            if a write happened since, the result may be stale and is dropped
+    """
+    if not settings.match_cache_enabled:
+        return
+
+    with _lock:
+        if generation != _generation:
+            return
+        _lru[key] = (copy.deepcopy(result), time.monotonic())
+        _lru.move_to_end(key)
+        while len(_lru) > settings.match_cache_size:
+            _lru.popitem(last=False)
+
+
+def invalidate_matches() -> None:
+    """
+    Drop all cached match results.
+
+    Called on every resume or job write: a new, changed or deleted document
+    can enter or leave any cached top-k list. Writes made by other processes
+    are picked up after ``settings.match_cache_ttl_seconds``.
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        _lru.clear()
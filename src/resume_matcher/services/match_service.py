@@ -1,86 +1,617 @@
+import asyncio
 import logging
-from typing import List
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+import time
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy import bindparam, text
 
+from ..core.config import settings
+from ..core.metrics import MATCH_SECONDS, observe_seconds, track_operation
+from ..core.database import (
+    Vector,
+    run_with_session,
+    vector_search_expression,
+    vector_search_operator,
+    vector_search_rescores,
+)
 from ..models.resume import Resume
 from ..models.job import Job
-from ..schemas.match import MatchResult, MatchResponse
-from .resume_service import get_resume_or_404, ResumeNotFoundError
+from ..schemas.match import MatchResult, MatchResponse, BatchMatchResponse, JobFilters
+from .resume_service import get_resume_or_404, get_resumes_with_embeddings
 from .job_service import get_jobs_with_embeddings
+from .match_cache import match_key, get_cached_match, store_match, current_generation
+from .vector_index import VectorIndex, get_index, get_embedded_count
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# Chunk rows fetched per requested match in chunked mode; several chunks of
+# one document can be near the query, so fetch extra before grouping
+CHUNK_FANOUT = 4
+
+MATCH_MODES = ("vector", "hybrid")
+
+ITERATIVE_SCAN_MODES = ("strict_order", "relaxed_order")
+
 
 class MatchError(Exception):
     """Raised when matching fails."""
     pass
 
 
+def apply_search_params(
+        db: Session,
+        limit: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        iterative: bool = False,
+) -> None:
+    """
+    Set pgvector ANN search parameters for the current transaction.
+
+    Higher ef_search (HNSW) or probes (IVFFlat) improve recall at the cost
+    of latency. When ef_search is not given, it is raised to at least
+    ``limit`` so an HNSW scan can return a full result set.
+
+    Args:
+        db: Database session
+        limit: Number of rows the following vector query will fetch
+        ef_search: HNSW candidate list size override
+        probes: IVFFlat number of lists to probe override
+        iterative: The query filters rows; let the index keep scanning
+            until ``limit`` rows pass (``settings.vector_iterative_scan``)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+
+    if iterative and settings.vector_iterative_scan in ITERATIVE_SCAN_MODES:
+        db.execute(text(
+            f"SET LOCAL {settings.vector_index_type}.iterative_scan = "
+            f"{settings.vector_iterative_scan}"
+        ))
+
+    # SET LOCAL does not accept bind parameters; values are validated ints
+    if settings.vector_index_type == "hnsw" or ef_search is not None:
+        if ef_search is None:
+            ef_search = max(settings.hnsw_ef_search, limit)
+        db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
+    if settings.vector_index_type == "ivfflat" or probes is not None:
+        if probes is None:
+            probes = settings.ivfflat_probes
+        db.execute(text(f"SET LOCAL ivfflat.probes = {int(probes)}"))
+
+
+def build_job_index(db: Session, job_ids: Optional[List[int]] = None) -> VectorIndex:
+    """Load embedded jobs (all, or only ``job_ids``) into an in-memory vector index."""
+    return VectorIndex.from_rows("jobs", get_jobs_with_embeddings(db, job_ids))
+
+
+def build_resume_index(db: Session) -> VectorIndex:
+    """Load all embedded resumes into an in-memory vector index."""
+    return VectorIndex.from_rows("resumes", get_resumes_with_embeddings(db))
+
+
+def _job_filter_sql(filters: Optional[JobFilters], alias: str = "") -> Tuple[str, dict]:
+    """
+    Build the SQL predicates for job filters.
+
+    Args:
+        filters: Filters to apply, or None
+        alias: Table alias the columns are qualified with
+
+    Returns:
+        (" AND ..." clause to append to a WHERE, bind parameters)
+    """
+    if filters is None:
+        return "", {}
+
+    prefix = f"{alias}." if alias else ""
+    clauses = []
+    params: dict = {}
+    if filters.location is not None:
+        clauses.append(f"{prefix}location = :location")
+        params["location"] = filters.location
+    if filters.company is not None:
+        clauses.append(f"{prefix}company = :company")
+        params["company"] = filters.company
+    if filters.created_after is not None:
+        clauses.append(f"{prefix}created_at >= :created_after")
+        params["created_after"] = filters.created_after
+    if filters.created_before is not None:
+        clauses.append(f"{prefix}created_at < :created_before")
+        params["created_before"] = filters.created_before
+    if filters.exclude_ids:
+        clauses.append(f"{prefix}id NOT IN :exclude_ids")
+        params["exclude_ids"] = list(filters.exclude_ids)
+
+    return "".join(f" AND {clause}" for clause in clauses), params
+
+
+def _distance_sql(alias: str = "") -> str:
+    """
+    Predicate bounding cosine distance by :max_distance (1 - min_score).
+
+    In the WHERE clause rather than checked afterwards, so rows below
+    min_score never count against the LIMIT and exact scans can discard
+    them before sorting.
+    """
+    prefix = f"{alias}." if alias else ""
+    return f" AND ({prefix}embedding <=> :embedding) <= :max_distance"
+
+
+def _ann_order_sql(alias: str = "") -> str:
+    """
+    ORDER BY expression served by the ANN index.
+
+    Exact cosine distance to :embedding, or with compact search the
+    distance between the quantized/truncated forms of both vectors.
+    """
+    prefix = f"{alias}." if alias else ""
+    if not vector_search_rescores():
+        return f"{prefix}embedding <=> :embedding"
+    return (
+        f"{vector_search_expression(prefix + 'embedding')} {vector_search_operator()} "
+        f"{vector_search_expression('CAST(:embedding AS vector)')}"
+    )
+
+
+def _shortlist_sql(limit: str) -> str:
+    """Rows the ANN scan returns for a final ``limit``: more when they get rescored."""
+    return f"{limit} * :rescore_factor" if vector_search_rescores() else limit
+
+
+def _nearest_sql(table: str, columns: str, where_sql: str = "", limit: str = ":limit") -> str:
+    """
+    SELECT of the ``limit`` rows nearest :embedding, with a similarity column.
+
+    With compact search the ANN index picks ``limit`` * :rescore_factor rows
+    by compact distance, and only that shortlist is re-ranked by exact
+    cosine distance on the full vectors.
+    """
+    if not vector_search_rescores():
+        return f"""SELECT {columns},
+                          1 - (embedding <=> :embedding) as similarity
+                   FROM {table}
+                   WHERE embedding IS NOT NULL{where_sql}
+                   ORDER BY embedding <=> :embedding
+                   LIMIT {limit}"""
+
+    return f"""SELECT {columns},
+                      1 - (embedding <=> :embedding) as similarity
+               FROM (SELECT {columns}, embedding
+                     FROM {table}
+                     WHERE embedding IS NOT NULL{where_sql}
+                     ORDER BY {_ann_order_sql()}
+                     LIMIT {_shortlist_sql(limit)}) shortlist
+               ORDER BY embedding <=> :embedding
+               LIMIT {limit}"""
+
+
+def _max_sim_query(
+        table: str,
+        chunk_table: str,
+        parent_id: str,
+        columns: str,
+        filter_sql: str = "",
+        chunk_filter_sql: str = "",
+        max_distance: bool = False,
+):
+    """
+    Score each document by its best vector: pooled or any of its chunks.
+
+    Two ANN scans (documents and chunks) are merged and grouped by document,
+    so long documents match on their strongest section rather than only on
+    their averaged vector. Chunk filters are on the parent, aliased ``p``.
+    With ``max_distance``, both scans are bounded by :max_distance. With
+    compact search the scans return wider shortlists, and grouping by exact
+    distance rescores them.
+    """
+    parent_join = f"JOIN {table} p ON p.id = c.{parent_id}" if chunk_filter_sql else ""
+    if max_distance:
+        filter_sql += _distance_sql()
+        chunk_filter_sql += _distance_sql("c")
+    return text(f"""
+                 WITH hits AS (
+                     (SELECT id AS doc_id, embedding <=> :embedding AS distance
+                      FROM {table}
+                      WHERE embedding IS NOT NULL{filter_sql}
+                      ORDER BY {_ann_order_sql()}
+                      LIMIT {_shortlist_sql(":limit")})
+                     UNION ALL
+                     (SELECT c.{parent_id} AS doc_id, c.embedding <=> :embedding AS distance
+                      FROM {chunk_table} c
+                      {parent_join}
+                      WHERE c.embedding IS NOT NULL{chunk_filter_sql}
+                      ORDER BY {_ann_order_sql("c")}
+                      LIMIT {_shortlist_sql(":chunk_limit")})
+                 )
+                 SELECT d.id,
+                        {columns},
+                        1 - MIN(hits.distance) as similarity
+                 FROM hits
+                 JOIN {table} d ON d.id = hits.doc_id
+                 GROUP BY d.id, {columns}
+                 ORDER BY similarity DESC
+        LIMIT :limit
+                 """)
+
+
+def _keyword_query() -> str:
+    """SQL for the tsquery parsed from the :keywords parameter."""
+    return "websearch_to_tsquery(CAST(:search_config AS regconfig), :keywords)"
+
+
+def _document_query(source_table: str) -> str:
+    """
+    SQL for a tsquery matching any term of the source document.
+
+    The source's lexemes are already normalized, so they are ORed with the
+    "simple" config instead of being stemmed a second time.
+    """
+    return f"""(SELECT to_tsquery('simple', array_to_string(array(
+                    SELECT quote_literal(lexeme)
+                    FROM unnest(tsvector_to_array(search_vector)) AS lexeme
+                ), ' | '))
+                FROM {source_table} WHERE id = :source_id)"""
+
+
+def _keyword_filter_query(table: str, columns: str, filter_sql: str = ""):
+    """Vector ranking restricted to rows matching the keywords."""
+    return text(_nearest_sql(
+        table, f"id, {columns}", f"{filter_sql} AND search_vector @@ {_keyword_query()}"
+    ))
+
+
+def _hybrid_query(
+        table: str,
+        columns: str,
+        source_table: str,
+        keywords: bool,
+        filter_sql: str = "",
+):
+    """
+    Fuse full-text and vector candidates with reciprocal rank fusion.
+
+    The top ``:candidates`` rows by ts_rank (GIN index) and by cosine
+    distance (ANN index) are each ranked, and every row scores
+    sum(1 / (:rrf_k + rank)) over the lists it appears in. With keywords,
+    both stages only consider rows containing them, so the vector stage runs
+    over the lexical candidate set instead of the whole table.
+    """
+    tsquery = _keyword_query() if keywords else _document_query(source_table)
+    keyword_filter = " AND search_vector @@ query.q" if keywords else ""
+    semantic = _nearest_sql(f"{table}, query", "id", filter_sql + keyword_filter, ":candidates")
+
+    return text(f"""
+                 WITH query AS (SELECT {tsquery} AS q),
+                 lexical AS (
+                     SELECT id, ROW_NUMBER() OVER (ORDER BY text_rank DESC) AS rank
+                     FROM (SELECT id, ts_rank_cd(search_vector, query.q) AS text_rank
+                           FROM {table}, query
+                           WHERE embedding IS NOT NULL{filter_sql}
+                             AND search_vector @@ query.q
+                           ORDER BY text_rank DESC
+                           LIMIT :candidates) l
+                 ),
+                 semantic AS (
+                     SELECT id, ROW_NUMBER() OVER (ORDER BY similarity DESC) AS rank
+                     FROM ({semantic}) s
+                 ),
+                 fused AS (
+                     SELECT COALESCE(l.id, s.id) AS id,
+                            COALESCE(1.0 / (:rrf_k + l.rank), 0)
+                                + COALESCE(1.0 / (:rrf_k + s.rank), 0) AS score
+                     FROM lexical l
+                     FULL OUTER JOIN semantic s ON s.id = l.id
+                 )
+                 SELECT d.id,
+                        {columns},
+                        1 - (d.embedding <=> :embedding) as similarity,
+                        fused.score as hybrid_score
+                 FROM fused
+                 JOIN {table} d ON d.id = fused.id
+                 ORDER BY fused.score DESC
+        LIMIT :limit
+                 """)
+
+
+def _text_search_params(
+        db: Session,
+        mode: str,
+        keywords: Optional[str],
+        limit: int,
+) -> Optional[dict]:
+    """
+    Validate hybrid/keyword options and build their query parameters.
+
+    Returns:
+        Extra query parameters, or None for plain vector matching
+    """
+    if mode not in MATCH_MODES:
+        raise MatchError(f"Unknown match mode '{mode}'")
+    if mode == "vector" and not keywords:
+        return None
+    if db.get_bind().dialect.name != "postgresql":
+        raise MatchError("Hybrid and keyword matching require PostgreSQL full-text search")
+
+    return {
+        "keywords": keywords,
+        "search_config": settings.text_search_config,
+        "candidates": max(settings.hybrid_candidates, limit),
+        "rrf_k": settings.hybrid_rrf_k,
+    }
+
+
+def _fetch_ranked(
+        db: Session,
+        query,
+        params: dict,
+        top_k: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        filtered: bool = False,
+        fanout: int = 1,
+        hybrid: bool = False,
+) -> list:
+    """
+    Run a ranked vector query, widening it until it returns ``top_k`` rows.
+
+    ANN indexes pick candidates before the WHERE clause (filters and the
+    min_score distance bound) is applied, so a filtered scan can come back
+    short. With pgvector iterative scans the
+    index keeps going until the limit is met; otherwise the limit (and with
+    it ef_search) is raised and the query re-run, up to
+    ``settings.match_max_fetch`` rows.
+
+    Args:
+        db: Database session
+        query: Query taking :limit (and :chunk_limit / :candidates)
+        params: Other query parameters
+        top_k: Number of matches wanted
+        ef_search: HNSW search breadth override
+        probes: IVFFlat probes override
+        filtered: The query has filter predicates
+        fanout: Chunk rows fetched per requested row (chunked mode)
+        hybrid: Rows are in fused order rather than by similarity
+
+    Returns:
+        Result rows, best first
+    """
+    exact = (
+        not filtered
+        or db.get_bind().dialect.name != "postgresql"
+        or settings.vector_iterative_scan in ITERATIVE_SCAN_MODES
+    )
+    limit = top_k
+
+    # Compact search scans a wider shortlist for exact rescoring
+    rescore_factor = settings.vector_rescore_factor if vector_search_rescores() else 1
+
+    while True:
+        candidates = max(settings.hybrid_candidates, limit)
+        apply_search_params(
+            db,
+            (candidates if hybrid else limit * fanout) * rescore_factor,
+            ef_search=ef_search,
+            probes=probes,
+            iterative=filtered,
+        )
+        rows = list(db.execute(
+            query,
+            {
+                **params,
+                "limit": limit,
+                "chunk_limit": limit * fanout,
+                "candidates": candidates,
+                "rescore_factor": rescore_factor,
+            },
+        ).all())
+
+        if not hybrid:
+            # relaxed_order iterative scans may return rows slightly out of order
+            rows.sort(key=lambda row: row.similarity, reverse=True)
+
+        if len(rows) >= top_k or limit >= settings.match_max_fetch:
+            return rows
+        if exact and len(rows) < limit:
+            return rows  # No more rows match
+
+        limit = min(limit * 4, settings.match_max_fetch)
+
+
+def _job_match(
+        job_id: int,
+        title: str,
+        company: Optional[str],
+        similarity: float,
+        hybrid_score: Optional[float] = None,
+) -> MatchResult:
+    return MatchResult(
+        job_id=job_id,
+        job_title=title,
+        company=company,
+        similarity_score=round(similarity, 4),
+        match_percentage=round(similarity * 100),
+        hybrid_score=round(float(hybrid_score), 6) if hybrid_score is not None else None,
+    )
+
+
+def _resume_match(
+        resume_id: int,
+        name: str,
+        email: Optional[str],
+        similarity: float,
+        hybrid_score: Optional[float] = None,
+) -> dict:
+    match = {
+        "resume_id": resume_id,
+        "name": name,
+        "email": email,
+        "similarity_score": round(similarity, 4),
+        "match_percentage": round(similarity * 100)
+    }
+    if hybrid_score is not None:
+        match["hybrid_score"] = round(float(hybrid_score), 6)
+    return match
+
+
+@track_operation("find_matching_jobs")
 def find_matching_jobs(
         db: Session,
         resume_id: int,
         top_k: int = 10,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
 ) -> MatchResponse:
     """
     Find the best matching jobs for a resume using vector similarity.
 
+    Results are cached in-process until the next resume or job write.
+
     Args:
         db: Database session
         resume_id: ID of the resume to match
         top_k: Number of top matches to return
         min_score: Minimum similarity score threshold
+        ef_search: HNSW search breadth override (recall vs latency)
+        probes: IVFFlat probes override (recall vs latency)
+        mode: "vector", or "hybrid" to fuse full-text and vector rankings
+        keywords: Web-search style terms every match must contain
+        filters: Location/company/recency/exclusion filters, applied in SQL
 
     Returns:
         MatchResponse with ranked job matches
     """
+    key = match_key(
+        "jobs", resume_id, top_k, min_score, ef_search, probes, mode, keywords, filters
+    )
+    with observe_seconds(MATCH_SECONDS, direction="jobs", cached="true") as labels:
+        cached = get_cached_match(key)
+        if cached is not None:
+            return cached
+
+        labels["cached"] = "false"
+        generation = current_generation()
+        response = _find_matching_jobs(
+            db, resume_id, top_k, min_score, ef_search, probes, mode, keywords, filters
+        )
+        store_match(key, response, generation)
+        return response
+
+
+def _find_matching_jobs(
+        db: Session,
+        resume_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+) -> MatchResponse:
+    """Uncached find_matching_jobs."""
     # Get resume
-    resume = get_resume_or_404(db, resume_id)
+    resume = get_resume_or_404(db, resume_id, undefer(Resume.embedding))
 
     if resume.embedding is None:
         raise MatchError(f"Resume {resume_id} has no embedding. Please regenerate it.")
 
-    # Use pgvector's cosine distance operator
-    # Note: <=> is cosine distance, so lower is more similar
-    # We convert to similarity: 1 - distance
-    query = text("""
-                 SELECT id,
-                        title,
-                        company,
-                        1 - (embedding <=> :resume_embedding) as similarity
-                 FROM jobs
-                 WHERE embedding IS NOT NULL
-                 ORDER BY embedding <=> :resume_embedding
-        LIMIT :limit
-                 """)
+    search_params = _text_search_params(db, mode, keywords, top_k * 2)
+    filter_sql, filter_params = _job_filter_sql(filters)
 
-    result = db.execute(
-        query,
-        {
-            "resume_embedding": str(resume.embedding),
-            "limit": top_k * 2  # Get extra to filter by min_score
-        }
-    )
+    # The in-memory index has no filter support; filtered queries use SQL
+    if search_params is None and not filter_sql and settings.match_backend == "numpy":
+        job_index = get_index("jobs", lambda: build_job_index(db))
+        hits = job_index.search(resume.embedding, top_k, min_score)
+        return MatchResponse(
+            resume_id=resume.id,
+            resume_name=resume.name,
+            total_jobs_compared=len(job_index),
+            matches=[
+                _job_match(
+                    int(job_index.ids[pos]),
+                    job_index.payloads[pos]["title"],
+                    job_index.payloads[pos]["company"],
+                    similarity,
+                )
+                for pos, similarity in hits
+            ]
+        )
 
-    matches = []
-    for row in result:
-        similarity = float(row.similarity)
+    params = {
+        "embedding": resume.embedding,
+        "source_id": resume.id,
+        "max_distance": 1 - min_score,
+        **filter_params,
+    }
+    # Always bounded: at min_score 0 this drops negative similarities
+    distance_sql = _distance_sql()
+    fanout = 1
 
-        if similarity >= min_score:
-            matches.append(MatchResult(
-                job_id=row.id,
-                job_title=row.title,
-                company=row.company,
-                similarity_score=round(similarity, 4),
-                match_percentage=round(similarity * 100)
-            ))
+    if search_params is not None:
+        params.update(search_params)
+        if mode == "hybrid":
+            query = _hybrid_query(
+                "jobs",
+                "d.title, d.company",
+                "resumes",
+                keywords=bool(keywords),
+                filter_sql=filter_sql + distance_sql,
+            )
+        else:
+            query = _keyword_filter_query("jobs", "title, company", filter_sql + distance_sql)
+    elif settings.embedding_chunking:
+        fanout = CHUNK_FANOUT
+        query = _max_sim_query(
+            "jobs",
+            "job_chunks",
+            "job_id",
+            "d.title, d.company",
+            filter_sql,
+            _job_filter_sql(filters, alias="p")[0],
+            max_distance=True,
+        )
+    else:
+        # <=> is pgvector's cosine distance; similarity is 1 - distance
+        query = text(_nearest_sql("jobs", "id, title, company", filter_sql + distance_sql))
 
-    # Limit to top_k after filtering
-    matches = matches[:top_k]
+    # Bound as a vector so every driver gets a value its codec accepts
+    query = query.bindparams(bindparam("embedding", type_=Vector()))
+    if "exclude_ids" in filter_params:
+        query = query.bindparams(bindparam("exclude_ids", expanding=True))
 
-    # Get total job count for context
-    total_jobs = db.query(Job).filter(Job.embedding.isnot(None)).count()
+    result = _fetch_ranked(
+        db,
+        query,
+        params,
+        top_k,
+        ef_search=ef_search,
+        probes=probes,
+        filtered=bool(filter_sql or min_score > 0 or keywords),
+        fanout=fanout,
+        hybrid=mode == "hybrid",
+    )
+
+    matches = [
+        _job_match(
+            row.id, row.title, row.company, float(row.similarity), getattr(row, "hybrid_score", None)
+        )
+        for row in result[:top_k]
+    ]
+
+    # Cached between writes: a COUNT(*) per request costs as much as the search
+    total_jobs = get_embedded_count(
+        "jobs", lambda: db.query(Job).filter(Job.embedding.isnot(None)).count()
+    )
 
     return MatchResponse(
         resume_id=resume.id,
@@ -90,60 +621,289 @@ def find_matching_jobs(
     )
 
 
+@track_operation("find_matching_resumes")
 def find_matching_resumes(
         db: Session,
         job_id: int,
         top_k: int = 10,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
 ) -> List[dict]:
     """
     Find the best matching resumes for a job.
 
+    Results are cached in-process until the next resume or job write.
+
     Args:
         db: Database session
         job_id: ID of the job to match
         top_k: Number of top matches to return
         min_score: Minimum similarity score threshold
+        ef_search: HNSW search breadth override (recall vs latency)
+        probes: IVFFlat probes override (recall vs latency)
+        mode: "vector", or "hybrid" to fuse full-text and vector rankings
+        keywords: Web-search style terms every match must contain
 
     Returns:
         List of matching resumes with scores
     """
+    key = match_key(
+        "resumes", job_id, top_k, min_score, ef_search, probes, mode, keywords
+    )
+    with observe_seconds(MATCH_SECONDS, direction="resumes", cached="true") as labels:
+        cached = get_cached_match(key)
+        if cached is not None:
+            return cached
+
+        labels["cached"] = "false"
+        generation = current_generation()
+        matches = _find_matching_resumes(
+            db, job_id, top_k, min_score, ef_search, probes, mode, keywords
+        )
+        store_match(key, matches, generation)
+        return matches
+
+
+def _find_matching_resumes(
+        db: Session,
+        job_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
+) -> List[dict]:
+    """Uncached find_matching_resumes."""
     from .job_service import get_job_or_404
 
-    job = get_job_or_404(db, job_id)
+    job = get_job_or_404(db, job_id, undefer(Job.embedding))
 
     if job.embedding is None:
         raise MatchError(f"Job {job_id} has no embedding.")
 
-    query = text("""
-                 SELECT id,
-                        name,
-                        email,
-                        1 - (embedding <=> :job_embedding) as similarity
-                 FROM resumes
-                 WHERE embedding IS NOT NULL
-                 ORDER BY embedding <=> :job_embedding
-        LIMIT :limit
-                 """)
+    search_params = _text_search_params(db, mode, keywords, top_k)
 
-    result = db.execute(
+    if search_params is None and settings.match_backend == "numpy":
+        resume_index = get_index("resumes", lambda: build_resume_index(db))
+        return [
+            _resume_match(
+                int(resume_index.ids[pos]),
+                resume_index.payloads[pos]["name"],
+                resume_index.payloads[pos]["email"],
+                similarity,
+            )
+            for pos, similarity in resume_index.search(job.embedding, top_k, min_score)
+        ]
+
+    params = {
+        "embedding": job.embedding,
+        "source_id": job.id,
+        "max_distance": 1 - min_score,
+    }
+    # Always bounded: at min_score 0 this drops negative similarities
+    distance_sql = _distance_sql()
+    fanout = 1
+
+    if search_params is not None:
+        params.update(search_params)
+        if mode == "hybrid":
+            query = _hybrid_query(
+                "resumes", "d.name, d.email", "jobs", keywords=bool(keywords), filter_sql=distance_sql
+            )
+        else:
+            query = _keyword_filter_query("resumes", "name, email", distance_sql)
+    elif settings.embedding_chunking:
+        fanout = CHUNK_FANOUT
+        query = _max_sim_query(
+            "resumes", "resume_chunks", "resume_id", "d.name, d.email", max_distance=True
+        )
+    else:
+        query = text(_nearest_sql("resumes", "id, name, email", distance_sql))
+    query = query.bindparams(bindparam("embedding", type_=Vector()))
+
+    result = _fetch_ranked(
+        db,
         query,
-        {
-            "job_embedding": str(job.embedding),
-            "limit": top_k
-        }
+        params,
+        top_k,
+        ef_search=ef_search,
+        probes=probes,
+        filtered=bool(min_score > 0 or keywords),
+        fanout=fanout,
+        hybrid=mode == "hybrid",
+    )
+
+    matches = [
+        _resume_match(
+            row.id, row.name, row.email, float(row.similarity), getattr(row, "hybrid_score", None)
+        )
+        for row in result[:top_k]
+    ]
+
+    return matches
+
+
+async def afind_matching_jobs(
+        db: "AsyncSession",
+        resume_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+) -> MatchResponse:
+    """
+    Async find_matching_jobs for the async request path.
+
+    A wrapper, not a separate async implementation: cached results are
+    returned without touching the session, misses run find_matching_jobs
+    through ``AsyncSession.run_sync`` so its queries await on the asyncpg
+    connection. With MATCH_BACKEND=numpy the misses are CPU work on the
+    in-memory index instead; they run in a worker thread with a sync
+    session so they don't stall the event loop.
+    """
+    start = time.perf_counter()
+    cached = get_cached_match(match_key(
+        "jobs", resume_id, top_k, min_score, ef_search, probes, mode, keywords, filters
+    ))
+    if cached is not None:
+        MATCH_SECONDS.labels(direction="jobs", cached="true").observe(
+            time.perf_counter() - start
+        )
+        return cached
+
+    match = partial(
+        find_matching_jobs,
+        resume_id=resume_id,
+        top_k=top_k,
+        min_score=min_score,
+        ef_search=ef_search,
+        probes=probes,
+        mode=mode,
+        keywords=keywords,
+        filters=filters,
+    )
+    if settings.match_backend == "numpy":
+        return await asyncio.to_thread(run_with_session, match)
+    return await db.run_sync(match)
+
+
+async def afind_matching_resumes(
+        db: "AsyncSession",
+        job_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        mode: str = "vector",
+        keywords: Optional[str] = None,
+) -> List[dict]:
+    """Async find_matching_resumes (see afind_matching_jobs)."""
+    start = time.perf_counter()
+    cached = get_cached_match(match_key(
+        "resumes", job_id, top_k, min_score, ef_search, probes, mode, keywords
+    ))
+    if cached is not None:
+        MATCH_SECONDS.labels(direction="resumes", cached="true").observe(
+            time.perf_counter() - start
+        )
+        return cached
+
+    match = partial(
+        find_matching_resumes,
+        job_id=job_id,
+        top_k=top_k,
+        min_score=min_score,
+        ef_search=ef_search,
+        probes=probes,
+        mode=mode,
+        keywords=keywords,
     )
+    if settings.match_backend == "numpy":
+        return await asyncio.to_thread(run_with_session, match)
+    return await db.run_sync(match)
 
-    matches = []
-    for row in result:
-        similarity = float(row.similarity)
-        if similarity >= min_score:
-            matches.append({
-                "resume_id": row.id,
-                "name": row.name,
-                "email": row.email,
-                "similarity_score": round(similarity, 4),
-                "match_percentage": round(similarity * 100)
-            })
-
-    return matches
\ No newline at end of file
+
+@track_operation("find_matches_batch")
+def find_matches_batch(
+        db: Session,
+        resume_ids: Optional[List[int]] = None,
+        job_ids: Optional[List[int]] = None,
+        top_k: int = 10,
+        min_score: float = 0.0,
+) -> BatchMatchResponse:
+    """
+    Match many resumes against many jobs in one pass.
+
+    Resume and job embeddings are each loaded with a single query and the
+    full score matrix is computed in blocked NumPy tiles, instead of running
+    one vector query (plus a count) per resume.
+
+    Args:
+        db: Database session
+        resume_ids: Resumes to match, or None for every embedded resume
+        job_ids: Jobs to match against, or None for every embedded job
+        top_k: Number of top matches to return per resume
+        min_score: Minimum similarity score threshold
+
+    Returns:
+        BatchMatchResponse with ranked job matches per resume
+    """
+    resume_query = db.query(Resume.id, Resume.name, Resume.embedding).filter(
+        Resume.embedding.isnot(None)
+    )
+    if resume_ids is not None:
+        resume_query = resume_query.filter(Resume.id.in_(resume_ids))
+    resumes = resume_query.order_by(Resume.id).all()
+
+    if job_ids is None and settings.match_backend == "numpy":
+        job_index = get_index("jobs", lambda: build_job_index(db))
+    else:
+        job_index = build_job_index(db, job_ids)
+
+    all_hits = job_index.search_batch(
+        [resume.embedding for resume in resumes],
+        top_k,
+        min_score,
+        query_block=settings.match_batch_query_block,
+        index_block=settings.match_batch_index_block,
+    )
+
+    results = [
+        MatchResponse(
+            resume_id=resume.id,
+            resume_name=resume.name,
+            total_jobs_compared=len(job_index),
+            matches=[
+                _job_match(
+                    int(job_index.ids[pos]),
+                    job_index.payloads[pos]["title"],
+                    job_index.payloads[pos]["company"],
+                    similarity,
+                )
+                for pos, similarity in hits
+            ]
+        )
+        for resume, hits in zip(resumes, all_hits)
+    ]
+
+    skipped: List[int] = []
+    if resume_ids is not None:
+        skipped = sorted(set(resume_ids) - {resume.id for resume in resumes})
+
+    logger.info(
+        f"Batch matched {len(resumes)} resumes against {len(job_index)} jobs"
+    )
+
+    return BatchMatchResponse(
+        total_resumes=len(resumes),
+        total_jobs_compared=len(job_index),
+        results=results,
+        skipped_resume_ids=skipped,
+    )
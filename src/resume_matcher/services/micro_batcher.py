@@ -0,0 +1,123 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrent single-item calls into batched calls.
+
+    Callers ``submit`` one item and wait on the returned future. A collector
+    thread takes the first queued item, keeps collecting for up to
+    ``max_wait_seconds`` or until ``max_batch_size`` items have arrived,
+    then hands the batch to ``handler`` on a small thread pool, so up to
+    ``max_concurrency`` batches are in flight while the next one fills.
+    If ``handler`` raises, every caller in the batch gets that exception;
+    an exception instance returned in place of a result fails only that
+    caller. Every future is resolved: a handler returning the wrong number
+    of results, or a batch that cannot be scheduled, fails its callers
+    rather than leaving them waiting. Callers that gave up (cancelled
+    their future) are skipped.
+    """
+
+    def __init__(
+            self,
+            handler: Callable[[List[T]], List[R]],
+            max_batch_size: int = 64,
+            max_wait_seconds: float = 0.005,
+            max_concurrency: int = 4,
+            name: str = "micro-batcher",
+    ):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_concurrency = max_concurrency
+        self.name = name
+
+        self._queue: "queue.Queue[Tuple[T, Future]]" = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._collector: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._collector is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix=self.name
+                )
+                self._collector = threading.Thread(
+                    target=self._collect, args=(self._executor,), name=self.name, daemon=True
+                )
+                self._collector.start()
+
+    def _collect(self, executor: ThreadPoolExecutor) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_seconds
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                executor.submit(self._run, batch)
+            except Exception as e:
+                logger.exception(f"{self.name} could not schedule a batch")
+                self._fail(batch, e)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[T, Future]], error: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _run(self, batch: List[Tuple[T, Future]]) -> None:
+        # Drop callers that timed out and cancelled while the batch filled
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            results = self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self.name} handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        logger.debug(f"{self.name} ran a batch of {len(batch)}")
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def submit(self, item: T) -> Future:
+        """
+        Queue one item for the next batch.
+
+        Args:
+            item: Input for ``handler``
+
+        Returns:
+            Future resolving to the item's result (or the batch's exception)
+        """
+        self._start()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
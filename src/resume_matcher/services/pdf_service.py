@@ -1,64 +1,447 @@
-import fitz  # PyMuPDF
+import asyncio
 import logging
-from typing import BinaryIO
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import IO, BinaryIO, Iterator, List, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..core.metrics import PDF_BYTES, PDF_EXTRACTION_SECONDS, PDF_PAGES, observe_seconds
 
 logger = logging.getLogger(__name__)
 
+_SPOOL_CHUNK_BYTES = 1024 * 1024
+
+_MULTIPLE_SPACES = re.compile(r' +')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
 
 class PDFExtractionError(Exception):
     """Raised when PDF text extraction fails."""
     pass
 
 
-def extract_text_from_pdf(file: BinaryIO) -> str:
+class PDFTooLargeError(PDFExtractionError):
+    """Raised when an uploaded PDF exceeds the configured size limit."""
+    pass
+
+
+class PDFTimeoutError(PDFExtractionError):
+    """Raised when PDF extraction runs past its deadline."""
+    pass
+
+
+def load_pymupdf():
     """
-    Extract text content from a PDF file.
+    Import PyMuPDF on first use.
+
+    Kept out of module import so the API, workers and CLIs start without
+    it; PDF worker processes import it with their first document.
+    """
+    import fitz  # PyMuPDF
+    return fitz
+
+
+def spool_to_tempfile(file: IO[bytes], max_bytes: int) -> str:
+    """
+    Copy an upload to a temporary file in fixed-size chunks.
+
+    Memory use is bounded by the chunk size no matter how large the upload
+    is, and the copy stops as soon as ``max_bytes`` is exceeded.
 
     Args:
         file: File-like object containing PDF data
+        max_bytes: Maximum allowed size
 
     Returns:
-        Extracted text as a string
+        Path of the temporary file; the caller must delete it
 
     Raises:
-        PDFExtractionError: If extraction fails
+        PDFTooLargeError: If the file is larger than max_bytes
     """
+    spool = tempfile.NamedTemporaryFile(
+        suffix=".pdf", dir=settings.pdf_spool_dir, delete=False
+    )
+    size = 0
     try:
-        # Read file content
-        pdf_bytes = file.read()
+        with spool:
+            while chunk := file.read(_SPOOL_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise PDFTooLargeError(
+                        f"PDF is larger than {max_bytes // (1024 * 1024)} MB"
+                    )
+                spool.write(chunk)
+    except BaseException:
+        os.unlink(spool.name)
+        raise
+    return spool.name
+
+
+def iter_page_text(doc, deadline: Optional[float] = None) -> Iterator[str]:
+    """
+    Yield cleaned, non-empty text for each page of an open document.
+
+    Cleaning page by page avoids building and then re-copying the raw text
+    of the whole document.
+
+    Args:
+        doc: Open PyMuPDF document
+        deadline: time.monotonic() value after which extraction stops
 
-        # Open PDF from bytes
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    Raises:
+        PDFTimeoutError: If the deadline passes
+    """
+    for page_num, page in enumerate(doc):
+        if deadline and time.monotonic() > deadline:
+            raise PDFTimeoutError("PDF extraction timed out")
+        try:
+            text = clean_text(page.get_text())
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num}: {e}")
+            continue
+        if text:
+            yield text
+
+
+def _extract_from_path(
+        path: str,
+        max_pages: int,
+        timeout_seconds: Optional[float] = None,
+) -> Tuple[str, int]:
+    """
+    Extract and clean text from a PDF on disk.
+
+    Runs in the request thread or in a PDF worker process, so it only takes
+    picklable arguments. PyMuPDF reads the file lazily, so only the pages
+    being parsed are held in memory.
 
-        text_parts = []
+    Args:
+        path: Path to the PDF file
+        max_pages: Reject documents with more pages than this
+        timeout_seconds: Stop between pages once this much time has passed
 
-        for page_num, page in enumerate(doc):
-            try:
-                text = page.get_text()
-                if text.strip():
-                    text_parts.append(text)
-            except Exception as e:
-                logger.warning(f"Failed to extract text from page {page_num}: {e}")
-                continue
+    Returns:
+        (extracted text, page count)
 
+    Raises:
+        PDFExtractionError: If extraction fails
+    """
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+
+    try:
+        doc = load_pymupdf().open(path, filetype="pdf")
+    except Exception as e:
+        raise PDFExtractionError(f"Invalid PDF file: {e}")
+
+    try:
+        # Checked from the page tree before any page is parsed
+        if doc.page_count > max_pages:
+            raise PDFExtractionError(
+                f"PDF has {doc.page_count} pages (max {max_pages})"
+            )
+
+        full_text = "\n\n".join(iter_page_text(doc, deadline))
+        page_count = doc.page_count
+    finally:
         doc.close()
 
-        if not text_parts:
-            raise PDFExtractionError("No text could be extracted from PDF")
+    if not full_text:
+        raise PDFExtractionError("No text could be extracted from PDF")
+
+    return full_text, page_count
+
+
+@contextmanager
+def _extraction_metrics(path: str) -> Iterator[dict]:
+    """Record a spooled PDF's size and time its extraction (outcome "error" unless set)."""
+    PDF_BYTES.observe(os.path.getsize(path))
+    with observe_seconds(PDF_EXTRACTION_SECONDS, outcome="error") as labels:
+        yield labels
+
+
+def _record_success(labels: dict, page_count: int) -> None:
+    labels["outcome"] = "ok"
+    PDF_PAGES.observe(page_count)
+
 
-        # Join all text with newlines
-        full_text = "\n\n".join(text_parts)
+def extract_text_from_pdf(file: BinaryIO) -> str:
+    """
+    Extract text content from a PDF file.
+
+    Args:
+        file: File-like object containing PDF data
+
+    Returns:
+        Extracted text as a string
 
-        # Clean up the text
-        full_text = clean_text(full_text)
+    Raises:
+        PDFExtractionError: If extraction fails
+        PDFTooLargeError: If the file exceeds ``settings.pdf_max_file_bytes``
+    """
+    path = spool_to_tempfile(file, settings.pdf_max_file_bytes)
+    try:
+        with _extraction_metrics(path) as labels:
+            full_text, page_count = _extract_from_path(path, settings.pdf_max_pages)
+            _record_success(labels, page_count)
 
         logger.info(f"Extracted {len(full_text)} characters from PDF")
         return full_text
 
-    except fitz.FileDataError as e:
-        raise PDFExtractionError(f"Invalid PDF file: {e}")
+    except PDFExtractionError:
+        raise
     except Exception as e:
         raise PDFExtractionError(f"Failed to extract text: {e}")
+    finally:
+        os.unlink(path)
+
+
+# Each worker is a single-process executor of its own and runs one
+# document at a time, so a worker stuck inside a page is killed and
+# replaced without failing the documents running on the others.
+_idle_workers: List[ProcessPoolExecutor] = []
+# Every worker started and not shut down yet, idle or busy
+_workers: Set[ProcessPoolExecutor] = set()
+_workers_lock = threading.Lock()
+
+# Documents wait for a free slot before they get a worker, so a document's
+# time limit never includes time spent queued. Blocking callers (bulk
+# ingestion threads) wait on a thread semaphore; the API waits on a
+# semaphore of its event loop so that no thread is tied up.
+_slots: Optional[threading.BoundedSemaphore] = None
+_async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_size() -> int:
+    return settings.pdf_workers or os.cpu_count() or 1
+
+
+def _checkout_worker() -> ProcessPoolExecutor:
+    """Take an idle worker, starting one if none is idle."""
+    with _workers_lock:
+        if _idle_workers:
+            return _idle_workers.pop()
+
+        # spawn: forking a threaded server process is unsafe, and
+        # max_tasks_per_child (recycling workers) requires it anyway
+        executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=settings.pdf_worker_max_tasks,
+        )
+        _workers.add(executor)
+    logger.info(f"Started PDF extraction worker ({len(_workers)} running)")
+    return executor
+
+
+def _checkin_worker(executor: ProcessPoolExecutor) -> None:
+    """Return a worker whose document finished; discarded or surplus workers are stopped."""
+    with _workers_lock:
+        keep = executor in _workers and len(_idle_workers) < _pool_size()
+        if keep:
+            _idle_workers.append(executor)
+        else:
+            _workers.discard(executor)
+    if not keep:
+        executor.shutdown(wait=False)
+
+
+def _stop_executor(executor: ProcessPoolExecutor, kill: bool, wait: bool) -> None:
+    if kill:
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+    executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _discard_worker(executor: ProcessPoolExecutor, kill: bool) -> None:
+    """Stop a worker that broke or is stuck, leaving every other worker alone."""
+    with _workers_lock:
+        _workers.discard(executor)
+    _stop_executor(executor, kill, wait=False)
+
+
+def shutdown_pdf_executor(kill: bool = False) -> None:
+    """
+    Shut down the PDF extraction workers.
+
+    Args:
+        kill: Terminate worker processes instead of letting them finish
+    """
+    with _workers_lock:
+        workers = list(_workers)
+        _workers.clear()
+        _idle_workers.clear()
+
+    for executor in workers:
+        _stop_executor(executor, kill, wait=not kill)
+
+
+def _worker_slots() -> threading.BoundedSemaphore:
+    global _slots
+    with _workers_lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(_pool_size())
+        return _slots
+
+
+def _async_worker_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    with _workers_lock:
+        slots = _async_slots.get(loop)
+        if slots is None:
+            slots = _async_slots[loop] = asyncio.Semaphore(_pool_size())
+        return slots
+
+
+def _submit(path: str) -> Tuple[ProcessPoolExecutor, Future]:
+    """
+    Start extracting a spooled PDF on a worker of its own.
+
+    The worker goes back to the idle pool when the extraction finishes,
+    fails or is cancelled, unless it was discarded meanwhile.
+
+    Returns:
+        (the worker it was submitted to, its future)
+
+    Raises:
+        BrokenProcessPool: If the worker broke or was shut down meanwhile
+    """
+    executor = _checkout_worker()
+    try:
+        # Only the spooled file path crosses the process boundary, not the bytes
+        future = executor.submit(
+            _extract_from_path,
+            path,
+            settings.pdf_max_pages,
+            settings.pdf_timeout_seconds,
+        )
+    except RuntimeError as e:
+        _checkin_worker(executor)
+        # Submitting to a worker shutdown_pdf_executor just stopped
+        raise BrokenProcessPool(str(e)) from e
+    except BaseException:
+        _checkin_worker(executor)
+        raise
+    future.add_done_callback(lambda _: _checkin_worker(executor))
+    return executor, future
+
+
+def _hard_timeout() -> float:
+    """How long to wait on a worker before assuming it is stuck inside a page."""
+    return settings.pdf_timeout_seconds + settings.pdf_kill_grace_seconds
+
+
+def extract_text_in_pool(file: IO[bytes]) -> str:
+    """
+    Extract text from a PDF in the process pool, blocking the caller.
+
+    Args:
+        file: File-like object containing PDF data
+
+    Returns:
+        Extracted text as a string
+
+    Raises:
+        PDFExtractionError: If extraction fails or times out
+        PDFTooLargeError: If the file exceeds ``settings.pdf_max_file_bytes``
+    """
+    path = spool_to_tempfile(file, settings.pdf_max_file_bytes)
+    try:
+        with _extraction_metrics(path) as labels, _worker_slots():
+            for attempt in range(2):
+                executor = None
+                try:
+                    executor, future = _submit(path)
+                    full_text, page_count = future.result(timeout=_hard_timeout())
+                    _record_success(labels, page_count)
+                    return full_text
+                except PDFTimeoutError:
+                    labels["outcome"] = "timeout"
+                    raise
+                except TimeoutError:
+                    # Stuck inside a page: only killing its worker reclaims it
+                    labels["outcome"] = "timeout"
+                    if executor is not None:
+                        _discard_worker(executor, kill=True)
+                    raise PDFExtractionError("PDF extraction timed out")
+                except BrokenProcessPool:
+                    # The worker died under this document; retry once on another
+                    if executor is not None:
+                        _discard_worker(executor, kill=False)
+                    if attempt:
+                        raise PDFExtractionError("PDF extraction worker crashed")
+
+            raise PDFExtractionError("PDF extraction failed")
+    finally:
+        os.unlink(path)
+
+
+async def extract_text_from_pdf_async(file: BinaryIO) -> str:
+    """
+    Extract text content from a PDF file without blocking the event loop.
+
+    The upload is spooled to a temporary file in chunks (bounded by
+    ``settings.pdf_max_file_bytes``) and parsed from disk in a process pool
+    sized by ``settings.pdf_workers``, with a per-document timeout
+    (``settings.pdf_timeout_seconds``) and page limit
+    (``settings.pdf_max_pages``).
+
+    Args:
+        file: File-like object containing PDF data
+
+    Returns:
+        Extracted text as a string
+
+    Raises:
+        PDFExtractionError: If extraction fails or times out
+        PDFTooLargeError: If the file exceeds ``settings.pdf_max_file_bytes``
+    """
+    path = await asyncio.to_thread(spool_to_tempfile, file, settings.pdf_max_file_bytes)
+    try:
+        with _extraction_metrics(path) as labels:
+            async with _async_worker_slots():
+                for attempt in range(2):
+                    executor = None
+                    try:
+                        # Submitted to the worker directly (as run_in_executor
+                        # does) so it is returned when the extraction finishes
+                        executor, future = _submit(path)
+                        full_text, page_count = await asyncio.wait_for(
+                            asyncio.wrap_future(future),
+                            timeout=_hard_timeout(),
+                        )
+                        _record_success(labels, page_count)
+                        logger.info(f"Extracted {len(full_text)} characters from PDF")
+                        return full_text
+                    except PDFTimeoutError:
+                        labels["outcome"] = "timeout"
+                        raise
+                    except asyncio.TimeoutError:
+                        # Stuck inside a page: only killing its worker reclaims it
+                        labels["outcome"] = "timeout"
+                        if executor is not None:
+                            _discard_worker(executor, kill=True)
+                        raise PDFExtractionError("PDF extraction timed out")
+                    except BrokenProcessPool:
+                        # The worker died under this document; retry once on another
+                        if executor is not None:
+                            _discard_worker(executor, kill=False)
+                        if attempt:
+                            raise PDFExtractionError("PDF extraction worker crashed")
+
+                raise PDFExtractionError("PDF extraction failed")
+    finally:
+        os.unlink(path)
 
 
 def clean_text(text: str) -> str:
@@ -71,15 +454,13 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    import re
-
     # Replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
+    text = _MULTIPLE_SPACES.sub(' ', text)
 
     # Replace multiple newlines with double newline
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = _BLANK_LINES.sub('\n\n', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
 
-    return text
\ No newline at end of file
+    return text
@@ -0,0 +1,576 @@
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, List, NamedTuple, Optional, Type
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table, Text, bindparam, inspect, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, load_only
+
+from ..core.config import settings
+from ..core.database import Vector
+from ..models.embedding_migration import EmbeddingMigration
+from ..models.job import Job
+from ..models.resume import Resume
+from ..models.status import (
+    MIGRATION_RUNNING,
+    MIGRATION_BACKFILLED,
+    MIGRATION_COMPLETED,
+    MIGRATION_FAILED,
+)
+from .active_model import EMBEDDED_TABLES, use_active_model
+from .embedding_service import embed_documents, EmbeddingError
+from .index_service import vector_index_ddl
+from .job_service import job_embedding_text
+from .match_cache import invalidate_matches
+from .vector_index import invalidate_index
+
+logger = logging.getLogger(__name__)
+
+
+class _EmbeddedTable(NamedTuple):
+    model: Type[Any]  # Resume or Job
+    name: str
+    cursor: str  # keyset cursor attribute on EmbeddingMigration
+    text_for: Callable
+    columns: tuple  # columns to load for text_for
+    chunks: str  # chunk table
+    chunk_parent: str  # chunk table's foreign key to this table
+
+
+_TABLES: List[_EmbeddedTable] = [
+    _EmbeddedTable(
+        Resume, "resumes", "resume_cursor", lambda row: row.raw_text, ("id", "raw_text"),
+        "resume_chunks", "resume_id",
+    ),
+    _EmbeddedTable(
+        Job, "jobs", "job_cursor", job_embedding_text, ("id", "title", "description"),
+        "job_chunks", "job_id",
+    ),
+]
+
+# Shadow columns are added by start_migration, not mapped by the ORM. They
+# live outside Alembic on purpose: their vector size is the target of each
+# migration, known only at runtime, and flip_migration renames or drops them
+# (alembic/env.py keeps autogenerate from proposing to drop them meanwhile).
+# Chunk vectors are shadowed the same way, in whole "<chunks>_next" tables
+# that flip_migration swaps with the live chunk tables.
+_SHADOW_COLUMNS = ("embedding_next", "embedding_next_model", "embedding_next_at")
+
+# Flip attempts before giving up on rows changing (or locks timing out)
+# while locking
+_FLIP_ATTEMPTS = 5
+
+# Rows embedded since their shadow vector was written (or never shadowed)
+_STALE_FILTER = text(
+    "embedding IS NOT NULL AND "
+    "(embedding_next IS NULL OR embedding_next_at < COALESCE(updated_at, created_at))"
+)
+
+
+class ReembedError(Exception):
+    """Raised when a re-embedding migration cannot proceed."""
+    pass
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _existing_columns(db: Session, table: str) -> set:
+    return {column["name"] for column in inspect(db.connection()).get_columns(table)}
+
+
+def _reset_shadow_columns(db: Session, dimensions: int) -> None:
+    """
+    (Re)create empty shadow columns sized for the target model.
+
+    Plain ALTER TABLE in the caller's transaction rather than an Alembic
+    revision, since the size differs per migration (see _SHADOW_COLUMNS).
+    """
+    for table in _TABLES:
+        existing = _existing_columns(db, table.name)
+        for column in _SHADOW_COLUMNS:
+            if column in existing:
+                db.execute(text(f"ALTER TABLE {table.name} DROP COLUMN {column}"))
+
+        # Nullable columns without defaults: no table rewrite on PostgreSQL
+        db.execute(text(f"ALTER TABLE {table.name} ADD COLUMN embedding_next vector({int(dimensions)})"))
+        db.execute(text(f"ALTER TABLE {table.name} ADD COLUMN embedding_next_model VARCHAR(255)"))
+        db.execute(text(f"ALTER TABLE {table.name} ADD COLUMN embedding_next_at TIMESTAMP WITH TIME ZONE"))
+
+        db.execute(text(f"DROP TABLE IF EXISTS {table.chunks}_next"))
+        _shadow_chunk_table(table, dimensions).create(db.connection())
+
+
+def _shadow_chunk_table(table: _EmbeddedTable, dimensions: int) -> Table:
+    """Empty copy of a chunk table sized for the target model, without its ANN index."""
+    return Table(
+        f"{table.chunks}_next",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column(
+            table.chunk_parent,
+            Integer,
+            ForeignKey(table.model.__table__.c.id, ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        Column("chunk_index", Integer, nullable=False),
+        Column("content", Text, nullable=False),
+        Column("embedding", Vector(dimensions), nullable=False),
+    )
+
+
+def get_migration(db: Session, migration_id: int) -> Optional[EmbeddingMigration]:
+    """Get a re-embedding migration by ID."""
+    return db.get(EmbeddingMigration, migration_id)
+
+
+def get_latest_migration(db: Session) -> Optional[EmbeddingMigration]:
+    """Get the most recently started re-embedding migration."""
+    return db.query(EmbeddingMigration).order_by(EmbeddingMigration.id.desc()).first()
+
+
+def start_migration(db: Session, model: str, dimensions: int) -> EmbeddingMigration:
+    """
+    Start re-embedding every embedded resume and job with a new model.
+
+    Adds empty shadow columns (``embedding_next`` and its model tag) to both
+    tables and empty shadow chunk tables; matching keeps using the current
+    vectors until flip_migration.
+
+    Args:
+        db: Database session
+        model: Target embedding model
+        dimensions: Target vector size
+
+    Returns:
+        The new EmbeddingMigration
+
+    Raises:
+        ReembedError: If another migration is in progress
+    """
+    latest = get_latest_migration(db)
+    if latest and latest.status in (MIGRATION_RUNNING, MIGRATION_BACKFILLED):
+        raise ReembedError(f"Migration {latest.id} is still {latest.status}")
+
+    total = sum(
+        db.query(table.model).filter(table.model.embedding.isnot(None)).count()
+        for table in _TABLES
+    )
+    migration = EmbeddingMigration(
+        target_model=model,
+        target_dimensions=dimensions,
+        status=MIGRATION_RUNNING,
+        resume_cursor=0,
+        job_cursor=0,
+        total_rows=total,
+        processed_rows=0,
+    )
+    db.add(migration)
+    _reset_shadow_columns(db, dimensions)
+    db.commit()
+    db.refresh(migration)
+
+    logger.info(f"Started re-embedding migration {migration.id}: {total} rows to {model}")
+    return migration
+
+
+def _write_shadow(
+        db: Session,
+        table: _EmbeddedTable,
+        rows: list,
+        migration: EmbeddingMigration,
+) -> None:
+    """
+    Embed rows with the target model into the shadow column and chunk table.
+
+    Rows are embedded the way writers embed them (embed_documents), so in
+    chunked mode the shadow vector is the pooled chunk mean, as live ones are.
+    """
+    documents = embed_documents(
+        [table.text_for(row) for row in rows],
+        db,
+        model=migration.target_model,
+        dimensions=migration.target_dimensions,
+    )
+    statement = text(
+        f"UPDATE {table.name} SET embedding_next = :embedding, "
+        f"embedding_next_model = :model, embedding_next_at = CURRENT_TIMESTAMP "
+        f"WHERE id = :id"
+    ).bindparams(bindparam("embedding", type_=Vector()))
+    db.execute(
+        statement,
+        [
+            {"id": row.id, "embedding": document.embedding, "model": migration.target_model}
+            for row, document in zip(rows, documents)
+        ],
+    )
+
+    db.execute(
+        text(f"DELETE FROM {table.chunks}_next WHERE {table.chunk_parent} IN :ids")
+        .bindparams(bindparam("ids", expanding=True)),
+        {"ids": [row.id for row in rows]},
+    )
+    chunk_rows = [
+        {"parent": row.id, "position": position, "content": content, "embedding": embedding}
+        for row, document in zip(rows, documents)
+        for position, (content, embedding) in enumerate(document.chunks)
+    ]
+    if chunk_rows:
+        db.execute(
+            text(
+                f"INSERT INTO {table.chunks}_next "
+                f"({table.chunk_parent}, chunk_index, content, embedding) "
+                f"VALUES (:parent, :position, :content, :embedding)"
+            ).bindparams(bindparam("embedding", type_=Vector())),
+            chunk_rows,
+        )
+
+
+def process_migration_batch(
+        db: Session,
+        migration: EmbeddingMigration,
+        batch_size: Optional[int] = None,
+) -> int:
+    """
+    Backfill the next keyset page of shadow vectors.
+
+    Resumes are walked first, then jobs, in ID order from the cursors stored
+    on the migration, so an interrupted run resumes where it stopped.
+
+    Args:
+        db: Database session
+        migration: Running migration
+        batch_size: Rows per batch (one batched embedding call)
+
+    Returns:
+        Number of rows processed (0 once both tables have been walked)
+    """
+    batch_size = batch_size or settings.reembed_batch_size
+
+    for table in _TABLES:
+        rows = (
+            db.query(table.model)
+            .options(load_only(*[getattr(table.model, column) for column in table.columns]))
+            .filter(table.model.id > getattr(migration, table.cursor))
+            .filter(table.model.embedding.isnot(None))
+            .order_by(table.model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            continue
+
+        _write_shadow(db, table, rows, migration)
+        setattr(migration, table.cursor, rows[-1].id)
+        migration.processed_rows += len(rows)
+        db.commit()
+        return len(rows)
+
+    return 0
+
+
+def catch_up_migration(
+        db: Session,
+        migration: EmbeddingMigration,
+        batch_size: Optional[int] = None,
+) -> int:
+    """
+    Re-embed rows created or changed since their shadow vector was written.
+
+    Each table is walked once in ID order, committing every batch; rows
+    changed behind the walk are left for the next catch-up.
+
+    Args:
+        db: Database session
+        migration: Migration being backfilled
+        batch_size: Rows per batch
+
+    Returns:
+        Number of rows processed
+    """
+    batch_size = batch_size or settings.reembed_batch_size
+    processed = 0
+
+    for table in _TABLES:
+        last_id = 0
+        while True:
+            rows = (
+                db.query(table.model)
+                .options(load_only(*[getattr(table.model, column) for column in table.columns]))
+                .filter(_STALE_FILTER)
+                .filter(table.model.id > last_id)
+                .order_by(table.model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            _write_shadow(db, table, rows, migration)
+            last_id = rows[-1].id
+            processed += len(rows)
+            db.commit()
+
+    return processed
+
+
+def _has_stale_rows(db: Session) -> bool:
+    return any(
+        db.query(table.model.id).filter(_STALE_FILTER).first() is not None
+        for table in _TABLES
+    )
+
+
+def migration_progress(migration: EmbeddingMigration) -> dict:
+    """
+    Progress of a migration with throughput and ETA.
+
+    Args:
+        migration: Migration to report on
+
+    Returns:
+        Dict with percent_complete, rows_per_second and eta_seconds
+    """
+    total = max(migration.total_rows, migration.processed_rows)
+    percent = 100.0 if not total else migration.processed_rows / total * 100
+
+    rate = None
+    eta = None
+    if migration.created_at and migration.processed_rows:
+        created_at = migration.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        end = migration.completed_at or datetime.now(timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        elapsed = (end - created_at).total_seconds()
+        if elapsed > 0:
+            rate = migration.processed_rows / elapsed
+            if migration.status == MIGRATION_RUNNING:
+                eta = (total - migration.processed_rows) / rate
+
+    return {
+        "percent_complete": round(percent, 2),
+        "rows_per_second": round(rate, 2) if rate is not None else None,
+        "eta_seconds": round(eta) if eta is not None else None,
+    }
+
+
+def run_migration(
+        db: Session,
+        migration_id: int,
+        stop_event: Optional[threading.Event] = None,
+        batch_size: Optional[int] = None,
+) -> EmbeddingMigration:
+    """
+    Backfill a migration until done or stopped.
+
+    Safe to stop at any point and run again; failed migrations resume from
+    their cursors. Ends with a catch-up pass and status "backfilled".
+
+    Args:
+        db: Database session
+        migration_id: Migration to run
+        stop_event: Set to stop after the current batch
+        batch_size: Rows per batch
+
+    Returns:
+        The migration in its new state
+
+    Raises:
+        ReembedError: If the migration cannot be run
+    """
+    migration = get_migration(db, migration_id)
+    if migration is None:
+        raise ReembedError(f"Migration {migration_id} not found")
+    if migration.status not in (MIGRATION_RUNNING, MIGRATION_FAILED):
+        raise ReembedError(f"Migration {migration_id} is {migration.status}")
+
+    migration.status = MIGRATION_RUNNING
+    migration.error = None
+    db.commit()
+
+    stop_event = stop_event or threading.Event()
+    try:
+        while not stop_event.is_set():
+            if not process_migration_batch(db, migration, batch_size):
+                caught_up = catch_up_migration(db, migration, batch_size)
+                migration.status = MIGRATION_BACKFILLED
+                db.commit()
+                logger.info(
+                    f"Migration {migration.id} backfilled "
+                    f"({caught_up} rows caught up); ready to flip"
+                )
+                break
+
+            progress = migration_progress(migration)
+            logger.info(
+                f"Migration {migration.id}: {migration.processed_rows}/{migration.total_rows} "
+                f"rows ({progress['percent_complete']}%), ETA {progress['eta_seconds']}s"
+            )
+    except EmbeddingError as e:
+        db.rollback()
+        migration.status = MIGRATION_FAILED
+        migration.error = str(e)
+        db.commit()
+        logger.error(f"Migration {migration.id} failed, run again to resume: {e}")
+
+    return migration
+
+
+def _create_shadow_indexes(db: Session, dimensions: int) -> None:
+    """
+    Build ANN indexes on the shadow columns and chunk tables without
+    blocking writes.
+
+    They index the same compact search form as the live indexes they
+    replace (see settings.vector_quantization).
+    """
+    with db.get_bind().engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in _TABLES:
+            for name, target, column in (
+                    (f"ix_{table.name}_embedding_next", table.name, "embedding_next"),
+                    (f"ix_{table.chunks}_embedding_next", f"{table.chunks}_next", "embedding"),
+            ):
+                for statement in vector_index_ddl(name, target, column, dimensions):
+                    connection.execute(text(statement))
+
+
+def _chunk_table_objects(table: _EmbeddedTable, suffix: str) -> dict:
+    """Names of the objects PostgreSQL names after a chunk table, by kind."""
+    chunks, parent = table.chunks, table.chunk_parent
+    return {
+        "CONSTRAINT": [f"{chunks}{suffix}_pkey", f"{chunks}{suffix}_{parent}_fkey"],
+        "INDEX": [f"ix_{chunks}{suffix}_{parent}", f"ix_{chunks}_embedding{suffix}"],
+        "SEQUENCE": [f"{chunks}{suffix}_id_seq"],
+    }
+
+
+def _rename_chunk_objects(db: Session, table: _EmbeddedTable, old: str, new: str) -> None:
+    """Rename a renamed chunk table's indexes, constraints and ID sequence to match."""
+    old_names = _chunk_table_objects(table, old)
+    for kind, new_names in _chunk_table_objects(table, new).items():
+        for old_name, new_name in zip(old_names[kind], new_names):
+            if kind == "CONSTRAINT":
+                db.execute(text(
+                    f"ALTER TABLE {table.chunks}{new} RENAME CONSTRAINT {old_name} TO {new_name}"
+                ))
+            else:
+                db.execute(text(f"ALTER {kind} {old_name} RENAME TO {new_name}"))
+
+
+def _swap_columns(db: Session, postgres: bool) -> None:
+    """Move shadow vectors and chunk tables into place, keeping the live ones as *_prev."""
+    for table in _TABLES:
+        if "embedding_prev" in _existing_columns(db, table.name):
+            db.execute(text(f"ALTER TABLE {table.name} DROP COLUMN embedding_prev"))
+        db.execute(text(f"ALTER TABLE {table.name} RENAME COLUMN embedding TO embedding_prev"))
+        db.execute(text(f"ALTER TABLE {table.name} RENAME COLUMN embedding_next TO embedding"))
+        db.execute(text(f"ALTER TABLE {table.name} DROP COLUMN embedding_next_model"))
+        db.execute(text(f"ALTER TABLE {table.name} DROP COLUMN embedding_next_at"))
+        if postgres:
+            db.execute(text(f"ALTER INDEX ix_{table.name}_embedding RENAME TO ix_{table.name}_embedding_prev"))
+            db.execute(text(f"ALTER INDEX ix_{table.name}_embedding_next RENAME TO ix_{table.name}_embedding"))
+
+        db.execute(text(f"DROP TABLE IF EXISTS {table.chunks}_prev"))
+        db.execute(text(f"ALTER TABLE {table.chunks} RENAME TO {table.chunks}_prev"))
+        db.execute(text(f"ALTER TABLE {table.chunks}_next RENAME TO {table.chunks}"))
+        if postgres:
+            _rename_chunk_objects(db, table, "", "_prev")
+            _rename_chunk_objects(db, table, "_next", "")
+
+
+def flip_migration(db: Session, migration_id: int) -> EmbeddingMigration:
+    """
+    Atomically switch matching to the re-embedded vectors.
+
+    Builds ANN indexes on the shadow columns and chunk tables concurrently
+    and catches up on changed rows, then in one short transaction (tables
+    locked against writes, bounded by ``settings.reembed_lock_timeout_seconds``)
+    checks that no row changed since, renames ``embedding`` to
+    ``embedding_prev`` and ``embedding_next`` to ``embedding`` along with
+    their indexes, swaps in the shadow chunk tables and marks the migration
+    completed. Nothing is embedded while the tables are locked: if rows
+    changed, the lock is released and the catch-up runs again.
+
+    Every process embeds with the completed migration's model from then
+    on: writers check the active model before they write (see
+    active_model.embed_with_active_model). cleanup_migration drops the
+    previous vectors.
+
+    Args:
+        db: Database session
+        migration_id: Backfilled migration to flip
+
+    Returns:
+        The completed migration
+
+    Raises:
+        ReembedError: If the migration is not backfilled, or no attempt
+            found the tables unchanged once locked
+    """
+    migration = get_migration(db, migration_id)
+    if migration is None:
+        raise ReembedError(f"Migration {migration_id} not found")
+    if migration.status != MIGRATION_BACKFILLED:
+        raise ReembedError(f"Migration {migration_id} is {migration.status}, not backfilled")
+
+    postgres = _is_postgres(db)
+    if postgres:
+        _create_shadow_indexes(db, migration.target_dimensions)
+
+    for attempt in range(1, _FLIP_ATTEMPTS + 1):
+        # Embed rows written since the last pass, with no locks held
+        catch_up_migration(db, migration)
+
+        if postgres:
+            # Writers lock the same tables before checking the active model
+            # (active_model.lock_active_model), so none can write old-model
+            # vectors after this; lock errors just end the attempt
+            tables = EMBEDDED_TABLES + tuple(f"{table.chunks}_next" for table in _TABLES)
+            try:
+                db.execute(text(f"SET LOCAL lock_timeout = '{int(settings.reembed_lock_timeout_seconds)}s'"))
+                db.execute(text(f"LOCK TABLE {', '.join(tables)} IN ACCESS EXCLUSIVE MODE"))
+            except OperationalError as e:
+                db.rollback()
+                logger.warning(f"Migration {migration.id}: could not lock tables (attempt {attempt}): {e}")
+                continue
+
+        if not _has_stale_rows(db):
+            break
+
+        # Rows written before the lock was granted: catch up unlocked again
+        db.rollback()
+        logger.info(f"Migration {migration.id}: rows changed while locking (attempt {attempt})")
+    else:
+        raise ReembedError(
+            f"Migration {migration.id} not flipped after {_FLIP_ATTEMPTS} attempts; "
+            f"run the flip again"
+        )
+
+    _swap_columns(db, postgres)
+    migration.status = MIGRATION_COMPLETED
+    migration.completed_at = datetime.now(timezone.utc)
+    db.commit()
+    use_active_model(db)
+    invalidate_index()
+    invalidate_matches()
+
+    logger.info(f"Migration {migration.id} flipped to {migration.target_model}")
+    return migration
+
+
+def cleanup_migration(db: Session) -> None:
+    """Drop the previous vectors kept after the last flip."""
+    latest = get_latest_migration(db)
+    if latest is None or latest.status != MIGRATION_COMPLETED:
+        raise ReembedError("No completed migration to clean up")
+
+    for table in _TABLES:
+        if "embedding_prev" in _existing_columns(db, table.name):
+            db.execute(text(f"ALTER TABLE {table.name} DROP COLUMN embedding_prev"))
+        db.execute(text(f"DROP TABLE IF EXISTS {table.chunks}_prev"))
+    db.commit()
+    logger.info("Dropped previous embedding columns and chunk tables")
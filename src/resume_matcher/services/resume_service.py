@@ -1,11 +1,35 @@
+import asyncio
 import logging
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, undefer, with_expression
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy import func, select, insert
 
+from ..core.config import settings
+from ..core.database import run_with_session
+from ..core.metrics import track_operation
 from ..models.resume import Resume
+from ..models.chunk import ResumeChunk
+from ..models.status import EMBEDDING_PENDING, EMBEDDING_READY, EMBEDDING_FAILED
 from ..schemas.resume import ResumeCreate
-from .embedding_service import get_embedding, EmbeddingError
+from .embedding_service import (
+    get_embedding,
+    get_embeddings_batch,
+    embed_documents,
+    aget_embedding,
+    aembed_documents,
+    DocumentEmbedding,
+    EmbeddingError,
+)
+from .active_model import embed_with_active_model, aembed_with_active_model
+from .tokenizer import count_tokens
+from .match_cache import invalidate_matches
+from .topk_service import refresh_topk
+from .vector_index import VectorIndex, update_index
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +39,50 @@ class ResumeNotFoundError(Exception):
     pass
 
 
+def _apply_document(resume: Resume, document: DocumentEmbedding) -> None:
+    resume.embedding = document.embedding
+    if settings.embedding_chunking:
+        resume.chunks = [
+            ResumeChunk(chunk_index=position, content=content, embedding=embedding)
+            for position, (content, embedding) in enumerate(document.chunks)
+        ]
+    resume.embedding_status = EMBEDDING_READY
+
+
+def _resume_document(db: Session, resume: Resume) -> DocumentEmbedding:
+    if settings.embedding_chunking:
+        return embed_documents([resume.raw_text], db=db)[0]
+    return DocumentEmbedding(get_embedding(resume.raw_text, db=db), [])
+
+
+def _embed_resume(db: Session, resume: Resume) -> None:
+    """Embed a resume's text with the active model, storing per-chunk vectors in chunked mode."""
+    _apply_document(resume, embed_with_active_model(db, lambda: _resume_document(db, resume)))
+
+
+async def _aembed_resume(db: "AsyncSession", resume: Resume) -> None:
+    async def embed() -> DocumentEmbedding:
+        if settings.embedding_chunking:
+            return (await aembed_documents([resume.raw_text], db=db))[0]
+        return DocumentEmbedding(await aget_embedding(resume.raw_text, db=db), [])
+
+    _apply_document(resume, await aembed_with_active_model(db, embed))
+
+
+def _embed_texts(db: Session, texts: List[str]) -> List[DocumentEmbedding]:
+    if settings.embedding_chunking:
+        return embed_documents(texts, db=db)
+    return [DocumentEmbedding(embedding, []) for embedding in get_embeddings_batch(texts, db=db)]
+
+
+@track_operation("create_resume")
 def create_resume(db: Session, resume_data: ResumeCreate) -> Resume:
     """
     Create a new resume and generate its embedding.
 
+    With ``settings.embedding_async`` the resume is saved as pending and the
+    embedding worker fills it in, so this makes no API calls.
+
     Args:
         db: Database session
         resume_data: Resume creation data
@@ -34,30 +98,179 @@ def create_resume(db: Session, resume_data: ResumeCreate) -> Resume:
         raw_text=resume_data.raw_text,
     )
 
-    # Generate embedding
-    try:
-        embedding = get_embedding(resume_data.raw_text)
-        resume.embedding = embedding
-        logger.info(f"Generated embedding for resume: {resume_data.name}")
-    except EmbeddingError as e:
-        logger.error(f"Failed to generate embedding: {e}")
-        # Continue without embedding - can be generated later
+    if settings.embedding_async:
+        resume.embedding_status = EMBEDDING_PENDING
+    else:
+        # Generate embedding
+        try:
+            _embed_resume(db, resume)
+            logger.info(f"Generated embedding for resume: {resume_data.name}")
+        except EmbeddingError as e:
+            resume.embedding_status = EMBEDDING_FAILED
+            logger.error(f"Failed to generate embedding: {e}")
+            # Continue without embedding - can be generated later
 
     db.add(resume)
     db.commit()
     db.refresh(resume)
+    resumes_written(db, [resume.id])
 
     return resume
 
 
-def get_resume(db: Session, resume_id: int) -> Optional[Resume]:
-    """Get a resume by ID."""
-    return db.query(Resume).filter(Resume.id == resume_id).first()
+@track_operation("acreate_resume")
+async def acreate_resume(db: "AsyncSession", resume_data: ResumeCreate) -> Resume:
+    """
+    Async create_resume for the async request path.
+
+    The embedding call and the INSERT both await instead of holding a
+    worker thread.
+
+    Args:
+        db: Async database session
+        resume_data: Resume creation data
+
+    Returns:
+        Created Resume object
+    """
+    resume = Resume(
+        name=resume_data.name,
+        email=resume_data.email,
+        filename=resume_data.filename,
+        raw_text=resume_data.raw_text,
+    )
+
+    if settings.embedding_async:
+        resume.embedding_status = EMBEDDING_PENDING
+    else:
+        try:
+            await _aembed_resume(db, resume)
+            logger.info(f"Generated embedding for resume: {resume_data.name}")
+        except EmbeddingError as e:
+            resume.embedding_status = EMBEDDING_FAILED
+            logger.error(f"Failed to generate embedding: {e}")
+
+    db.add(resume)
+    await db.commit()
+    await db.refresh(resume)
+    await aresumes_written([resume.id])
+
+    return resume
+
+
+def _embedding_batches(
+        resumes_data: List[ResumeCreate],
+        max_items: int,
+        max_tokens: int,
+) -> Iterator[List[ResumeCreate]]:
+    """Split resumes into batches bounded by item count and estimated tokens."""
+    batch: List[ResumeCreate] = []
+    batch_tokens = 0
+    for resume_data in resumes_data:
+        tokens = min(count_tokens(resume_data.raw_text), settings.embedding_max_tokens)
+        if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(resume_data)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+@track_operation("bulk_create_resumes")
+def bulk_create_resumes(
+        db: Session,
+        resumes_data: List[ResumeCreate],
+) -> List[Tuple[int, str]]:
+    """
+    Create many resumes with batched embedding calls and bulk INSERTs.
+
+    Resumes are grouped into batches bounded by
+    ``settings.bulk_upload_batch_size`` and ``settings.bulk_upload_batch_tokens``;
+    each batch costs one embedding API call and one multi-row INSERT.
+
+    Args:
+        db: Database session
+        resumes_data: Resume creation data
+
+    Returns:
+        (resume ID, embedding status) for each input, in input order
+    """
+    created: List[Tuple[int, str]] = []
+
+    for batch in _embedding_batches(
+            resumes_data,
+            settings.bulk_upload_batch_size,
+            settings.bulk_upload_batch_tokens,
+    ):
+        embeddings: List[Optional[List[float]]] = [None] * len(batch)
+        chunks: List[List[Tuple[str, List[float]]]] = [[] for _ in batch]
+        if settings.embedding_async:
+            status = EMBEDDING_PENDING
+        else:
+            texts = [resume_data.raw_text for resume_data in batch]
+            try:
+                documents = embed_with_active_model(db, lambda: _embed_texts(db, texts))
+                embeddings = [document.embedding for document in documents]
+                chunks = [document.chunks for document in documents]
+                status = EMBEDDING_READY
+            except EmbeddingError as e:
+                logger.error(f"Failed to generate embeddings for {len(batch)} resumes: {e}")
+                status = EMBEDDING_FAILED
+
+        rows = [
+            {
+                "name": resume_data.name,
+                "email": resume_data.email,
+                "filename": resume_data.filename,
+                "raw_text": resume_data.raw_text,
+                "embedding": embedding,
+                "embedding_status": status,
+            }
+            for resume_data, embedding in zip(batch, embeddings)
+        ]
+        result = db.execute(
+            insert(Resume).returning(Resume.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = result.scalars().all()
+
+        chunk_rows = [
+            {
+                "resume_id": resume_id,
+                "chunk_index": position,
+                "content": content,
+                "embedding": embedding,
+            }
+            for resume_id, resume_chunks in zip(ids, chunks)
+            for position, (content, embedding) in enumerate(resume_chunks)
+        ]
+        if chunk_rows:
+            db.execute(insert(ResumeChunk), chunk_rows)
+        db.commit()
+
+        created.extend((resume_id, status) for resume_id in ids)
+        logger.info(f"Bulk inserted {len(ids)} resumes")
+
+    if created:
+        resumes_written(db, [resume_id for resume_id, _ in created])
+
+    return created
+
+
+def get_resume(db: Session, resume_id: int, *options: ORMOption) -> Optional[Resume]:
+    """
+    Get a resume by ID.
+
+    raw_text and embedding are deferred; pass e.g. ``undefer(Resume.embedding)``
+    in ``options`` to load them with the row.
+    """
+    return db.query(Resume).options(*options).filter(Resume.id == resume_id).first()
 
 
-def get_resume_or_404(db: Session, resume_id: int) -> Resume:
+def get_resume_or_404(db: Session, resume_id: int, *options: ORMOption) -> Resume:
     """Get a resume by ID or raise error."""
-    resume = get_resume(db, resume_id)
+    resume = get_resume(db, resume_id, *options)
     if not resume:
         raise ResumeNotFoundError(f"Resume with ID {resume_id} not found")
     return resume
@@ -72,6 +285,53 @@ def get_resumes(
     return db.query(Resume).offset(skip).limit(limit).all()
 
 
+# Columns listed by GET /resumes: everything the list response needs, with
+# the 1536-float vector reduced to an IS NOT NULL flag and raw_text left out
+_SUMMARY_COLUMNS = (
+    Resume.id,
+    Resume.name,
+    Resume.email,
+    Resume.filename,
+    Resume.created_at,
+    Resume.embedding_status,
+    Resume.has_embedding,
+)
+
+
+def _summary_query(limit: int, after_id: Optional[int], skip: int):
+    query = select(*_SUMMARY_COLUMNS).order_by(Resume.id).limit(limit)
+    if after_id is not None:
+        return query.where(Resume.id > after_id)
+    return query.offset(skip)
+
+
+@track_operation("get_resume_summaries")
+def get_resume_summaries(
+        db: Session,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        skip: int = 0,
+) -> List[Row]:
+    """
+    List resumes in ID order without loading their text or embedding.
+
+    Pass the last ``id`` of a page as ``after_id`` to get the next one. This
+    seeks on the primary key, so a deep page costs the same as the first;
+    ``skip`` is the old offset paging and is ignored when ``after_id`` is set.
+
+    Args:
+        db: Database session
+        limit: Maximum rows to return
+        after_id: Return only resumes with a greater ID (keyset cursor)
+        skip: Rows to skip when no cursor is given
+
+    Returns:
+        Rows with the listed columns and a boolean ``has_embedding``
+    """
+    return list(db.execute(_summary_query(limit, after_id, skip)).all())
+
+
+@track_operation("delete_resume")
 def delete_resume(db: Session, resume_id: int) -> bool:
     """Delete a resume by ID."""
     resume = get_resume(db, resume_id)
@@ -80,18 +340,97 @@ def delete_resume(db: Session, resume_id: int) -> bool:
 
     db.delete(resume)
     db.commit()
+    resumes_written(db, [resume_id], deleted=True)
     return True
 
 
+async def aget_resume(
+        db: "AsyncSession",
+        resume_id: int,
+        *options: ORMOption,
+) -> Optional[Resume]:
+    """Async get_resume."""
+    return await db.get(Resume, resume_id, options=options)
+
+
+def _text_preview(length: int) -> ORMOption:
+    # One character past the preview tells the caller whether it was cut
+    return with_expression(Resume.text_preview, func.substr(Resume.raw_text, 1, length + 1))
+
+
+def get_resume_with_preview(db: Session, resume_id: int, length: int = 500) -> Optional[Resume]:
+    """
+    Get a resume with ``text_preview`` set to the start of its text.
+
+    The substring is taken in SQL so the full raw_text never leaves the
+    database. ``text_preview`` holds ``length + 1`` characters when the
+    text is longer than ``length``.
+
+    Args:
+        db: Database session
+        resume_id: ID of the resume
+        length: Preview length in characters
+
+    Returns:
+        Resume, or None if it does not exist
+    """
+    return get_resume(db, resume_id, _text_preview(length))
+
+
+async def aget_resume_with_preview(
+        db: "AsyncSession",
+        resume_id: int,
+        length: int = 500,
+) -> Optional[Resume]:
+    """Async get_resume_with_preview."""
+    return await aget_resume(db, resume_id, _text_preview(length))
+
+
+async def aget_resumes(
+        db: "AsyncSession",
+        skip: int = 0,
+        limit: int = 100
+) -> List[Resume]:
+    """Async get_resumes."""
+    result = await db.scalars(select(Resume).offset(skip).limit(limit))
+    return list(result.all())
+
+
+@track_operation("aget_resume_summaries")
+async def aget_resume_summaries(
+        db: "AsyncSession",
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        skip: int = 0,
+) -> List[Row]:
+    """Async get_resume_summaries."""
+    result = await db.execute(_summary_query(limit, after_id, skip))
+    return list(result.all())
+
+
+@track_operation("adelete_resume")
+async def adelete_resume(db: "AsyncSession", resume_id: int) -> bool:
+    """Async delete_resume."""
+    resume = await aget_resume(db, resume_id)
+    if not resume:
+        return False
+
+    await db.delete(resume)
+    await db.commit()
+    await aresumes_written([resume_id], deleted=True)
+    return True
+
+
+@track_operation("regenerate_embedding")
 def regenerate_embedding(db: Session, resume_id: int) -> Resume:
     """Regenerate embedding for a resume."""
-    resume = get_resume_or_404(db, resume_id)
+    resume = get_resume_or_404(db, resume_id, undefer(Resume.raw_text))
 
     try:
-        embedding = get_embedding(resume.raw_text)
-        resume.embedding = embedding
+        _embed_resume(db, resume)
         db.commit()
         db.refresh(resume)
+        resumes_written(db, [resume_id])
         logger.info(f"Regenerated embedding for resume ID {resume_id}")
     except EmbeddingError as e:
         raise EmbeddingError(f"Failed to regenerate embedding: {e}")
@@ -99,6 +438,39 @@ def regenerate_embedding(db: Session, resume_id: int) -> Resume:
     return resume
 
 
-def get_resumes_with_embeddings(db: Session) -> List[Resume]:
-    """Get all resumes that have embeddings."""
-    return db.query(Resume).filter(Resume.embedding.isnot(None)).all()
\ No newline at end of file
+def get_resumes_with_embeddings(db: Session, resume_ids: Optional[List[int]] = None) -> List[Resume]:
+    """Get all resumes (or only ``resume_ids``) that have embeddings."""
+    query = (
+        db.query(Resume)
+        .options(undefer(Resume.embedding))
+        .filter(Resume.embedding.isnot(None))
+    )
+    if resume_ids is not None:
+        query = query.filter(Resume.id.in_(resume_ids))
+    return query.all()
+
+
+def resumes_written(db: Session, resume_ids: List[int], deleted: bool = False) -> None:
+    """
+    Bring the in-memory index, match cache and match_topk up to date after
+    resumes were committed.
+
+    Only the written rows are loaded; the cached index is updated in place
+    and match_topk scores them against the other side's cached index.
+    """
+    written = None
+    if not deleted:
+        written = VectorIndex.from_rows("resumes", get_resumes_with_embeddings(db, resume_ids))
+    update_index("resumes", resume_ids, written)
+    invalidate_matches()
+    refresh_topk(db, "resumes", resume_ids, deleted, written)
+
+
+async def aresumes_written(resume_ids: List[int], deleted: bool = False) -> None:
+    """
+    Async resumes_written, in a worker thread with its own sync session.
+
+    Index updates and top-K scoring are NumPy work that would otherwise
+    stall the event loop.
+    """
+    await asyncio.to_thread(run_with_session, resumes_written, resume_ids, deleted)
\ No newline at end of file
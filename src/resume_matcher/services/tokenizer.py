@@ -0,0 +1,126 @@
+import logging
+import math
+from functools import lru_cache
+from typing import List, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Used when tiktoken is not installed. English prose averages ~4 chars per
+# token; estimating on the low side keeps truncation under the API limit.
+_FALLBACK_CHARS_PER_TOKEN = 3.5
+
+
+@lru_cache()
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("tiktoken not installed; estimating token counts from length")
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens a text costs for an embedding model.
+
+    Args:
+        text: Text to count
+        model: Model name (defaults to ``settings.embedding_model``)
+
+    Returns:
+        Exact count with tiktoken, otherwise an estimate
+    """
+    encoding = _get_encoding(model or settings.embedding_model)
+    if encoding is None:
+        return math.ceil(len(text) / _FALLBACK_CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    Truncate text to at most ``max_tokens`` tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        model: Model name (defaults to ``settings.embedding_model``)
+
+    Returns:
+        The text unchanged if it fits, otherwise its longest fitting prefix
+    """
+    encoding = _get_encoding(model or settings.embedding_model)
+    if encoding is None:
+        return text[:int(max_tokens * _FALLBACK_CHARS_PER_TOKEN)]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _snap_to_whitespace(text: str, position: int, window: int) -> int:
+    """Move a character offset back to the nearest whitespace within a window."""
+    if position >= len(text):
+        return len(text)
+    cut = text.rfind(" ", max(0, position - window), position)
+    newline = text.rfind("\n", max(0, position - window), position)
+    cut = max(cut, newline)
+    return cut + 1 if cut >= 0 else position
+
+
+def split_into_chunks(
+        text: str,
+        chunk_tokens: int,
+        overlap_tokens: int = 0,
+        max_chunks: Optional[int] = None,
+        model: Optional[str] = None,
+) -> List[str]:
+    """
+    Split text into overlapping windows of at most ``chunk_tokens`` tokens.
+
+    Args:
+        text: Text to split
+        chunk_tokens: Tokens per chunk
+        overlap_tokens: Tokens shared by consecutive chunks
+        max_chunks: Stop after this many chunks
+        model: Model name (defaults to ``settings.embedding_model``)
+
+    Returns:
+        List of chunk texts (a single chunk if the text fits)
+    """
+    if overlap_tokens >= chunk_tokens:
+        raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+
+    step = chunk_tokens - overlap_tokens
+    chunks: List[str] = []
+    encoding = _get_encoding(model or settings.embedding_model)
+
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        for start in range(0, max(len(tokens), 1), step):
+            chunks.append(encoding.decode(tokens[start:start + chunk_tokens]))
+            if start + chunk_tokens >= len(tokens):
+                break
+            if max_chunks and len(chunks) >= max_chunks:
+                break
+        return chunks
+
+    chunk_chars = int(chunk_tokens * _FALLBACK_CHARS_PER_TOKEN)
+    step_chars = int(step * _FALLBACK_CHARS_PER_TOKEN)
+    start = 0
+    while True:
+        end = _snap_to_whitespace(text, start + chunk_chars, chunk_chars // 4)
+        chunks.append(text[start:end].strip())
+        if end >= len(text) or (max_chunks and len(chunks) >= max_chunks):
+            break
+        overlap_start = _snap_to_whitespace(text, end - (chunk_chars - step_chars), chunk_chars // 4)
+        start = max(overlap_start, start + 1)
+    return chunks
@@ -0,0 +1,480 @@
+import logging
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, delete, func, insert, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.metrics import track_operation
+from ..models.job import Job
+from ..models.match_topk import MatchTopK
+from ..models.resume import Resume
+from ..schemas.match import MatchResult, MatchResponse
+from .vector_index import VectorIndex, get_index, get_embedded_count
+
+logger = logging.getLogger(__name__)
+
+# direction -> (source kind, target kind); kinds name the tables/indexes
+DIRECTIONS: Dict[str, Tuple[str, str]] = {
+    "jobs": ("resumes", "jobs"),  # each resume's best jobs
+    "resumes": ("jobs", "resumes"),  # each job's best candidates
+}
+
+# Rows per executemany / IN list
+_WRITE_BATCH = 1000
+
+
+class TopKNotFoundError(Exception):
+    """Raised when a resume or job has no precomputed matches."""
+    pass
+
+
+def _index(db: Session, kind: str) -> VectorIndex:
+    """Shared in-memory index of all embedded resumes or jobs."""
+    from .match_service import build_job_index, build_resume_index
+
+    if kind == "jobs":
+        return get_index("jobs", lambda: build_job_index(db))
+    return get_index("resumes", lambda: build_resume_index(db))
+
+
+def _embedded_count(db: Session, kind: str) -> int:
+    """Number of embedded resumes or jobs, without building their index."""
+    model = Job if kind == "jobs" else Resume
+    return get_embedded_count(
+        kind, lambda: db.query(model).filter(model.embedding.isnot(None)).count()
+    )
+
+
+def _direction_with_source(kind: str) -> str:
+    return "resumes" if kind == "jobs" else "jobs"
+
+
+def _insert_rows(db: Session, rows: List[dict]) -> None:
+    for start in range(0, len(rows), _WRITE_BATCH):
+        db.execute(insert(MatchTopK), rows[start:start + _WRITE_BATCH])
+
+
+def _list_rows(
+        direction: str,
+        source_ids: Sequence[int],
+        target_index: VectorIndex,
+        all_hits: List[List[Tuple[int, float]]],
+) -> List[dict]:
+    return [
+        {
+            "direction": direction,
+            "source_id": int(source_id),
+            "target_id": int(target_index.ids[pos]),
+            "score": score,
+        }
+        for source_id, hits in zip(source_ids, all_hits)
+        for pos, score in hits
+    ]
+
+
+def _recompute_lists(
+        db: Session,
+        direction: str,
+        source_ids: Sequence[int],
+        source_index: Optional[VectorIndex] = None,
+) -> None:
+    """
+    Replace the top-K lists of some sources with a fresh exact search.
+
+    ``source_index`` holds the sources' vectors; by default the shared index
+    of the source kind.
+    """
+    source_kind, target_kind = DIRECTIONS[direction]
+    if source_index is None:
+        source_index = _index(db, source_kind)
+    target_index = _index(db, target_kind)
+
+    positions = {source_id: source_index.position(source_id) for source_id in source_ids}
+    present = {source_id: pos for source_id, pos in positions.items() if pos is not None}
+
+    db.execute(
+        delete(MatchTopK)
+        .where(MatchTopK.direction == direction)
+        .where(MatchTopK.source_id.in_(list(source_ids)))
+    )
+    if not present:
+        return
+
+    queries = source_index.matrix[list(present.values())]
+    all_hits = target_index.search_batch(
+        queries,
+        settings.match_topk_size,
+        query_block=settings.match_batch_query_block,
+        index_block=settings.match_batch_index_block,
+    )
+    _insert_rows(db, _list_rows(direction, list(present), target_index, all_hits))
+
+
+def _thresholds(
+        db: Session,
+        direction: str,
+        source_ids: Sequence[int],
+) -> Dict[int, Tuple[int, float]]:
+    """Current size and K-th score of some lists."""
+    thresholds: Dict[int, Tuple[int, float]] = {}
+    for start in range(0, len(source_ids), _WRITE_BATCH):
+        query = (
+            db.query(
+                MatchTopK.source_id,
+                func.count(MatchTopK.id).label("size"),
+                func.min(MatchTopK.score).label("kth_score"),
+            )
+            .filter(
+                MatchTopK.direction == direction,
+                MatchTopK.source_id.in_(source_ids[start:start + _WRITE_BATCH]),
+            )
+            .group_by(MatchTopK.source_id)
+        )
+        thresholds.update((row.source_id, (row.size, row.kth_score)) for row in query)
+    return thresholds
+
+
+def _entering_rows(
+        db: Session,
+        direction: str,
+        written: VectorIndex,
+        source_index: VectorIndex,
+        target_count: int,
+        skip: Set[int],
+) -> List[dict]:
+    """
+    Rows for the lists that written targets now belong in.
+
+    The written vectors are scored against every source in
+    (query_block x index_block) tiles. Pairs scoring 0 or more (the
+    search's own bar) are candidates; each candidate list's size and K-th
+    score are read from the table, and the target enters if the list holds
+    fewer than K rows or it beats the K-th. With K or fewer targets no list
+    is full, so nothing is read. Lists in ``skip`` are recomputed separately.
+    """
+    if len(written) == 0 or len(source_index) == 0:
+        return []
+
+    k = settings.match_topk_size
+    matrix = source_index.matrix
+    alive = source_index.alive[:len(matrix)]
+    source_ids = source_index.ids[:len(matrix)]
+    query_block = settings.match_batch_query_block
+    index_block = settings.match_batch_index_block
+
+    # (target ID, source ID, score) of every candidate pair
+    candidates: List[Tuple[int, int, float]] = []
+    for q_start in range(0, len(written.ids), query_block):
+        block = written.matrix[q_start:q_start + query_block]
+        block_ids = written.ids[q_start:q_start + query_block]
+        for i_start in range(0, len(matrix), index_block):
+            scores = block @ matrix[i_start:i_start + index_block].T
+            scores[:, ~alive[i_start:i_start + index_block]] = -np.inf
+            hit_rows, hit_cols = np.nonzero(scores >= 0.0)
+            candidates.extend(zip(
+                block_ids[hit_rows].tolist(),
+                source_ids[i_start + hit_cols].tolist(),
+                scores[hit_rows, hit_cols].tolist(),
+            ))
+
+    candidates = [pair for pair in candidates if pair[1] not in skip]
+    thresholds: Dict[int, Tuple[int, float]] = {}
+    if target_count > k:
+        thresholds = _thresholds(db, direction, sorted({source_id for _, source_id, _ in candidates}))
+
+    rows = []
+    for target_id, source_id, score in candidates:
+        size, kth_score = thresholds.get(source_id, (0, 0.0))
+        if size < k or score > kth_score:
+            rows.append({
+                "direction": direction,
+                "source_id": source_id,
+                "target_id": target_id,
+                "score": score,
+            })
+    return rows
+
+
+def _trim_lists(db: Session, direction: str, source_ids: Sequence[int]) -> None:
+    """Delete everything past the K-th best row of each given list."""
+    statement = text("""
+        DELETE FROM match_topk
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source_id ORDER BY score DESC, target_id
+                       ) AS position
+                FROM match_topk
+                WHERE direction = :direction AND source_id IN :source_ids
+            ) ranked
+            WHERE position > :k
+        )
+    """).bindparams(bindparam("source_ids", expanding=True))
+
+    source_ids = list(source_ids)
+    for start in range(0, len(source_ids), _WRITE_BATCH):
+        db.execute(statement, {
+            "direction": direction,
+            "source_ids": source_ids[start:start + _WRITE_BATCH],
+            "k": settings.match_topk_size,
+        })
+
+
+@track_operation("rebuild_topk")
+def rebuild_topk(db: Session, batch_size: int = 1000) -> int:
+    """
+    Recompute the whole match_topk table.
+
+    Each direction is one blocked NumPy search of every source against the
+    in-memory index of every target, written in slices of ``batch_size``
+    sources.
+
+    Args:
+        db: Database session
+        batch_size: Sources searched and inserted per slice
+
+    Returns:
+        Number of rows written
+    """
+    db.execute(delete(MatchTopK))
+    written = 0
+
+    for direction, (source_kind, target_kind) in DIRECTIONS.items():
+        source_index = _index(db, source_kind)
+        target_index = _index(db, target_kind)
+
+        matrix = source_index.matrix
+        for start in range(0, len(matrix), batch_size):
+            # Skip rows replaced or removed since the index was built
+            live = source_index.alive[start:start + batch_size]
+            all_hits = target_index.search_batch(
+                matrix[start:start + batch_size][live],
+                settings.match_topk_size,
+                query_block=settings.match_batch_query_block,
+                index_block=settings.match_batch_index_block,
+            )
+            rows = _list_rows(
+                direction, source_index.ids[start:start + batch_size][live], target_index, all_hits
+            )
+            _insert_rows(db, rows)
+            written += len(rows)
+
+    db.commit()
+    logger.info(f"Rebuilt match_topk with {written} rows")
+    return written
+
+
+@track_operation("refresh_topk")
+def refresh_topk(
+        db: Session,
+        kind: str,
+        ids: List[int],
+        deleted: bool = False,
+        written: Optional[VectorIndex] = None,
+) -> None:
+    """
+    Bring match_topk up to date after resumes or jobs were written.
+
+    - The written documents' own lists are recomputed (or dropped).
+    - Lists that contained a written document are recomputed, since its
+      score changed or it is gone.
+    - Every other list gets a written document only if it beats that
+      list's current K-th score. The written vectors are scored against
+      the cached index of the other side, which the write didn't change,
+      and only lists the score can enter are read from the table.
+
+    Cost per write, all inside the writing request: one NumPy scan of the
+    other side's index per written document, plus reading the size and
+    K-th score of every list the documents score 0 or more against (with
+    OpenAI embeddings, nearly all of them: O(sources x K) index entries).
+    The other side's whole index must be in memory for this; when its
+    cache is cold or expired (``settings.vector_index_ttl_seconds``) the
+    write also pays for loading every embedded vector of that side. The
+    written side's index is only needed to repair affected lists, and is
+    kept current in place by ``update_index``. Deployments where that is
+    too slow for the request path should leave this off and run
+    ``rebuild_topk`` periodically instead.
+
+    A no-op unless ``settings.match_topk_enabled``. Must run after the
+    write is committed and applied to the in-memory index. Failures are
+    logged and rolled back rather than raised, so they never fail the
+    write itself; ``rebuild_topk`` repairs the table.
+
+    Args:
+        db: Database session
+        kind: "resumes" or "jobs" — the table that was written
+        ids: Written document IDs
+        deleted: The documents were deleted
+        written: The written documents that are embedded, as a small
+            index (loaded from the database when not given)
+    """
+    if not settings.match_topk_enabled or not ids:
+        return
+
+    try:
+        _refresh_topk(db, kind, ids, deleted, written)
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Failed to refresh match_topk for {kind} {ids}: {e}")
+
+
+def _written_index(db: Session, kind: str, ids: List[int]) -> VectorIndex:
+    from .job_service import get_jobs_with_embeddings
+    from .resume_service import get_resumes_with_embeddings
+
+    if kind == "jobs":
+        return VectorIndex.from_rows("jobs", get_jobs_with_embeddings(db, ids))
+    return VectorIndex.from_rows("resumes", get_resumes_with_embeddings(db, ids))
+
+
+def _refresh_topk(
+        db: Session,
+        kind: str,
+        ids: List[int],
+        deleted: bool,
+        written: Optional[VectorIndex],
+) -> None:
+    own_direction = _direction_with_source(kind)
+    other_direction = kind  # lists in which these documents are targets
+    other_kind = DIRECTIONS[other_direction][0]
+
+    affected = [
+        row.source_id
+        for row in db.query(MatchTopK.source_id)
+        .filter(MatchTopK.direction == other_direction, MatchTopK.target_id.in_(ids))
+        .distinct()
+    ]
+
+    if deleted:
+        db.execute(
+            delete(MatchTopK)
+            .where(MatchTopK.direction == own_direction)
+            .where(MatchTopK.source_id.in_(ids))
+        )
+    else:
+        if written is None:
+            written = _written_index(db, kind, ids)
+        _recompute_lists(db, own_direction, ids, source_index=written)
+
+        rows = _entering_rows(
+            db,
+            other_direction,
+            written,
+            _index(db, other_kind),
+            _embedded_count(db, kind),
+            set(affected),
+        )
+        _insert_rows(db, rows)
+        _trim_lists(db, other_direction, sorted({row["source_id"] for row in rows}))
+
+    if affected:
+        _recompute_lists(db, other_direction, affected)
+
+    db.commit()
+    logger.info(
+        f"Refreshed match_topk for {len(ids)} {kind}: {len(affected)} lists recomputed"
+    )
+
+
+@track_operation("get_topk_jobs")
+def get_topk_jobs(
+        db: Session,
+        resume_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+) -> MatchResponse:
+    """
+    Read a resume's precomputed best jobs.
+
+    One range scan of the (direction, source_id, score) index joined to
+    jobs by primary key; no vector search.
+
+    Args:
+        db: Database session
+        resume_id: ID of the resume
+        top_k: Number of matches to return (at most ``settings.match_topk_size``)
+        min_score: Minimum similarity score threshold
+
+    Returns:
+        MatchResponse with ranked job matches
+
+    Raises:
+        TopKNotFoundError: If the resume does not exist
+    """
+    resume = db.get(Resume, resume_id)
+    if resume is None:
+        raise TopKNotFoundError(f"Resume {resume_id} not found")
+
+    rows = (
+        db.query(MatchTopK.target_id, MatchTopK.score, Job.title, Job.company)
+        .join(Job, Job.id == MatchTopK.target_id)
+        .filter(
+            MatchTopK.direction == "jobs",
+            MatchTopK.source_id == resume_id,
+            MatchTopK.score >= min_score,
+        )
+        .order_by(MatchTopK.score.desc())
+        .limit(top_k)
+        .all()
+    )
+
+    return MatchResponse(
+        resume_id=resume.id,
+        resume_name=resume.name,
+        total_jobs_compared=_embedded_count(db, "jobs"),
+        matches=[
+            MatchResult(
+                job_id=row.target_id,
+                job_title=row.title,
+                company=row.company,
+                similarity_score=round(row.score, 4),
+                match_percentage=round(row.score * 100),
+            )
+            for row in rows
+        ],
+    )
+
+
+@track_operation("get_topk_resumes")
+def get_topk_resumes(
+        db: Session,
+        job_id: int,
+        top_k: int = 10,
+        min_score: float = 0.0,
+) -> List[dict]:
+    """
+    Read a job's precomputed best candidates (see get_topk_jobs).
+
+    Raises:
+        TopKNotFoundError: If the job does not exist
+    """
+    if db.get(Job, job_id) is None:
+        raise TopKNotFoundError(f"Job {job_id} not found")
+
+    rows = (
+        db.query(MatchTopK.target_id, MatchTopK.score, Resume.name, Resume.email)
+        .join(Resume, Resume.id == MatchTopK.target_id)
+        .filter(
+            MatchTopK.direction == "resumes",
+            MatchTopK.source_id == job_id,
+            MatchTopK.score >= min_score,
+        )
+        .order_by(MatchTopK.score.desc())
+        .limit(top_k)
+        .all()
+    )
+
+    return [
+        {
+            "resume_id": row.target_id,
+            "name": row.name,
+            "email": row.email,
+            "similarity_score": round(row.score, 4),
+            "match_percentage": round(row.score * 100),
+        }
+        for row in rows
+    ]
@@ -0,0 +1,442 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalise vectors row-wise into a contiguous float32 array.
+
+    Zero vectors are left as zeros so they score 0 against everything.
+
+    Args:
+        vectors: 1-D vector or 2-D array of row vectors
+
+    Returns:
+        New normalised float32 array with the same shape
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms)
+
+
+def _normalize_rows_inplace(matrix: np.ndarray) -> None:
+    """L2-normalise a float32 matrix in place (avoids a second copy)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+
+
+def _grown_capacity(rows: int) -> int:
+    # Spare rows so in-place writes rarely copy the matrix; an eighth keeps
+    # the overhead of a large index small
+    return rows + rows // 8 + 16
+
+
+# Fields each kind's index keeps per row for building match results
+PAYLOAD_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "jobs": ("title", "company"),
+    "resumes": ("name", "email"),
+}
+
+
+class VectorIndex:
+    """
+    In-memory cosine similarity index.
+
+    Embeddings are stored as one contiguous float32 matrix of L2-normalised
+    rows, so a query is a single matrix-vector product. Each row carries the
+    entity ID and a small payload dict used to build match results without
+    going back to the database.
+
+    Writes are applied in place: new or changed rows are appended to spare
+    capacity at the end of the matrix and replaced rows are marked dead, so
+    positions never move. Readers need no lock; a search sees the rows that
+    existed when it read ``matrix``, and ``ids``/``payloads`` read later
+    still cover every one of those positions.
+    """
+
+    def __init__(
+            self,
+            ids: Sequence[int],
+            vectors: Sequence[Sequence[float]],
+            payloads: Sequence[dict],
+    ):
+        size = len(ids)
+        capacity = _grown_capacity(size)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._ids[:size] = np.asarray(ids, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:size] = True
+        self.payloads = list(payloads)
+
+        if len(vectors):
+            matrix = np.empty((capacity, len(vectors[0])), dtype=np.float32)
+            for row, vector in enumerate(vectors):
+                matrix[row] = vector
+            _normalize_rows_inplace(matrix[:size])
+            self._matrix = matrix
+        else:
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+
+        self._size = size
+        self._live = size
+        self._positions = {int(row_id): pos for pos, row_id in enumerate(self.ids.tolist())}
+        self._write_lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, kind: str, rows: Sequence) -> "VectorIndex":
+        """Build an index of embedded ORM rows, keeping the kind's payload fields."""
+        fields = PAYLOAD_FIELDS[kind]
+        return cls(
+            ids=[row.id for row in rows],
+            vectors=[row.embedding for row in rows],
+            payloads=[{field: getattr(row, field) for field in fields} for row in rows],
+        )
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Entity ID of every row position (including dead rows)."""
+        return self._ids[:self._size]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Normalised vector of every row position (including dead rows)."""
+        if self._matrix.shape[1] == 0:
+            return self._matrix
+        return self._matrix[:self._size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        """False for positions whose row was since replaced or removed."""
+        return self._alive[:self._size]
+
+    def __len__(self) -> int:
+        return self._live
+
+    def position(self, row_id: int) -> Optional[int]:
+        """Current row position of an entity, or None if it is not indexed."""
+        return self._positions.get(int(row_id))
+
+    @property
+    def needs_compaction(self) -> bool:
+        """More than a quarter of the rows are dead."""
+        return self._size - self._live > self._size // 4
+
+    def upsert(self, rows: "VectorIndex") -> None:
+        """
+        Add the live rows of another index, replacing rows with the same IDs.
+
+        Raises:
+            ValueError: If the vectors have a different dimension
+        """
+        live = np.flatnonzero(rows.alive)
+        if len(live) == 0:
+            return
+
+        with self._write_lock:
+            dimensions = rows.matrix.shape[1]
+            if self._matrix.shape[1] == 0:
+                self._matrix = np.empty((len(self._ids), dimensions), dtype=np.float32)
+            elif self._matrix.shape[1] != dimensions:
+                raise ValueError(
+                    f"Cannot add {dimensions}-dimensional vectors to a "
+                    f"{self._matrix.shape[1]}-dimensional index"
+                )
+
+            self._reserve(len(live))
+            start, end = self._size, self._size + len(live)
+            self._matrix[start:end] = rows.matrix[live]
+            self._ids[start:end] = rows.ids[live]
+            self._alive[start:end] = True
+            self.payloads.extend(rows.payloads[pos] for pos in live.tolist())
+
+            # Publish the new rows only once they are fully written, then
+            # point the IDs at them before retiring the rows they replace
+            self._size = end
+            for pos, row_id in enumerate(rows.ids[live].tolist(), start):
+                old = self._positions.get(row_id)
+                self._positions[row_id] = pos
+                if old is None:
+                    self._live += 1
+                else:
+                    self._alive[old] = False
+
+    def remove(self, row_ids: Sequence[int]) -> None:
+        """Mark the rows of some entities dead; unknown IDs are ignored."""
+        with self._write_lock:
+            self._retire(row_ids)
+
+    def _retire(self, row_ids: Sequence[int]) -> None:
+        for row_id in row_ids:
+            pos = self._positions.pop(int(row_id), None)
+            if pos is not None:
+                self._alive[pos] = False
+                self._live -= 1
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the buffers so ``extra`` more rows fit after the current ones."""
+        needed = self._size + extra
+        if needed <= len(self._ids):
+            return
+
+        capacity = _grown_capacity(needed)
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self._size] = self._ids[:self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        matrix = np.empty((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+
+        self._ids, self._alive, self._matrix = ids, alive, matrix
+
+    def scores(self, query: Sequence[float]) -> np.ndarray:
+        """Cosine similarity of a query vector against every row position (-inf for dead rows)."""
+        if len(self) == 0:
+            return np.empty(0, dtype=np.float32)
+        matrix = self.matrix
+        scores = matrix @ normalize_vectors(np.asarray(query))
+        scores[~self._alive[:len(matrix)]] = -np.inf
+        return scores
+
+    def search(
+            self,
+            query: Sequence[float],
+            top_k: int,
+            min_score: float = 0.0,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the rows most similar to a query vector.
+
+        Args:
+            query: Query embedding
+            top_k: Number of results to return
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (row position, similarity) pairs, best first
+        """
+        if len(self) == 0 or top_k <= 0:
+            return []
+
+        scores = self.scores(query)
+
+        k = min(top_k, len(scores))
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        ranked = ranked[scores[ranked] >= min_score]
+
+        return [(int(pos), float(scores[pos])) for pos in ranked]
+
+    def search_batch(
+            self,
+            queries: Union[Sequence[Sequence[float]], np.ndarray],
+            top_k: int,
+            min_score: float = 0.0,
+            query_block: int = 256,
+            index_block: int = 16384,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Find the top matches for many query vectors at once.
+
+        The score matrix is computed in (query_block x index_block) tiles and
+        a running top-k is merged per query, so memory stays bounded no
+        matter how many queries or rows are involved.
+
+        Args:
+            queries: Query embeddings
+            top_k: Number of results per query
+            min_score: Minimum cosine similarity
+            query_block: Queries scored per tile
+            index_block: Index rows scored per tile
+
+        Returns:
+            One list of (row position, similarity) pairs per query, best first
+        """
+        if len(queries) == 0:
+            return []
+        if len(self) == 0 or top_k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        normalized = normalize_vectors(np.asarray(queries))
+        matrix = self.matrix
+        alive = self._alive[:len(matrix)]
+        k = min(top_k, len(matrix))
+        results = []
+
+        for q_start in range(0, len(normalized), query_block):
+            block = normalized[q_start:q_start + query_block]
+            best_pos = np.empty((len(block), 0), dtype=np.int64)
+            best_scores = np.empty((len(block), 0), dtype=np.float32)
+
+            for i_start in range(0, len(matrix), index_block):
+                scores = block @ matrix[i_start:i_start + index_block].T
+                tile_alive = alive[i_start:i_start + index_block]
+                if not tile_alive.all():
+                    scores[:, ~tile_alive] = -np.inf
+
+                tile_k = min(k, scores.shape[1])
+                if tile_k < scores.shape[1]:
+                    tile_pos = np.argpartition(-scores, tile_k - 1, axis=1)[:, :tile_k]
+                else:
+                    tile_pos = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+
+                best_scores = np.concatenate(
+                    [best_scores, np.take_along_axis(scores, tile_pos, axis=1)], axis=1
+                )
+                best_pos = np.concatenate([best_pos, tile_pos + i_start], axis=1)
+
+                if best_pos.shape[1] > k:
+                    keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                    best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                    best_pos = np.take_along_axis(best_pos, keep, axis=1)
+
+            order = np.argsort(-best_scores, axis=1, kind="stable")
+            best_scores = np.take_along_axis(best_scores, order, axis=1)
+            best_pos = np.take_along_axis(best_pos, order, axis=1)
+
+            for row_pos, row_scores in zip(best_pos, best_scores):
+                matched = row_scores >= min_score
+                results.append(list(zip(row_pos[matched].tolist(), row_scores[matched].tolist())))
+
+        return results
+
+
+# Cached indexes keyed by kind ("jobs" / "resumes") -> (index, built_at)
+_indexes: Dict[str, Tuple[VectorIndex, float]] = {}
+_lock = threading.Lock()
+
+# Builds run outside _lock, one at a time, so writes never wait on them
+_build_lock = threading.Lock()
+
+# Bumped on every write (per kind) or invalidation (all kinds); an index
+# or count read from the database before one is never stored
+_generation = 0
+_kind_generations: Dict[str, int] = {}
+
+
+def _current_generation(kind: str) -> Tuple[int, int]:
+    """Generation to compare before storing ``kind``; call with _lock held."""
+    return _generation, _kind_generations.get(kind, 0)
+
+
+def get_index(kind: str, loader: Callable[[], VectorIndex]) -> VectorIndex:
+    """
+    Get a cached index, building it with ``loader`` if missing or expired.
+
+    Indexes expire after ``settings.vector_index_ttl_seconds`` so changes
+    made by other processes are eventually picked up. An index that a
+    write or invalidation raced with is returned but not cached.
+    """
+    now = time.monotonic()
+    with _lock:
+        cached = _indexes.get(kind)
+    if cached and now - cached[1] < settings.vector_index_ttl_seconds:
+        return cached[0]
+
+    with _build_lock:
+        with _lock:
+            cached = _indexes.get(kind)
+            generation = _current_generation(kind)
+        if cached and now - cached[1] < settings.vector_index_ttl_seconds:
+            return cached[0]
+
+        start = time.perf_counter()
+        index = loader()
+        with _lock:
+            if _current_generation(kind) == generation:
+                _indexes[kind] = (index, time.monotonic())
+        logger.info(
+            f"Built {kind} vector index with {len(index)} rows "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        return index
+
+
+# Cached embedded-row counts keyed by kind -> (count, counted_at)
+_counts: Dict[str, Tuple[int, float]] = {}
+
+
+def get_embedded_count(kind: str, counter: Callable[[], int]) -> int:
+    """
+    Get a cached count of embedded rows, running ``counter`` if missing or expired.
+
+    Dropped together with the index on every write in this process, and
+    expires after ``settings.vector_index_ttl_seconds`` to pick up writes
+    made by other processes.
+    """
+    now = time.monotonic()
+    with _lock:
+        cached = _counts.get(kind)
+        generation = _current_generation(kind)
+    if cached and now - cached[1] < settings.vector_index_ttl_seconds:
+        return cached[0]
+
+    count = counter()
+    with _lock:
+        if _current_generation(kind) == generation:
+            _counts[kind] = (count, now)
+    return count
+
+
+def invalidate_index(kind: Optional[str] = None) -> None:
+    """Drop a cached index and count (or all of them) so the next search rebuilds it."""
+    global _generation
+    with _lock:
+        if kind is None:
+            _generation += 1
+            _indexes.clear()
+            _counts.clear()
+        else:
+            _kind_generations[kind] = _kind_generations.get(kind, 0) + 1
+            _indexes.pop(kind, None)
+            _counts.pop(kind, None)
+
+
+def update_index(kind: str, ids: Sequence[int], written: Optional[VectorIndex] = None) -> None:
+    """
+    Apply a committed write to the cached index in place instead of dropping it.
+
+    Rows in ``written`` are added or replaced; any of ``ids`` not in it
+    (deleted, or no longer embedded) are removed. Nothing is done when the
+    index isn't cached, since the next search builds it from the database.
+    The index is dropped instead when the write doesn't fit it (a
+    different dimension) or once a quarter of its rows are dead.
+
+    Args:
+        kind: "resumes" or "jobs"
+        ids: Written entity IDs
+        written: The written rows that are embedded, as a small index
+    """
+    with _lock:
+        _kind_generations[kind] = _kind_generations.get(kind, 0) + 1
+        _counts.pop(kind, None)
+        cached = _indexes.get(kind)
+    if cached is None:
+        return
+
+    index = cached[0]
+    kept = set() if written is None else set(written.ids.tolist())
+    try:
+        if written is not None:
+            index.upsert(written)
+        index.remove([row_id for row_id in ids if row_id not in kept])
+    except ValueError as e:
+        logger.warning(f"Dropping cached {kind} vector index: {e}")
+        invalidate_index(kind)
+        return
+
+    if index.needs_compaction:
+        invalidate_index(kind)
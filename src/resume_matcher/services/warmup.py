@@ -0,0 +1,74 @@
+import logging
+import time
+from typing import Callable, Dict
+
+from sqlalchemy import text
+
+from ..core.config import settings
+from ..core.database import SessionLocal, get_async_sessionmaker, get_engine
+from .embedding_service import get_embedding_provider
+from .index_service import stale_vector_indexes
+from .pdf_service import load_pymupdf
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_database() -> None:
+    if settings.async_mode:
+        get_async_sessionmaker()
+        return
+    # Opens the first pooled connection
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _check_vector_indexes() -> None:
+    # Searches cannot use indexes built on another search form
+    with SessionLocal() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        stale = stale_vector_indexes(db)
+    if stale:
+        logger.warning(
+            f"Vector indexes {', '.join(stale)} do not match VECTOR_QUANTIZATION/"
+            f"VECTOR_SEARCH_DIMENSIONS; searches fall back to scans until `make indexes`"
+        )
+
+
+def _warm_embeddings() -> None:
+    get_embedding_provider().warm_up()
+
+
+_STEPS: Dict[str, Callable[[], object]] = {
+    "database": _warm_database,
+    "vector_indexes": _check_vector_indexes,
+    "embeddings": _warm_embeddings,
+    "pdf": load_pymupdf,
+}
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Create the lazily initialised resources ahead of the first request.
+
+    Each step is timed and failures are logged rather than raised, so an
+    unavailable dependency delays nothing but its own first use.
+
+    Returns:
+        Seconds taken by each step that succeeded
+    """
+    timings = {}
+    for name, step in _STEPS.items():
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"Warm-up step {name} failed: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+
+    logger.info(
+        "Warm-up finished: "
+        + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in timings.items())
+    )
+    return timings
@@ -0,0 +1,32 @@
+import argparse
+import logging
+
+from .core.config import settings
+from .core.database import SessionLocal
+from .services.topk_service import rebuild_topk
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Recompute the precomputed match_topk table from scratch."""
+    parser = argparse.ArgumentParser(description="Resume Matcher top-K rebuild")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Sources searched and inserted per slice",
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        written = rebuild_topk(db, batch_size=args.batch_size)
+    logger.info(f"Wrote {written} match_topk rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import logging
+import signal
+import threading
+
+from .core.config import settings
+from .services.active_model import load_active_model
+from .services.embedding_worker import run_embedding_worker
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Run the background embedding worker."""
+    parser = argparse.ArgumentParser(description="Resume Matcher embedding worker")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.embedding_worker_batch_size,
+        help="Maximum pending rows per table to embed in one batch",
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=settings.embedding_worker_poll_seconds,
+        help="Seconds to sleep when the queue is empty",
+    )
+    args = parser.parse_args()
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, finishing current batch")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    load_active_model()
+    run_embedding_worker(
+        stop_event=stop_event,
+        poll_seconds=args.poll_seconds,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,10 @@
+import os
+
+# Resources are created per test; don't warm up real ones in the app lifespan
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -6,7 +13,10 @@ from sqlalchemy.pool import StaticPool
 
 from src.resume_matcher.main import app
 from src.resume_matcher.core.database import Base, get_db
-from src.resume_matcher.api.deps import get_db as api_get_db
+from src.resume_matcher.api.deps import get_db as api_get_db, get_request_db
+from src.resume_matcher.services.vector_index import invalidate_index
+from src.resume_matcher.services.embedding_cache import clear_cache
+from src.resume_matcher.services.match_cache import invalidate_matches
 
 # Use in-memory SQLite for tests
 SQLALCHEMY_TEST_URL = "sqlite:///:memory:"
@@ -37,6 +47,9 @@ def db():
         db.close()
         # Drop tables after test
         Base.metadata.drop_all(bind=engine)
+        invalidate_index()
+        clear_cache()
+        invalidate_matches()
 
 
 @pytest.fixture(scope="function")
@@ -50,8 +63,11 @@ def client(db):
             pass
 
     app.dependency_overrides[api_get_db] = override_get_db
+    app.dependency_overrides[get_request_db] = override_get_db
 
-    with TestClient(app) as test_client:
+    # The lifespan reads the active embedding model from the test database
+    with patch("src.resume_matcher.core.database.SessionLocal", TestingSessionLocal), \
+            TestClient(app) as test_client:
         yield test_client
 
     app.dependency_overrides.clear()
@@ -86,4 +102,20 @@ def sample_resume_text():
 
     Skills:
     Python, FastAPI, Django, PostgreSQL, Docker, Kubernetes, AWS
-    """
\ No newline at end of file
+    """
+
+@pytest.fixture
+def make_pdf():
+    """Build an in-memory PDF with one page of text per argument."""
+    import fitz
+
+    def _make_pdf(*pages: str) -> bytes:
+        doc = fitz.open()
+        for text in pages:
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+        data = doc.tobytes()
+        doc.close()
+        return data
+
+    return _make_pdf
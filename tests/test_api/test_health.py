@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
@@ -7,4 +10,66 @@ def test_health_check(client):
 def test_root(client):
     response = client.get("/")
     assert response.status_code == 200
-    assert "message" in response.json()
\ No newline at end of file
+    assert "message" in response.json()
+
+def test_embedding_cache_stats(client):
+    response = client.get("/api/v1/embeddings/cache/stats")
+    assert response.status_code == 200
+    assert "hit_rate" in response.json()
+
+
+def test_app_import_defers_heavy_dependencies():
+    import os
+    import subprocess
+    import sys
+
+    # Neither an API key nor a database URL is needed just to import the app
+    env = {
+        key: value for key, value in os.environ.items()
+        if key not in ("OPENAI_API_KEY", "DATABASE_URL")
+    }
+    script = (
+        "import sys, src.resume_matcher.main; "
+        "print(','.join(m for m in ('openai', 'httpx', 'fitz', 'psycopg2') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_warm_up_times_steps_and_tolerates_failures():
+    from unittest.mock import patch
+    from src.resume_matcher.services import warmup
+
+    def broken():
+        raise RuntimeError("database unavailable")
+
+    with patch.dict(warmup._STEPS, {"database": broken, "embeddings": lambda: None}, clear=True):
+        timings = warmup.warm_up()
+
+    assert list(timings) == ["embeddings"]
+
+
+def test_metrics_endpoint_reports_stage_histograms(client):
+    from unittest.mock import MagicMock, patch
+
+    pytest.importorskip("prometheus_client")
+
+    with patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.return_value = MagicMock(
+            data=[MagicMock(embedding=[0.1] * 1536, index=0)]
+        )
+        created = client.post("/api/v1/jobs/", json={
+            "title": "Backend Engineer",
+            "description": "Build APIs with Python and PostgreSQL.",
+        })
+    assert created.status_code == 201
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    body = response.text
+    assert 'resume_matcher_db_query_seconds_count{operation="create_job"}' in body
+    assert 'resume_matcher_db_commit_seconds_count{operation="create_job"}' in body
+    assert "resume_matcher_embedding_request_seconds_bucket" in body
+    assert "resume_matcher_db_pool_checked_out" in body
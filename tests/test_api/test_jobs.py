@@ -60,4 +60,41 @@ def test_delete_job(client, sample_job_data):
 
         # Verify it's gone
         response = client.get(f"/api/v1/jobs/{job_id}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+def test_create_job_async_embedding_is_queued(client, sample_job_data):
+    from src.resume_matcher.core.config import settings
+
+    with patch.object(settings, "embedding_async", True), \
+            patch("src.resume_matcher.services.job_service.get_embedding") as mock_embed:
+        response = client.post("/api/v1/jobs/", json=sample_job_data)
+
+    assert response.status_code == 201
+    assert response.json()["embedding_status"] == "pending"
+    assert response.json()["has_embedding"] is False
+    mock_embed.assert_not_called()
+
+
+def test_list_jobs_cursor_pagination(client, db):
+    from src.resume_matcher.models import Job
+
+    db.add_all([
+        Job(title=f"Job {n}", description="A job description", embedding=[1.0] * 1536 if n % 2 else None)
+        for n in range(5)
+    ])
+    db.commit()
+
+    first = client.get("/api/v1/jobs/", params={"limit": 2})
+    assert [j["title"] for j in first.json()] == ["Job 0", "Job 1"]
+    assert [j["has_embedding"] for j in first.json()] == [False, True]
+
+    second = client.get(
+        "/api/v1/jobs/", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert [j["title"] for j in second.json()] == ["Job 2", "Job 3"]
+
+    last = client.get(
+        "/api/v1/jobs/", params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]}
+    )
+    assert [j["title"] for j in last.json()] == ["Job 4"]
+    assert "X-Next-Cursor" not in last.headers
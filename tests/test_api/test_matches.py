@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+
+def test_match_resume_not_found(client):
+    response = client.get("/api/v1/matches/resume/999")
+    assert response.status_code == 404
+
+
+def test_match_job_not_found(client):
+    response = client.get("/api/v1/matches/job/999/candidates")
+    assert response.status_code == 404
+
+
+def test_match_rejects_invalid_ef_search(client):
+    response = client.get("/api/v1/matches/resume/1", params={"ef_search": 0})
+    assert response.status_code == 422
+
+
+def test_match_rejects_invalid_probes(client):
+    response = client.get("/api/v1/matches/job/1/candidates", params={"probes": 0})
+    assert response.status_code == 422
+
+
+def test_match_rejects_unknown_mode(client):
+    response = client.get("/api/v1/matches/resume/1", params={"mode": "lexical"})
+    assert response.status_code == 422
+
+
+def test_match_hybrid_requires_postgres(client, db):
+    from src.resume_matcher.models import Resume
+
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="python", embedding=[1.0] + [0.0] * 1535)
+    db.add(resume)
+    db.commit()
+
+    response = client.get(
+        f"/api/v1/matches/resume/{resume.id}",
+        params={"mode": "hybrid", "keywords": "kubernetes"},
+    )
+
+    assert response.status_code == 400
+    assert "PostgreSQL" in response.json()["detail"]
+
+
+def test_match_resume_numpy_backend(client, db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+
+    db.add_all([
+        Job(title="Python Developer", company="A", description="python", embedding=[1.0, 0.0] + [0.0] * 1534),
+        Job(title="Chef", company="B", description="cooking", embedding=[0.0, 1.0] + [0.0] * 1534),
+    ])
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="python", embedding=[0.9, 0.1] + [0.0] * 1534)
+    db.add(resume)
+    db.commit()
+
+    with patch.object(settings, "match_backend", "numpy"):
+        response = client.get(f"/api/v1/matches/resume/{resume.id}", params={"top_k": 1})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_jobs_compared"] == 2
+    assert [m["job_title"] for m in data["matches"]] == ["Python Developer"]
+
+
+def test_match_results_cached_until_write(client, db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+
+    job = Job(title="Python Developer", company="A", description="python", embedding=[1.0] + [0.0] * 1535)
+    db.add(job)
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="python", embedding=[1.0] + [0.0] * 1535)
+    db.add(resume)
+    db.commit()
+    url = f"/api/v1/matches/resume/{resume.id}"
+
+    with patch.object(settings, "match_backend", "numpy"):
+        assert len(client.get(url).json()["matches"]) == 1
+
+        # Served from the cache without loading the resume again
+        with patch(
+            "src.resume_matcher.services.match_service.get_resume_or_404",
+            side_effect=AssertionError("database was queried"),
+        ):
+            assert len(client.get(url).json()["matches"]) == 1
+
+        # Deleting the job invalidates cached results
+        assert client.delete(f"/api/v1/jobs/{job.id}").status_code == 204
+        assert client.get(url).json()["matches"] == []
+
+
+def test_match_batch(client, db):
+    from src.resume_matcher.models import Job, Resume
+
+    python_job = Job(title="Python Developer", company="A", description="python", embedding=[1.0, 0.0] + [0.0] * 1534)
+    chef_job = Job(title="Chef", company="B", description="cooking", embedding=[0.0, 1.0] + [0.0] * 1534)
+    developer = Resume(name="Dev", filename="dev.pdf", raw_text="python", embedding=[0.9, 0.1] + [0.0] * 1534)
+    cook = Resume(name="Cook", filename="cook.pdf", raw_text="food", embedding=[0.1, 0.9] + [0.0] * 1534)
+    db.add_all([python_job, chef_job, developer, cook])
+    db.commit()
+
+    response = client.post(
+        "/api/v1/matches/batch",
+        json={"resume_ids": [developer.id, cook.id, 999], "top_k": 1},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_resumes"] == 2
+    assert data["total_jobs_compared"] == 2
+    assert data["skipped_resume_ids"] == [999]
+    top = {r["resume_name"]: r["matches"][0]["job_title"] for r in data["results"]}
+    assert top == {"Dev": "Python Developer", "Cook": "Chef"}
+
+
+def test_precomputed_top_matches(client, db):
+    from src.resume_matcher.models import Job, Resume
+    from src.resume_matcher.services.topk_service import rebuild_topk
+
+    job = Job(title="Python Developer", company="A", description="python", embedding=[1.0] + [0.0] * 1535)
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="python", embedding=[1.0] + [0.0] * 1535)
+    db.add_all([job, resume])
+    db.commit()
+    rebuild_topk(db)
+
+    response = client.get(f"/api/v1/matches/resume/{resume.id}/top")
+    assert response.status_code == 200
+    assert [m["job_id"] for m in response.json()["matches"]] == [job.id]
+
+    response = client.get(f"/api/v1/matches/job/{job.id}/top")
+    assert response.status_code == 200
+    assert [c["resume_id"] for c in response.json()["candidates"]] == [resume.id]
+
+    assert client.get("/api/v1/matches/resume/999/top").status_code == 404
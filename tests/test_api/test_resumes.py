@@ -23,4 +23,89 @@ def test_list_resumes_empty(client):
 
 def test_get_resume_not_found(client):
     response = client.get("/api/v1/resumes/999")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_bulk_upload_pdfs_and_zip(client, make_pdf):
+    import zipfile
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("batch/carol.pdf", make_pdf("Carol - Data Scientist"))
+        zf.writestr("batch/notes.txt", "not a resume")
+    archive.seek(0)
+
+    files = [
+        ("files", ("alice.pdf", io.BytesIO(make_pdf("Alice - Python Developer")), "application/pdf")),
+        ("files", ("bob.pdf", io.BytesIO(b"not a pdf"), "application/pdf")),
+        ("files", ("batch.zip", archive, "application/zip")),
+    ]
+
+    with patch("src.resume_matcher.services.resume_service.get_embeddings_batch") as mock_batch:
+        mock_batch.return_value = [[0.1] * 1536, [0.2] * 1536]
+        response = client.post("/api/v1/resumes/bulk", files=files)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert data["succeeded"] == 2
+    assert data["failed"] == 2
+
+    # One embedding call for both valid resumes
+    mock_batch.assert_called_once()
+
+    by_name = {item["filename"]: item for item in data["results"]}
+    assert by_name["alice.pdf"]["status"] == "created"
+    assert by_name["alice.pdf"]["embedding_status"] == "ready"
+    assert by_name["bob.pdf"]["status"] == "failed"
+    assert by_name["batch.zip/batch/carol.pdf"]["status"] == "created"
+    assert by_name["batch.zip/batch/notes.txt"]["status"] == "failed"
+
+    listed = client.get("/api/v1/resumes/").json()
+    assert sorted(r["name"] for r in listed) == ["alice", "carol"]
+
+
+def test_upload_resume(client, make_pdf):
+    files = {
+        "file": ("jane.pdf", io.BytesIO(make_pdf("Jane Doe - Python Developer")), "application/pdf")
+    }
+
+    with patch("src.resume_matcher.services.resume_service.get_embedding") as mock_embed:
+        mock_embed.return_value = [0.1] * 1536
+        response = client.post("/api/v1/resumes/upload", files=files, data={"name": "Jane Doe"})
+
+    assert response.status_code == 201
+    assert response.json()["resume"]["has_embedding"] is True
+    assert "Python Developer" in mock_embed.call_args.args[0]
+
+
+def test_upload_resume_too_large(client, make_pdf):
+    from src.resume_matcher.core.config import settings
+
+    files = {"file": ("big.pdf", io.BytesIO(make_pdf("x" * 500)), "application/pdf")}
+    with patch.object(settings, "pdf_max_file_bytes", 100):
+        response = client.post("/api/v1/resumes/upload", files=files, data={"name": "Big"})
+
+    assert response.status_code == 413
+
+
+def test_get_resume_detail_preview_from_sql(client, db):
+    from sqlalchemy import inspect
+    from src.resume_matcher.models import Resume
+    from src.resume_matcher.services import get_resume
+
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="x" * 2000, embedding=[1.0] * 1536)
+    db.add(resume)
+    db.commit()
+    resume_id = resume.id
+    db.expunge_all()
+
+    response = client.get(f"/api/v1/resumes/{resume_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["text_preview"] == "x" * 500 + "..."
+    assert data["has_embedding"] is True
+
+    # Plain reads leave the text and vector in the database
+    db.expunge_all()
+    loaded = get_resume(db, resume_id)
+    assert {"raw_text", "embedding"} <= inspect(loaded).unloaded
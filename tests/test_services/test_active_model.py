@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.resume_matcher.core.config import settings
+from src.resume_matcher.models import EmbeddingMigration
+from src.resume_matcher.models.status import MIGRATION_COMPLETED, MIGRATION_RUNNING
+from src.resume_matcher.schemas.job import JobCreate
+from src.resume_matcher.services.active_model import (
+    EmbeddingModelChangedError,
+    embed_with_active_model,
+    use_active_model,
+)
+from src.resume_matcher.services.job_service import create_job
+
+
+@pytest.fixture
+def configured_model():
+    with patch.object(settings, "embedding_model", "text-embedding-3-small"), \
+            patch.object(settings, "embedding_dimensions", 1536), \
+            patch.object(settings, "embedding_request_dimensions", None):
+        yield
+
+
+def _add_migration(db, status, model="text-embedding-3-large", dimensions=8):
+    db.add(EmbeddingMigration(target_model=model, target_dimensions=dimensions, status=status))
+    db.commit()
+
+
+def test_use_active_model_keeps_config_without_a_flip(db, configured_model):
+    _add_migration(db, MIGRATION_RUNNING)
+
+    assert use_active_model(db) == ("text-embedding-3-small", 1536)
+    assert settings.embedding_model == "text-embedding-3-small"
+
+
+def test_writers_follow_a_flip_from_another_process(db, configured_model, sample_job_data):
+    _add_migration(db, MIGRATION_COMPLETED)
+
+    def fake_embedding(text, db=None):
+        return [0.5] * settings.embedding_dimensions
+
+    with patch("src.resume_matcher.services.job_service.get_embedding", side_effect=fake_embedding):
+        job = create_job(db, JobCreate(**sample_job_data))
+
+    assert (settings.embedding_model, settings.embedding_request_dimensions) == ("text-embedding-3-large", 8)
+    assert len(job.embedding) == 8
+
+
+def test_embedding_is_redone_when_a_flip_lands_meanwhile(db, configured_model):
+    models = []
+
+    def embed():
+        models.append(settings.embedding_model)
+        if len(models) == 1:
+            _add_migration(db, MIGRATION_COMPLETED)
+        return models[-1]
+
+    assert embed_with_active_model(db, embed) == "text-embedding-3-large"
+    assert models == ["text-embedding-3-small", "text-embedding-3-large"]
+
+
+def test_embedding_gives_up_when_the_model_keeps_changing(db, configured_model):
+    dimensions = iter(range(8, 16))
+
+    def embed():
+        _add_migration(db, MIGRATION_COMPLETED, dimensions=next(dimensions))
+
+    with pytest.raises(EmbeddingModelChangedError):
+        embed_with_active_model(db, embed)
@@ -0,0 +1,91 @@
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.resume_matcher.core.config import settings
+from src.resume_matcher.core.database import Base, Vector
+from src.resume_matcher.schemas.job import JobCreate
+from src.resume_matcher.schemas.resume import ResumeCreate
+from src.resume_matcher.services.embedding_cache import clear_cache
+from src.resume_matcher.services.match_cache import invalidate_matches
+from src.resume_matcher.services.vector_index import invalidate_index
+
+
+def _unit(position: int) -> list:
+    vector = [0.0] * settings.embedding_dimensions
+    vector[position] = 1.0
+    return vector
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    """An AsyncSession and the sync SessionLocal, sharing one SQLite file."""
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=sync_engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    with patch(
+        "src.resume_matcher.core.database.SessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, bind=sync_engine),
+    ):
+        yield async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    sync_engine.dispose()
+    invalidate_index()
+    clear_cache()
+    invalidate_matches()
+
+
+def test_vector_binds_lists_on_asyncpg():
+    dialect = MagicMock(driver="asyncpg")
+    assert Vector(3).bind_processor(dialect) is None
+
+    dialect = MagicMock(driver="psycopg2")
+    assert Vector(3).bind_processor(dialect)([1.0, 2.0, 3.0]) == "[1.0,2.0,3.0]"
+
+
+async def test_async_writes_and_numpy_matches_run_off_the_event_loop(async_db):
+    from src.resume_matcher.services import job_service, match_service, resume_service
+
+    loop_thread = threading.get_ident()
+    index_threads = []
+    update_index = job_service.update_index
+
+    def record_thread(*args):
+        index_threads.append(threading.get_ident())
+        return update_index(*args)
+
+    with patch.object(settings, "embedding_async", False), \
+            patch.object(settings, "embedding_chunking", False), \
+            patch.object(settings, "match_backend", "numpy"), \
+            patch.object(job_service, "aget_embedding", AsyncMock(return_value=_unit(0))), \
+            patch.object(resume_service, "aget_embedding", AsyncMock(return_value=_unit(0))), \
+            patch.object(job_service, "update_index", side_effect=record_thread), \
+            patch.object(resume_service, "update_index", side_effect=record_thread):
+        async with async_db() as db:
+            job = await job_service.acreate_job(db, JobCreate(
+                title="Python Developer",
+                company="Test Corp",
+                description="Python and FastAPI",
+            ))
+            resume = await resume_service.acreate_resume(db, ResumeCreate(
+                name="Jane Doe",
+                email="jane@example.com",
+                filename="jane.pdf",
+                raw_text="Python developer with FastAPI experience",
+            ))
+            response = await match_service.afind_matching_jobs(db, resume.id, top_k=5)
+
+    assert [match.job_id for match in response.matches] == [job.id]
+    assert response.matches[0].similarity_score == pytest.approx(1.0)
+    assert len(index_threads) == 2
+    assert loop_thread not in index_threads
@@ -22,4 +22,357 @@ def test_calculate_similarity_with_zero_vector():
     vec2 = [0.0, 0.0, 0.0]
 
     result = calculate_similarity(vec1, vec2)
-    assert result == 0.0
\ No newline at end of file
+    assert result == 0.0
+
+def _embedding_response(*vectors):
+    response = MagicMock()
+    response.data = [
+        MagicMock(embedding=list(vector), index=i) for i, vector in enumerate(vectors)
+    ]
+    return response
+
+
+def test_get_embedding_served_from_memory_cache():
+    from src.resume_matcher.services.embedding_cache import clear_cache, get_cache_stats
+    from src.resume_matcher.services.embedding_service import get_embedding
+
+    clear_cache()
+    with patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.return_value = _embedding_response([0.5, 0.25])
+
+        first = get_embedding("  Python developer ")
+        second = get_embedding("Python developer")
+
+    # Whitespace is normalised before hashing, so only one API call is made
+    assert mock_client.embeddings.create.call_count == 1
+    assert first == second == [0.5, 0.25]
+    assert get_cache_stats()["memory_hits"] == 1
+    assert get_cache_stats()["misses"] == 1
+
+
+def test_get_embedding_served_from_persistent_cache(db):
+    from src.resume_matcher.models import EmbeddingCache
+    from src.resume_matcher.services.embedding_cache import clear_cache, get_cache_stats
+    from src.resume_matcher.services.embedding_service import get_embedding
+
+    clear_cache()
+    with patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.return_value = _embedding_response([0.5, 0.25])
+        get_embedding("Data engineer", db=db)
+        db.commit()
+        assert db.query(EmbeddingCache).count() == 1
+
+        # Simulate a fresh process: memory is empty, the table is not
+        clear_cache()
+        assert get_embedding("Data engineer", db=db) == [0.5, 0.25]
+
+    assert mock_client.embeddings.create.call_count == 1
+    assert get_cache_stats()["db_hits"] == 1
+
+
+def test_get_embeddings_batch_only_sends_uncached_texts():
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_service import get_embeddings_batch
+
+    clear_cache()
+    with patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.return_value = _embedding_response([1.0, 0.0])
+        get_embeddings_batch(["a"])
+
+        mock_client.embeddings.create.return_value = _embedding_response([0.0, 1.0])
+        result = get_embeddings_batch(["a", "b", "b"])
+
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["b"]
+    assert result == [[1.0, 0.0], [0.0, 1.0], [0.0, 1.0]]
+
+
+def test_embed_documents_chunks_long_text_in_one_call():
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_service import embed_documents
+
+    clear_cache()
+    long_text = " ".join(f"skill{i}" for i in range(400))
+
+    with patch.object(settings, "embedding_chunking", True), \
+            patch.object(settings, "embedding_chunk_tokens", 100), \
+            patch.object(settings, "embedding_chunk_overlap", 10), \
+            patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.side_effect = lambda model, input: _embedding_response(
+            *[[1.0, 0.0] if i % 2 else [0.0, 1.0] for i in range(len(input))]
+        )
+
+        short, long = embed_documents(["Python developer", long_text])
+
+    assert mock_client.embeddings.create.call_count == 1
+    assert short.chunks == []
+    assert len(long.chunks) > 1
+    assert all(chunk_text for chunk_text, _ in long.chunks)
+    # Pooled vector is unit length
+    assert sum(value * value for value in long.embedding) == pytest.approx(1.0, abs=1e-6)
+
+
+def test_chunked_mode_stores_resume_chunks(db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import ResumeChunk
+    from src.resume_matcher.schemas.resume import ResumeCreate
+    from src.resume_matcher.services.embedding_service import DocumentEmbedding
+    from src.resume_matcher.services.resume_service import bulk_create_resumes, create_resume
+
+    document = DocumentEmbedding(
+        [0.1] * 1536,
+        [("Experience", [0.2] * 1536), ("Education", [0.3] * 1536)],
+    )
+    resume_data = ResumeCreate(name="Jane", filename="jane.pdf", raw_text="Experience Education")
+
+    with patch.object(settings, "embedding_chunking", True), \
+            patch("src.resume_matcher.services.resume_service.embed_documents") as mock_embed:
+        mock_embed.side_effect = lambda texts, db=None: [document] * len(texts)
+
+        resume = create_resume(db, resume_data)
+        [(bulk_id, status)] = bulk_create_resumes(db, [resume_data])
+
+    assert status == "ready"
+    assert [chunk.content for chunk in resume.chunks] == ["Experience", "Education"]
+    assert db.query(ResumeChunk).filter(ResumeChunk.resume_id == bulk_id).count() == 2
+
+
+def test_pack_requests_respects_item_and_token_budgets():
+    from src.resume_matcher.services.embedding_service import pack_requests
+    from src.resume_matcher.services.tokenizer import count_tokens
+
+    texts = ["short"] * 5 + [" ".join(["word"] * 200)] + ["short"] * 2
+
+    requests = pack_requests(texts, max_items=3, max_tokens=count_tokens(texts[5]) + 1)
+
+    assert sorted(i for request in requests for i in request) == list(range(len(texts)))
+    assert all(len(request) <= 3 for request in requests)
+    assert [5] in requests  # The long text does not fit with anything else
+
+
+def test_get_embeddings_batch_retries_only_rate_limited_requests():
+    import httpx
+    import openai
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_service import get_embeddings_batch
+
+    clear_cache()
+    rate_limited = openai.RateLimitError(
+        "rate limited",
+        response=httpx.Response(429, request=httpx.Request("POST", "http://test")),
+        body=None,
+    )
+    calls = []
+
+    def create(model, input):
+        calls.append(list(input))
+        if input == ["c", "d"] and calls.count(["c", "d"]) == 1:
+            raise rate_limited
+        return _embedding_response(*[[float(ord(text))] for text in input])
+
+    with patch.object(settings, "embedding_request_max_items", 2), \
+            patch.object(settings, "embedding_retry_base_seconds", 0.0), \
+            patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.side_effect = create
+
+        embeddings = get_embeddings_batch(["a", "b", "c", "d", "e"])
+
+    assert embeddings == [[97.0], [98.0], [99.0], [100.0], [101.0]]
+    # Only the rate-limited request was sent twice
+    assert sorted(map(tuple, calls)) == [("a", "b"), ("c", "d"), ("c", "d"), ("e",)]
+
+
+async def test_aget_embeddings_batch_uses_cache_and_async_client():
+    from unittest.mock import AsyncMock
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_service import aget_embeddings_batch
+
+    clear_cache()
+    mock_client = MagicMock()
+    mock_client.embeddings.create = AsyncMock(
+        side_effect=lambda model, input: _embedding_response(*[[float(len(text))] for text in input])
+    )
+
+    with patch(
+        "src.resume_matcher.services.embedding_service.get_async_client",
+        return_value=mock_client,
+    ):
+        first = await aget_embeddings_batch(["ab", "abc", "ab"])
+        second = await aget_embeddings_batch(["abc"])
+
+    assert first == [[2.0], [3.0], [2.0]]
+    assert second == [[3.0]]
+    # Duplicates are sent once and the second call is served from the cache
+    mock_client.embeddings.create.assert_awaited_once()
+    assert mock_client.embeddings.create.call_args.kwargs["input"] == ["ab", "abc"]
+
+
+def test_async_database_url_uses_asyncpg():
+    from src.resume_matcher.core.database import async_database_url
+
+    assert async_database_url("postgresql+psycopg2://u:p@db:5432/app") == (
+        "postgresql+asyncpg://u:p@db:5432/app"
+    )
+
+
+def test_get_embeddings_batch_uses_configured_provider():
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_providers import EmbeddingProvider
+    from src.resume_matcher.services.embedding_service import (
+        get_embeddings_batch,
+        set_embedding_provider,
+    )
+
+    class IncompleteProvider(EmbeddingProvider):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteProvider()
+
+    class FakeProvider(EmbeddingProvider):
+        name = "fake"
+        calls = []
+
+        def embed(self, texts, model=None, dimensions=None):
+            self.calls.append(list(texts))
+            return [[float(len(text))] for text in texts]
+
+    clear_cache()
+    set_embedding_provider(FakeProvider())
+    try:
+        with patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+            embeddings = get_embeddings_batch(["ab", "abc"])
+    finally:
+        set_embedding_provider(None)
+
+    assert embeddings == [[2.0], [3.0]]
+    assert FakeProvider.calls == [["ab", "abc"]]
+    mock_client.embeddings.create.assert_not_called()
+
+
+def test_local_provider_batches_concurrent_requests():
+    import threading
+    import numpy as np
+    from src.resume_matcher.services.embedding_providers import LocalEmbeddingProvider
+
+    provider = LocalEmbeddingProvider("local-model", max_batch=8)
+    started, release = threading.Event(), threading.Event()
+    encoded = []
+
+    def encode(texts, **kwargs):
+        started.set()
+        release.wait(5)
+        encoded.append(list(texts))
+        return np.array([[float(len(text)), 0.0] for text in texts])
+
+    model = MagicMock()
+    model.encode.side_effect = encode
+    provider._models["local-model"] = model
+
+    # The first request occupies the worker; the next two queue behind it
+    first = provider.submit(["a"])
+    assert started.wait(5)
+    queued = [provider.submit(["bb", "ccc"]), provider.submit(["dddd"])]
+    release.set()
+
+    assert first.result(5) == [[1.0, 0.0]]
+    assert [future.result(5) for future in queued] == [
+        [[2.0, 0.0], [3.0, 0.0]],
+        [[4.0, 0.0]],
+    ]
+    assert encoded == [["a"], ["bb", "ccc", "dddd"]]
+
+
+def test_micro_batcher_flushes_on_size_and_wait():
+    from src.resume_matcher.services.micro_batcher import MicroBatcher
+
+    batches = []
+
+    def handler(items):
+        batches.append(list(items))
+        if "boom" in items:
+            raise ValueError("boom")
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, max_batch_size=3, max_wait_seconds=0.05)
+
+    # A full batch is sent without waiting for more items
+    futures = [batcher.submit(value) for value in (1, 2, 3)]
+    assert [future.result(5) for future in futures] == [2, 4, 6]
+
+    # A lone item is sent once the wait expires
+    assert batcher.submit(4).result(5) == 8
+
+    # A failed batch fails every caller in it
+    futures = [batcher.submit("boom"), batcher.submit("x")]
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result(5)
+
+    # A returned exception fails only its own caller
+    batcher.handler = lambda items: [KeyError(item) if item == "bad" else item for item in items]
+    futures = [batcher.submit("bad"), batcher.submit("ok")]
+    with pytest.raises(KeyError):
+        futures[0].result(5)
+    assert futures[1].result(5) == "ok"
+
+    # Missing results fail the callers instead of leaving them waiting
+    batcher.handler = lambda items: []
+    futures = [batcher.submit("a"), batcher.submit("b")]
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(5)
+
+    assert batches == [[1, 2, 3], [4], ["boom", "x"]]
+
+
+def test_get_embedding_times_out_on_a_stuck_batch():
+    import threading
+    from src.resume_matcher.services import embedding_service
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.embedding_service import EmbeddingError
+    from src.resume_matcher.services.micro_batcher import MicroBatcher
+
+    release = threading.Event()
+
+    def stuck(items):
+        release.wait(5)
+        return [[0.0] for _ in items]
+
+    clear_cache()
+    batcher = MicroBatcher(stuck, max_wait_seconds=0)
+    try:
+        with patch.object(embedding_service, "_batcher", batcher), \
+                patch.object(embedding_service, "_microbatch_timeout", return_value=0.05):
+            with pytest.raises(EmbeddingError):
+                embedding_service.get_embedding("never answered")
+    finally:
+        release.set()
+
+
+def test_concurrent_get_embedding_calls_share_one_request():
+    from concurrent.futures import ThreadPoolExecutor
+    from src.resume_matcher.services import embedding_service
+    from src.resume_matcher.services.embedding_cache import clear_cache
+    from src.resume_matcher.services.micro_batcher import MicroBatcher
+
+    clear_cache()
+    batcher = MicroBatcher(
+        embedding_service._embed_microbatch, max_batch_size=4, max_wait_seconds=5
+    )
+    with patch.object(embedding_service, "_batcher", batcher), \
+            patch("src.resume_matcher.services.embedding_service.client") as mock_client:
+        mock_client.embeddings.create.side_effect = lambda model, input: _embedding_response(
+            *[[float(len(text))] for text in input]
+        )
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            embeddings = list(executor.map(
+                embedding_service.get_embedding, ["a", "bb", "ccc", "dddd"]
+            ))
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0]]
+    mock_client.embeddings.create.assert_called_once()
+    assert sorted(mock_client.embeddings.create.call_args.kwargs["input"]) == [
+        "a", "bb", "ccc", "dddd"
+    ]
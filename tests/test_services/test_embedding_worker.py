@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.resume_matcher.core.config import settings
+from src.resume_matcher.models import Job, Resume
+from src.resume_matcher.models.status import EMBEDDING_PENDING, EMBEDDING_READY, EMBEDDING_FAILED
+from src.resume_matcher.services.embedding_service import EmbeddingError
+from src.resume_matcher.services.embedding_worker import process_pending_embeddings
+
+
+def _add_pending(db):
+    resume = Resume(name="Jane", filename="jane.pdf", raw_text="Python developer")
+    job = Job(title="Engineer", description="Build Python services")
+    db.add_all([resume, job])
+    db.commit()
+    assert resume.embedding_status == EMBEDDING_PENDING
+    return resume, job
+
+
+def test_process_pending_embeddings_coalesces_into_one_batch(db):
+    resume, job = _add_pending(db)
+
+    with patch("src.resume_matcher.services.embedding_worker.get_embeddings_batch") as mock_batch:
+        mock_batch.return_value = [[0.1] * 1536, [0.2] * 1536]
+        processed = process_pending_embeddings(db)
+
+    assert processed == 2
+    mock_batch.assert_called_once()
+    assert mock_batch.call_args.args[0] == ["Python developer", "Engineer\n\nBuild Python services"]
+    assert resume.embedding_status == EMBEDDING_READY
+    assert job.embedding_status == EMBEDDING_READY
+    assert resume.embedding is not None
+
+    # Queue is now empty
+    assert process_pending_embeddings(db) == 0
+
+
+def test_process_pending_embeddings_isolates_failures(db):
+    resume, job = _add_pending(db)
+
+    with patch(
+        "src.resume_matcher.services.embedding_worker.get_embeddings_batch",
+        side_effect=EmbeddingError("batch failed"),
+    ), patch(
+        "src.resume_matcher.services.embedding_worker.get_embedding",
+        side_effect=[[0.1] * 1536, EmbeddingError("bad text")],
+    ):
+        process_pending_embeddings(db)
+
+    assert resume.embedding_status == EMBEDDING_READY
+    assert job.embedding_status == EMBEDDING_FAILED
+
+
+def test_process_pending_embeddings_drops_rows_changed_while_embedding(db):
+    from src.resume_matcher.schemas.job import JobUpdate
+    from src.resume_matcher.services.job_service import update_job
+
+    resume, job = _add_pending(db)
+
+    def edit_job_mid_batch(texts, db=None):
+        update_job(db, job.id, JobUpdate(description="Build Go services"))
+        return [[0.1] * 1536, [0.2] * 1536]
+
+    with patch.object(settings, "embedding_async", True), patch(
+        "src.resume_matcher.services.embedding_worker.get_embeddings_batch",
+        side_effect=edit_job_mid_batch,
+    ):
+        assert process_pending_embeddings(db) == 2
+
+    assert resume.embedding_status == EMBEDDING_READY
+    assert resume.embedding_claimed_at is None
+    # The vector of the old description is not written; the job is queued again
+    assert job.embedding_status == EMBEDDING_PENDING
+    assert job.embedding is None
+
+    with patch(
+        "src.resume_matcher.services.embedding_worker.get_embeddings_batch",
+        return_value=[[0.3] * 1536],
+    ) as mock_batch:
+        assert process_pending_embeddings(db) == 1
+
+    assert mock_batch.call_args.args[0] == ["Engineer\n\nBuild Go services"]
+    assert job.embedding_status == EMBEDDING_READY
+
+
+def test_process_pending_embeddings_reclaims_expired_leases(db):
+    resume, job = _add_pending(db)
+    resume.embedding_claimed_at = datetime.now(timezone.utc)
+    job.embedding_claimed_at = datetime.now(timezone.utc) - timedelta(
+        seconds=settings.embedding_worker_lease_seconds + 1
+    )
+    db.commit()
+
+    with patch(
+        "src.resume_matcher.services.embedding_worker.get_embeddings_batch",
+        return_value=[[0.2] * 1536],
+    ):
+        assert process_pending_embeddings(db) == 1
+
+    # Another worker still holds the resume's lease
+    assert resume.embedding_status == EMBEDDING_PENDING
+    assert job.embedding_status == EMBEDDING_READY
+    assert job.embedding_claimed_at is None
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+
+
+def test_vector_index_ddl_records_form_of_live_column():
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.services.index_service import vector_index_ddl
+
+    with patch.object(settings, "vector_quantization", "halfvec"), \
+            patch.object(settings, "vector_search_dimensions", 512), \
+            patch.object(settings, "vector_index_type", "hnsw"):
+        create, comment = vector_index_ddl(
+            "ix_jobs_embedding_next", "jobs", "embedding_next", 1536
+        )
+
+    assert create.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_embedding_next")
+    assert "(subvector(embedding_next, 1, 512))::halfvec(512)" in create
+    assert "USING hnsw" in create
+    # Recorded for the column the index ends up on after a flip
+    assert comment == (
+        "COMMENT ON INDEX ix_jobs_embedding_next IS "
+        "'search form: ((subvector(embedding, 1, 512))::halfvec(512)) halfvec_cosine_ops'"
+    )
+
+
+def test_stale_vector_indexes_requires_postgres(db):
+    from src.resume_matcher.services.index_service import (
+        IndexMaintenanceError,
+        stale_vector_indexes,
+    )
+
+    with pytest.raises(IndexMaintenanceError):
+        stale_vector_indexes(db)
@@ -0,0 +1,135 @@
+from unittest.mock import MagicMock, patch
+
+
+def _postgres_session():
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    return db
+
+
+def _executed_sql(db):
+    return [str(call.args[0]) for call in db.execute.call_args_list]
+
+
+def test_apply_search_params_raises_ef_search_to_limit():
+    from src.resume_matcher.services.match_service import apply_search_params
+
+    db = _postgres_session()
+    with patch("src.resume_matcher.services.match_service.settings") as mock_settings:
+        mock_settings.vector_index_type = "hnsw"
+        mock_settings.hnsw_ef_search = 40
+        apply_search_params(db, 100)
+
+    assert _executed_sql(db) == ["SET LOCAL hnsw.ef_search = 100"]
+
+
+def test_apply_search_params_overrides():
+    from src.resume_matcher.services.match_service import apply_search_params
+
+    db = _postgres_session()
+    with patch("src.resume_matcher.services.match_service.settings") as mock_settings:
+        mock_settings.vector_index_type = "ivfflat"
+        mock_settings.ivfflat_probes = 1
+        apply_search_params(db, 10, ef_search=200, probes=20)
+
+    assert _executed_sql(db) == [
+        "SET LOCAL hnsw.ef_search = 200",
+        "SET LOCAL ivfflat.probes = 20",
+    ]
+
+
+def test_apply_search_params_noop_without_postgres(db):
+    from src.resume_matcher.services.match_service import apply_search_params
+
+    # SQLite test database has no pgvector settings to apply
+    apply_search_params(db, 10, ef_search=100)
+
+
+def test_apply_search_params_enables_iterative_scan_for_filters():
+    from src.resume_matcher.services.match_service import apply_search_params
+
+    db = _postgres_session()
+    with patch("src.resume_matcher.services.match_service.settings") as mock_settings:
+        mock_settings.vector_index_type = "hnsw"
+        mock_settings.hnsw_ef_search = 40
+        mock_settings.vector_iterative_scan = "relaxed_order"
+        apply_search_params(db, 10, iterative=True)
+
+    assert _executed_sql(db) == [
+        "SET LOCAL hnsw.iterative_scan = relaxed_order",
+        "SET LOCAL hnsw.ef_search = 40",
+    ]
+
+
+def test_job_filter_sql_builds_predicates():
+    from datetime import datetime
+    from src.resume_matcher.schemas.match import JobFilters
+    from src.resume_matcher.services.match_service import _job_filter_sql
+
+    sql, params = _job_filter_sql(
+        JobFilters(location="Berlin", created_after=datetime(2026, 1, 1), exclude_ids=[3, 4]),
+        alias="p",
+    )
+
+    assert sql == (
+        " AND p.location = :location"
+        " AND p.created_at >= :created_after"
+        " AND p.id NOT IN :exclude_ids"
+    )
+    assert params == {
+        "location": "Berlin",
+        "created_after": datetime(2026, 1, 1),
+        "exclude_ids": [3, 4],
+    }
+    assert _job_filter_sql(None) == ("", {})
+
+
+def test_fetch_ranked_widens_short_filtered_scans():
+    from src.resume_matcher.services.match_service import _fetch_ranked
+
+    def rows(count):
+        result = MagicMock()
+        result.all.return_value = [MagicMock(similarity=0.9 - i * 0.01) for i in range(count)]
+        return result
+
+    db = _postgres_session()
+    # Without iterative scans the filter leaves 2 of 5 rows, then 6 of 20
+    db.execute.side_effect = lambda statement, params=None: (
+        rows(2) if params["limit"] == 5 else rows(6)
+    ) if params else None
+
+    with patch("src.resume_matcher.services.match_service.settings") as mock_settings:
+        mock_settings.vector_index_type = "hnsw"
+        mock_settings.hnsw_ef_search = 40
+        mock_settings.vector_iterative_scan = "off"
+        mock_settings.hybrid_candidates = 100
+        mock_settings.match_max_fetch = 1000
+        result = _fetch_ranked(db, "query", {}, top_k=5, filtered=True)
+
+    assert len(result) == 6
+    limits = [call.args[1]["limit"] for call in db.execute.call_args_list if len(call.args) > 1]
+    assert limits == [5, 20]
+
+
+def test_compact_search_rescores_shortlist():
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.core.database import vector_index_expression
+    from src.resume_matcher.services.match_service import _nearest_sql
+
+    with patch.object(settings, "vector_quantization", "binary"), \
+            patch.object(settings, "vector_search_dimensions", 512):
+        sql = " ".join(_nearest_sql("jobs", "id, title").split())
+        index = vector_index_expression("embedding")
+
+    compact = "binary_quantize(subvector({}, 1, 512))::bit(512)"
+    assert index == f"({compact.format('embedding')}) bit_hamming_ops"
+    # First pass on the indexed bit vectors, exact cosine only on the shortlist
+    assert (
+        f"ORDER BY {compact.format('embedding')} <~> "
+        f"{compact.format('CAST(:embedding AS vector)')} "
+        "LIMIT :limit * :rescore_factor) shortlist "
+        "ORDER BY embedding <=> :embedding LIMIT :limit"
+    ) in sql
+
+    # Full-precision search is a single exact query
+    assert "shortlist" not in _nearest_sql("jobs", "id, title")
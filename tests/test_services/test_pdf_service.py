@@ -23,4 +23,72 @@ def test_clean_text_strips_edges():
 def test_extract_text_invalid_file():
     fake_file = io.BytesIO(b"not a pdf")
     with pytest.raises(PDFExtractionError):
-        extract_text_from_pdf(fake_file)
\ No newline at end of file
+        extract_text_from_pdf(fake_file)
+
+def test_extract_text_rejects_too_many_pages(make_pdf):
+    from unittest.mock import patch
+    from src.resume_matcher.core.config import settings
+
+    with patch.object(settings, "pdf_max_pages", 2):
+        with pytest.raises(PDFExtractionError, match="pages"):
+            extract_text_from_pdf(io.BytesIO(make_pdf("one", "two", "three")))
+
+
+async def test_extract_text_from_pdf_async_uses_process_pool(make_pdf):
+    from src.resume_matcher.services.pdf_service import (
+        extract_text_from_pdf_async,
+        shutdown_pdf_executor,
+    )
+
+    try:
+        text = await extract_text_from_pdf_async(io.BytesIO(make_pdf("Jane Doe", "Python")))
+        assert "Jane Doe" in text
+        assert "Python" in text
+
+        with pytest.raises(PDFExtractionError):
+            await extract_text_from_pdf_async(io.BytesIO(b"not a pdf"))
+    finally:
+        shutdown_pdf_executor()
+
+
+def test_extract_text_rejects_oversized_file_and_cleans_up(make_pdf, tmp_path):
+    from unittest.mock import patch
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.services.pdf_service import PDFTooLargeError
+
+    pdf = make_pdf("Jane Doe")
+    with patch.object(settings, "pdf_spool_dir", str(tmp_path)):
+        with patch.object(settings, "pdf_max_file_bytes", len(pdf) - 1):
+            with pytest.raises(PDFTooLargeError):
+                extract_text_from_pdf(io.BytesIO(pdf))
+
+        assert "Jane Doe" in extract_text_from_pdf(io.BytesIO(pdf))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_discard_worker_leaves_other_workers_alone():
+    from unittest.mock import MagicMock, patch
+    from src.resume_matcher.services import pdf_service
+
+    stuck, other = MagicMock(), MagicMock()
+    with patch.object(pdf_service, "_workers", {stuck, other}), \
+            patch.object(pdf_service, "_idle_workers", []):
+        pdf_service._discard_worker(stuck, kill=True)
+        assert pdf_service._workers == {other}
+        stuck.shutdown.assert_called_once()
+        other.shutdown.assert_not_called()
+
+        # The killed worker's future failing later doesn't bring it back
+        pdf_service._checkin_worker(stuck)
+        pdf_service._checkin_worker(other)
+        assert pdf_service._idle_workers == [other]
+        other.shutdown.assert_not_called()
+
+
+def test_iter_page_text_raises_timeout_between_pages():
+    import time
+    from src.resume_matcher.services.pdf_service import PDFTimeoutError, iter_page_text
+
+    with pytest.raises(PDFTimeoutError):
+        list(iter_page_text([object()], deadline=time.monotonic() - 1))
@@ -0,0 +1,164 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import text
+
+from src.resume_matcher.core.config import settings
+from src.resume_matcher.models import Job, Resume
+from src.resume_matcher.models.status import (
+    MIGRATION_BACKFILLED,
+    MIGRATION_COMPLETED,
+    MIGRATION_FAILED,
+)
+from src.resume_matcher.services.embedding_service import EmbeddingError
+from src.resume_matcher.services.reembed_service import (
+    start_migration,
+    run_migration,
+    flip_migration,
+    ReembedError,
+)
+
+EMBED_BATCH = "src.resume_matcher.services.embedding_service.get_embeddings_batch"
+
+
+@pytest.fixture(autouse=True)
+def drop_shadow_chunk_tables(db):
+    yield
+    db.rollback()
+    for table in ("resume_chunks", "job_chunks"):
+        for suffix in ("next", "prev"):
+            db.execute(text(f"DROP TABLE IF EXISTS {table}_{suffix}"))
+    db.commit()
+
+
+def _fake_batch(texts, db=None, model=None, dimensions=None):
+    return [[0.5] * dimensions for _ in texts]
+
+
+def _add_embedded(db):
+    resumes = [
+        Resume(name=f"R{i}", filename=f"r{i}.pdf", raw_text=f"Resume {i}", embedding=[0.1] * 1536)
+        for i in range(3)
+    ]
+    job = Job(title="Engineer", description="Build things", embedding=[0.1] * 1536)
+    db.add_all(resumes + [job])
+    db.commit()
+    return resumes, job
+
+
+def test_run_migration_backfills_in_batches_and_resumes(db):
+    _add_embedded(db)
+    migration = start_migration(db, "text-embedding-3-large", 8)
+    assert migration.total_rows == 4
+
+    with patch(EMBED_BATCH, side_effect=[[[0.5] * 8, [0.5] * 8], EmbeddingError("rate limited")]):
+        run_migration(db, migration.id, batch_size=2)
+
+    assert migration.status == MIGRATION_FAILED
+    assert migration.processed_rows == 2
+
+    # Resumes from the cursor instead of starting over
+    with patch(EMBED_BATCH, side_effect=_fake_batch) as mock_batch:
+        run_migration(db, migration.id, batch_size=2)
+
+    assert migration.status == MIGRATION_BACKFILLED
+    assert migration.processed_rows == 4
+    assert [len(call.args[0]) for call in mock_batch.call_args_list] == [1, 1]
+    assert mock_batch.call_args.kwargs["model"] == "text-embedding-3-large"
+
+    missing = db.execute(text("SELECT COUNT(*) FROM resumes WHERE embedding_next IS NULL")).scalar()
+    assert missing == 0
+
+
+def test_start_migration_refuses_while_one_is_running(db):
+    start_migration(db, "text-embedding-3-large", 8)
+    with pytest.raises(ReembedError):
+        start_migration(db, "text-embedding-3-large", 8)
+
+
+def test_flip_catches_up_before_locking(db):
+    resumes, _ = _add_embedded(db)
+    migration = start_migration(db, "text-embedding-3-large", 8)
+
+    with patch(EMBED_BATCH, side_effect=_fake_batch) as mock_batch, \
+            patch.object(settings, "embedding_model", "text-embedding-3-small"), \
+            patch.object(settings, "embedding_dimensions", 1536):
+        run_migration(db, migration.id)
+        db.execute(text(f"UPDATE resumes SET embedding_next = NULL WHERE id = {resumes[0].id}"))
+        db.commit()
+        mock_batch.reset_mock()
+
+        # Rows changed after the catch-up are left for another unlocked pass
+        with patch(
+            "src.resume_matcher.services.reembed_service._has_stale_rows",
+            side_effect=[True, False],
+        ):
+            flip_migration(db, migration.id)
+
+    assert migration.status == MIGRATION_COMPLETED
+    assert [len(call.args[0]) for call in mock_batch.call_args_list] == [1]
+    db.expire_all()
+    assert db.get(Resume, resumes[0].id).embedding is not None
+
+
+def test_flip_gives_up_when_rows_keep_changing(db):
+    _add_embedded(db)
+    migration = start_migration(db, "text-embedding-3-large", 8)
+
+    with patch(EMBED_BATCH, side_effect=_fake_batch):
+        run_migration(db, migration.id)
+        with patch(
+            "src.resume_matcher.services.reembed_service._has_stale_rows",
+            return_value=True,
+        ), pytest.raises(ReembedError):
+            flip_migration(db, migration.id)
+
+    db.expire_all()
+    assert migration.status == MIGRATION_BACKFILLED
+    assert db.execute(text("SELECT COUNT(*) FROM resumes WHERE embedding_next IS NOT NULL")).scalar() == 3
+
+
+def test_flip_migration_swaps_columns(db):
+    resumes, _ = _add_embedded(db)
+    migration = start_migration(db, "text-embedding-3-large", 8)
+
+    with patch(EMBED_BATCH, side_effect=_fake_batch), \
+            patch.object(settings, "embedding_model", "text-embedding-3-small"), \
+            patch.object(settings, "embedding_dimensions", 1536), \
+            patch.object(settings, "embedding_request_dimensions", None):
+        run_migration(db, migration.id)
+        flip_migration(db, migration.id)
+
+        # The flipped model replaces the configured one
+        assert (settings.embedding_model, settings.embedding_dimensions) == ("text-embedding-3-large", 8)
+        assert settings.embedding_request_dimensions == 8
+
+    assert migration.status == MIGRATION_COMPLETED
+    db.expire_all()
+    assert len(db.get(Resume, resumes[0].id).embedding) == 8
+    assert db.execute(text("SELECT COUNT(*) FROM resumes WHERE embedding_prev IS NOT NULL")).scalar() == 3
+
+
+def test_flip_swaps_in_shadow_chunks(db):
+    resume = Resume(
+        name="Long", filename="long.pdf", raw_text=" ".join(["word"] * 40), embedding=[0.1] * 1536,
+    )
+    db.add(resume)
+    db.commit()
+    migration = start_migration(db, "text-embedding-3-large", 8)
+
+    with patch(EMBED_BATCH, side_effect=_fake_batch), \
+            patch.object(settings, "embedding_chunking", True), \
+            patch.object(settings, "embedding_chunk_tokens", 16), \
+            patch.object(settings, "embedding_chunk_overlap", 0), \
+            patch.object(settings, "embedding_model", "text-embedding-3-small"), \
+            patch.object(settings, "embedding_dimensions", 1536), \
+            patch.object(settings, "embedding_request_dimensions", None):
+        run_migration(db, migration.id)
+        shadowed = db.execute(text("SELECT COUNT(*) FROM resume_chunks_next")).scalar()
+        flip_migration(db, migration.id)
+
+    assert shadowed > 1
+    db.expire_all()
+    chunks = db.get(Resume, resume.id).chunks
+    assert len(chunks) == shadowed
+    assert all(len(chunk.embedding) == 8 for chunk in chunks)
@@ -0,0 +1,45 @@
+import pytest
+
+from src.resume_matcher.services.tokenizer import (
+    count_tokens,
+    split_into_chunks,
+    truncate_to_tokens,
+)
+
+
+def test_truncate_to_tokens_keeps_short_text():
+    assert truncate_to_tokens("Python developer", 100) == "Python developer"
+
+
+def test_truncate_to_tokens_cuts_long_text():
+    text = " ".join(f"skill{i}" for i in range(1000))
+
+    truncated = truncate_to_tokens(text, 50)
+
+    assert text.startswith(truncated)
+    assert count_tokens(truncated) <= 50
+
+
+def test_split_into_chunks_overlaps_and_covers_text():
+    text = " ".join(f"skill{i}" for i in range(1000))
+
+    chunks = split_into_chunks(text, chunk_tokens=100, overlap_tokens=20)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 100 for chunk in chunks)
+    assert chunks[0].split()[0] == "skill0"
+    assert chunks[-1].split()[-1] == "skill999"
+    # Consecutive chunks share words at the boundary
+    assert set(chunks[0].split()) & set(chunks[1].split())
+
+
+def test_split_into_chunks_respects_max_chunks():
+    text = " ".join(f"skill{i}" for i in range(1000))
+
+    assert len(split_into_chunks(text, 100, 20, max_chunks=3)) == 3
+    assert split_into_chunks("short", 100, 20) == ["short"]
+
+
+def test_split_into_chunks_rejects_overlap_larger_than_chunk():
+    with pytest.raises(ValueError):
+        split_into_chunks("text", 10, 10)
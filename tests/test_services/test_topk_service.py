@@ -0,0 +1,174 @@
+from unittest.mock import patch
+
+
+def _vector(*values):
+    return list(values) + [0.0] * (1536 - len(values))
+
+
+def _lists(db, direction):
+    from src.resume_matcher.models import MatchTopK
+
+    rows = (
+        db.query(MatchTopK)
+        .filter(MatchTopK.direction == direction)
+        .order_by(MatchTopK.source_id, MatchTopK.score.desc())
+        .all()
+    )
+    lists = {}
+    for row in rows:
+        lists.setdefault(row.source_id, []).append(row.target_id)
+    return lists
+
+
+def test_rebuild_topk_keeps_best_k_per_source(db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+    from src.resume_matcher.services.topk_service import rebuild_topk
+
+    python_job = Job(title="Python", description="python", embedding=_vector(1.0, 0.0, 0.0))
+    data_job = Job(title="Data", description="data", embedding=_vector(0.7, 0.7, 0.0))
+    chef_job = Job(title="Chef", description="cooking", embedding=_vector(0.0, 0.0, 1.0))
+    resume = Resume(name="Dev", filename="dev.pdf", raw_text="python", embedding=_vector(1.0, 0.1, 0.0))
+    db.add_all([python_job, data_job, chef_job, resume])
+    db.commit()
+
+    with patch.object(settings, "match_topk_size", 2):
+        written = rebuild_topk(db)
+
+    assert written == 2 + 3  # one resume's 2 jobs, three jobs' 1 resume
+    assert _lists(db, "jobs") == {resume.id: [python_job.id, data_job.id]}
+    assert _lists(db, "resumes") == {
+        python_job.id: [resume.id],
+        data_job.id: [resume.id],
+        chef_job.id: [resume.id],
+    }
+
+
+def test_refresh_topk_matches_rebuild_after_writes(db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+    from src.resume_matcher.services.topk_service import rebuild_topk, refresh_topk
+    from src.resume_matcher.services.vector_index import invalidate_index
+
+    python_job = Job(title="Python", description="python", embedding=_vector(1.0, 0.0, 0.0))
+    chef_job = Job(title="Chef", description="cooking", embedding=_vector(0.0, 0.0, 1.0))
+    dev = Resume(name="Dev", filename="dev.pdf", raw_text="python", embedding=_vector(1.0, 0.1, 0.0))
+    cook = Resume(name="Cook", filename="cook.pdf", raw_text="food", embedding=_vector(0.0, 0.1, 1.0))
+    db.add_all([python_job, chef_job, dev, cook])
+    db.commit()
+
+    with patch.object(settings, "match_topk_size", 1), \
+            patch.object(settings, "match_topk_enabled", True):
+        rebuild_topk(db)
+        assert _lists(db, "jobs") == {dev.id: [python_job.id], cook.id: [chef_job.id]}
+
+        # A better job for the developer enters their list and gets its own
+        data_job = Job(title="Data", description="data", embedding=_vector(1.0, 0.1, 0.0))
+        db.add(data_job)
+        db.commit()
+        invalidate_index("jobs")
+        refresh_topk(db, "jobs", [data_job.id])
+
+        assert _lists(db, "jobs") == {dev.id: [data_job.id], cook.id: [chef_job.id]}
+        assert _lists(db, "resumes")[data_job.id] == [dev.id]
+
+        # Deleting it promotes the next best job back into the list
+        db.delete(data_job)
+        db.commit()
+        invalidate_index("jobs")
+        refresh_topk(db, "jobs", [data_job.id], deleted=True)
+
+        incremental = (_lists(db, "jobs"), _lists(db, "resumes"))
+        rebuild_topk(db)
+        assert incremental == (_lists(db, "jobs"), _lists(db, "resumes"))
+        assert incremental[0] == {dev.id: [python_job.id], cook.id: [chef_job.id]}
+
+
+def test_writes_keep_topk_current_without_rebuilding_the_index(db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+    from src.resume_matcher.services import vector_index
+    from src.resume_matcher.services.job_service import jobs_written
+    from src.resume_matcher.services.resume_service import resumes_written
+    from src.resume_matcher.services.topk_service import rebuild_topk
+
+    jobs = [
+        Job(title=f"Job {n}", description="d", embedding=_vector(1.0, n / 10, 0.0))
+        for n in range(8)
+    ]
+    dev = Resume(name="Dev", filename="dev.pdf", raw_text="python", embedding=_vector(1.0, 0.0, 0.0))
+    db.add_all(jobs + [dev])
+    db.commit()
+
+    with patch.object(settings, "match_topk_size", 2), \
+            patch.object(settings, "match_topk_enabled", True):
+        rebuild_topk(db)
+
+        index_class = vector_index.VectorIndex
+        with patch.object(index_class, "from_rows", wraps=index_class.from_rows) as built:
+            close = Job(title="Close", description="d", embedding=_vector(1.0, 0.01, 0.0))
+            far = Resume(name="Far", filename="far.pdf", raw_text="x", embedding=_vector(0.0, 1.0, 0.0))
+            db.add_all([close, far])
+            db.commit()
+            jobs_written(db, [close.id])
+            resumes_written(db, [far.id])
+
+            jobs[0].embedding = _vector(0.0, 0.0, 1.0)
+            db.commit()
+            jobs_written(db, [jobs[0].id])
+
+            db.delete(jobs[1])
+            db.commit()
+            jobs_written(db, [jobs[1].id], deleted=True)
+
+        # Only the written rows were ever loaded into an index
+        assert built.called
+        assert all(len(rows) <= 1 for _, rows in (call.args for call in built.call_args_list))
+
+        incremental = (_lists(db, "jobs"), _lists(db, "resumes"))
+        rebuild_topk(db)
+        assert incremental == (_lists(db, "jobs"), _lists(db, "resumes"))
+        assert incremental[0][dev.id] == [close.id, jobs[2].id]
+
+
+def test_partial_lists_take_targets_below_other_lists_scores(db):
+    from src.resume_matcher.core.config import settings
+    from src.resume_matcher.models import Job, Resume
+    from src.resume_matcher.services.job_service import jobs_written
+    from src.resume_matcher.services.topk_service import rebuild_topk
+
+    jobs = [
+        Job(title="Python", description="d", embedding=_vector(1.0, 0.0, 0.0)),
+        Job(title="Django", description="d", embedding=_vector(0.95, 0.31, 0.0)),
+        Job(title="Chef", description="d", embedding=_vector(0.0, 0.0, 1.0)),
+    ]
+    dev = Resume(name="Dev", filename="dev.pdf", raw_text="x", embedding=_vector(1.0, 0.0, 0.0))
+    cook = Resume(name="Cook", filename="cook.pdf", raw_text="x", embedding=_vector(-0.6, 0.0, 0.8))
+    db.add_all(jobs + [dev, cook])
+    db.commit()
+
+    with patch.object(settings, "match_topk_size", 2), \
+            patch.object(settings, "match_topk_enabled", True):
+        rebuild_topk(db)
+        # The cook scores below 0 against two jobs, so their list isn't full
+        assert _lists(db, "jobs")[cook.id] == [jobs[2].id]
+
+        # Scores under every stored score, but the cook's list has room
+        baker = Job(title="Baker", description="d", embedding=_vector(0.0, 0.95, 0.3))
+        db.add(baker)
+        db.commit()
+        jobs_written(db, [baker.id])
+
+        assert _lists(db, "jobs")[cook.id] == [jobs[2].id, baker.id]
+        incremental = (_lists(db, "jobs"), _lists(db, "resumes"))
+        rebuild_topk(db)
+        assert incremental == (_lists(db, "jobs"), _lists(db, "resumes"))
+
+
+def test_refresh_topk_noop_when_disabled(db):
+    from src.resume_matcher.models import MatchTopK
+    from src.resume_matcher.services.topk_service import refresh_topk
+
+    refresh_topk(db, "jobs", [1])
+
+    assert db.query(MatchTopK).count() == 0
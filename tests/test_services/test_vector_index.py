@@ -0,0 +1,182 @@
+import numpy as np
+import pytest
+
+from src.resume_matcher.services.vector_index import (
+    VectorIndex,
+    get_embedded_count,
+    get_index,
+    invalidate_index,
+    normalize_vectors,
+    update_index,
+)
+
+
+def test_normalize_vectors_handles_zero_rows():
+    result = normalize_vectors(np.array([[3.0, 4.0], [0.0, 0.0]]))
+    assert result.dtype == np.float32
+    assert result[0] == pytest.approx([0.6, 0.8])
+    assert result[1] == pytest.approx([0.0, 0.0])
+
+
+def test_search_ranks_by_cosine_similarity():
+    index = VectorIndex(
+        ids=[10, 20, 30],
+        vectors=[[1.0, 0.0], [0.6, 0.8], [0.0, 5.0]],
+        payloads=[{"n": "a"}, {"n": "b"}, {"n": "c"}],
+    )
+
+    hits = index.search([0.0, 1.0], top_k=2)
+
+    assert [int(index.ids[pos]) for pos, _ in hits] == [30, 20]
+    assert hits[0][1] == pytest.approx(1.0)
+    assert hits[1][1] == pytest.approx(0.8)
+
+
+def test_search_applies_min_score():
+    index = VectorIndex(
+        ids=[1, 2],
+        vectors=[[1.0, 0.0], [0.0, 1.0]],
+        payloads=[{}, {}],
+    )
+
+    hits = index.search([1.0, 0.0], top_k=10, min_score=0.5)
+
+    assert len(hits) == 1
+    assert int(index.ids[hits[0][0]]) == 1
+
+
+def test_search_empty_index():
+    index = VectorIndex(ids=[], vectors=[], payloads=[])
+    assert index.search([1.0, 0.0], top_k=5) == []
+
+
+def test_get_index_caches_until_invalidated():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return VectorIndex(ids=[], vectors=[], payloads=[])
+
+    invalidate_index("test")
+    get_index("test", loader)
+    get_index("test", loader)
+    assert len(calls) == 1
+
+    invalidate_index("test")
+    get_index("test", loader)
+    assert len(calls) == 2
+
+
+def test_get_embedded_count_caches_until_invalidated():
+    counts = iter([3, 4])
+
+    invalidate_index("test")
+    assert get_embedded_count("test", lambda: next(counts)) == 3
+    assert get_embedded_count("test", lambda: next(counts)) == 3
+
+    invalidate_index("test")
+    assert get_embedded_count("test", lambda: next(counts)) == 4
+
+
+def test_index_and_count_built_across_a_write_are_not_cached():
+    calls = []
+
+    def loader():
+        # Another thread invalidates while this build reads the database
+        calls.append(1)
+        invalidate_index("test")
+        return VectorIndex(ids=[], vectors=[], payloads=[])
+
+    invalidate_index("test")
+    get_index("test", loader)
+    get_index("test", loader)
+    assert len(calls) == 2
+
+    counts = iter([3, 4, 5])
+
+    def counter():
+        count = next(counts)
+        if count == 3:
+            update_index("test", [1])
+        return count
+
+    assert get_embedded_count("test", counter) == 3
+    assert get_embedded_count("test", counter) == 4
+    assert get_embedded_count("test", counter) == 4
+    invalidate_index("test")
+
+
+def test_search_batch_matches_single_search():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 8))
+    queries = rng.normal(size=(7, 8))
+    index = VectorIndex(ids=list(range(50)), vectors=vectors, payloads=[{}] * 50)
+
+    # Small tiles force the running top-k merge across blocks
+    batch = index.search_batch(queries, top_k=5, min_score=-1.0, query_block=3, index_block=11)
+
+    assert len(batch) == 7
+    for query, hits in zip(queries, batch):
+        expected = index.search(query, top_k=5, min_score=-1.0)
+        assert [pos for pos, _ in hits] == [pos for pos, _ in expected]
+        assert [score for _, score in hits] == pytest.approx([score for _, score in expected], abs=1e-5)
+
+
+def test_search_batch_empty_index():
+    index = VectorIndex(ids=[], vectors=[], payloads=[])
+    assert index.search_batch([[1.0, 0.0], [0.0, 1.0]], top_k=3) == [[], []]
+
+
+def test_upsert_replaces_rows_in_place():
+    index = VectorIndex(
+        ids=[1, 2],
+        vectors=[[1.0, 0.0], [0.0, 1.0]],
+        payloads=[{"n": "a"}, {"n": "b"}],
+    )
+
+    index.upsert(VectorIndex(ids=[2, 3], vectors=[[1.0, 0.1], [0.6, 0.8]], payloads=[{"n": "b2"}, {"n": "c"}]))
+    index.remove([1])
+
+    assert len(index) == 2
+    hits = index.search([1.0, 0.0], top_k=5, min_score=-1.0)
+    assert [int(index.ids[pos]) for pos, _ in hits] == [2, 3]
+    assert index.payloads[hits[0][0]] == {"n": "b2"}
+    assert index.position(1) is None
+    assert index.search_batch([[1.0, 0.0]], top_k=5, min_score=-1.0) == [hits]
+
+
+def test_upsert_grows_past_capacity():
+    index = VectorIndex(ids=[], vectors=[], payloads=[])
+
+    for row_id in range(100):
+        index.upsert(VectorIndex(ids=[row_id], vectors=[[1.0, float(row_id)]], payloads=[{}]))
+
+    assert len(index) == 100
+    assert int(index.ids[index.search([0.0, 1.0], top_k=1)[0][0]]) == 99
+
+
+def test_update_index_applies_writes_to_the_cached_index():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return VectorIndex(
+            ids=[1, 2, 5, 6, 7],
+            vectors=[[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0], [-1.0, -1.0]],
+            payloads=[{}] * 5,
+        )
+
+    invalidate_index("test")
+    index = get_index("test", loader)
+    update_index("test", [3], VectorIndex(ids=[3], vectors=[[0.6, 0.8]], payloads=[{}]))
+    update_index("test", [1])
+
+    assert get_index("test", loader) is index
+    assert len(calls) == 1
+    assert sorted(int(index.ids[pos]) for pos, _ in index.search([1.0, 1.0], top_k=5)) == [2, 3]
+
+    # A different dimension can't be merged; the next search rebuilds
+    update_index("test", [4], VectorIndex(ids=[4], vectors=[[1.0, 0.0, 0.0]], payloads=[{}]))
+    get_index("test", loader)
+    assert len(calls) == 2
+    invalidate_index("test")